@@ -0,0 +1,336 @@
+"""Benchmarks for the Wheel of the Year calculations and sensor refresh.
+
+Every case runs against a fixed instant so results are comparable between
+runs. Each case reports the best per-call latency over several repeats and
+the peak memory allocated by a single call, as traced by ``tracemalloc``.
+
+Usage::
+
+    python benchmarks/bench.py              # run and diff against the baseline
+    python benchmarks/bench.py --save       # record a new baseline
+    python benchmarks/bench.py --check      # exit 1 when a case regresses
+    python benchmarks/bench.py -k moon      # only cases whose name contains "moon"
+
+The calculation modules are imported straight from the source tree without
+running the package ``__init__``, so Home Assistant is only needed for the
+sensor setup and refresh cases, which are skipped when it cannot be imported.
+The stored baseline includes them; record it with Home Assistant installed
+(``pip install homeassistant``) so entity-path regressions show up.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import importlib
+import json
+import platform
+import sys
+import time
+import tracemalloc
+import types
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Callable
+
+ROOT = Path(__file__).resolve().parent.parent
+PACKAGE = "wheel_of_the_year"
+PACKAGE_DIR = ROOT / "custom_components" / PACKAGE
+BASELINE = Path(__file__).resolve().parent / "baseline.json"
+
+NOW = datetime(2026, 6, 21, 12, 0, tzinfo=timezone.utc)
+REPEATS = 5
+MIN_BATCH_SECONDS = 0.05
+# Per-call timings on shared machines wobble by 10-20 %.
+DEFAULT_THRESHOLD = 0.25
+
+
+@dataclass
+class Case:
+    """One benchmarked callable."""
+
+    name: str
+    func: Callable[[], object]
+    # Runs before every call, outside the timed region.
+    setup: Callable[[], object] | None = None
+
+
+def load_package() -> types.ModuleType:
+    """Register the integration as a bare package, skipping ``__init__``."""
+    package = types.ModuleType(PACKAGE)
+    package.__path__ = [str(PACKAGE_DIR)]
+    sys.modules[PACKAGE] = package
+    return package
+
+
+def _module(name: str) -> types.ModuleType:
+    return importlib.import_module(f"{PACKAGE}.{name}")
+
+
+def clear_caches() -> None:
+    """Drop every per-year table so the next call starts cold."""
+    for name in ("events", "sky", "timeline"):
+        for obj in vars(_module(name)).values():
+            if callable(getattr(obj, "cache_clear", None)):
+                obj.cache_clear()
+
+
+def calculation_cases() -> list[Case]:
+    calc = _module("calculations")
+    chebyshev = _module("chebyshev")
+    const = _module("const")
+    ephemeris = _module("ephemeris")
+    events = _module("events")
+    timeline = _module("timeline")
+    year = NOW.year
+
+    return [
+        Case("julian_day", lambda: calc.julian_day(NOW)),
+        Case("get_moon_phase_info", lambda: calc.get_moon_phase_info(NOW)),
+        Case("get_planetary_positions", lambda: calc.get_planetary_positions(NOW)),
+        Case(
+            "get_planetary_positions (precise)",
+            lambda: calc.get_planetary_positions(NOW, const.PRECISION_PRECISE),
+        ),
+        Case(
+            "precise day coefficients (cold)",
+            lambda: ephemeris.precise_day_coefficients(
+                int(NOW.timestamp() // 86400), const.PRECISE_TARGET_ARCSEC
+            ),
+            setup=ephemeris.precise_day_coefficients.cache_clear,
+        ),
+        Case(
+            "chebyshev longitudes",
+            lambda: chebyshev.load_ephemeris().longitudes(NOW.timestamp()),
+        ),
+        Case("get_sun_sign", lambda: calc.get_sun_sign(NOW)),
+        Case("get_solar_cycle_phase", lambda: calc.get_solar_cycle_phase(NOW)),
+        Case(
+            "get_sabbat_date x8",
+            lambda: [calc.get_sabbat_date(s, year) for s in const.SABBATS],
+        ),
+        Case(
+            "get_next_sabbat_date x8",
+            lambda: [calc.get_next_sabbat_date(s, NOW) for s in const.SABBATS],
+        ),
+        Case(
+            "days_until_sabbat x8",
+            lambda: [calc.days_until_sabbat(s, NOW) for s in const.SABBATS],
+        ),
+        Case("next_transition", lambda: calc.next_transition(NOW)),
+        Case(
+            "timeline year sweep (cold)",
+            lambda: timeline.year_events(year),
+            setup=clear_caches,
+        ),
+        Case(
+            "void-of-course month (cold)",
+            lambda: events.void_of_course_index(year, NOW.month),
+            setup=events.void_of_course_index.cache_clear,
+        ),
+        Case(
+            "void_of_course_period",
+            lambda: events.void_of_course_period(NOW),
+        ),
+        Case(
+            "ephemeris year sweep (hourly)",
+            lambda: ephemeris.compute_range(
+                NOW, NOW + timedelta(days=365), timedelta(hours=1)
+            ),
+        ),
+    ]
+
+
+def sensor_cases() -> list[Case]:
+    """Time sensor setup and refresh, driven by a stubbed ``hass``."""
+    try:
+        const = _module("const")
+        coordinator = _module("coordinator")
+        instrumentation = _module("instrumentation")
+        sensor = _module("sensor")
+    except ImportError as err:
+        print(f"skipping sensor cases: {err}", file=sys.stderr)
+        return []
+
+    entry = SimpleNamespace(entry_id="bench", title="Bench")
+
+    def setup_platform(stub: SimpleNamespace) -> list:
+        hass = SimpleNamespace(data={const.DOMAIN: {"bench": stub}})
+        entities: list = []
+        asyncio.run(sensor.async_setup_entry(hass, entry, entities.extend))
+        return entities
+
+    # At startup the entities are created before any snapshot exists.
+    cold = SimpleNamespace(
+        entry=entry,
+        data=None,
+        stats=instrumentation.RefreshStats(),
+        steps=coordinator.ReportingSteps(),
+    )
+    stub = SimpleNamespace(
+        entry=entry,
+        data=coordinator.build_snapshot(NOW),
+        stats=instrumentation.RefreshStats(),
+        steps=coordinator.ReportingSteps(),
+    )
+    entities = setup_platform(stub)
+
+    def refresh() -> None:
+        snapshot = coordinator.build_snapshot(NOW)
+        stub.data = snapshot
+        for entity in entities:
+            entity._apply_snapshot(snapshot)
+            # Serialise the way the state machine would store the state.
+            json.dumps(
+                {
+                    "state": entity.native_value,
+                    "attributes": entity.extra_state_attributes,
+                },
+                default=str,
+            )
+
+    def replay(days: int) -> None:
+        """Apply every refresh a wheel would make over ``days`` days."""
+        start = NOW.replace(hour=0, minute=0, second=0)
+        for when in coordinator.replay_times(
+            start, start + timedelta(days=days), timedelta(minutes=30)
+        ):
+            snapshot = coordinator.build_snapshot(when)
+            for entity in entities:
+                entity._apply_snapshot(snapshot)
+
+    return [
+        Case("sensor platform setup", lambda: setup_platform(cold)),
+        Case(f"sensor refresh ({len(entities)} entities)", refresh),
+        Case("sensor replay (30 days)", lambda: replay(30)),
+    ]
+
+
+def _timed(case: Case, number: int) -> float:
+    total = 0.0
+    for _ in range(number):
+        if case.setup is not None:
+            case.setup()
+        start = time.perf_counter()
+        case.func()
+        total += time.perf_counter() - start
+    return total
+
+
+def measure(case: Case) -> dict[str, float]:
+    """Return the best per-call time in microseconds and peak bytes."""
+    # Warm up caches and imports, then size the batch so timer overhead
+    # stays negligible.
+    number = 1
+    while (elapsed := _timed(case, number)) < MIN_BATCH_SECONDS and number < 1 << 20:
+        number *= 2 if elapsed <= 0 else max(2, int(MIN_BATCH_SECONDS / elapsed) + 1)
+    best = min(_timed(case, number) / number for _ in range(REPEATS))
+
+    if case.setup is not None:
+        case.setup()
+    tracemalloc.start()
+    case.func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {"per_call_us": round(best * 1e6, 3), "peak_bytes": peak}
+
+
+def _delta(value: float, reference: float | None) -> str:
+    if not reference:
+        return "new"
+    return f"{(value - reference) / reference:+.1%}"
+
+
+def report(
+    results: dict[str, dict[str, float]],
+    baseline: dict[str, dict[str, float]],
+    threshold: float,
+) -> list[str]:
+    """Print a table against the baseline and return regressed case names."""
+    width = max(len(name) for name in results)
+    print(
+        f"{'case':<{width}}  {'per call':>12}  {'vs base':>8}"
+        f"  {'peak alloc':>11}  {'vs base':>8}"
+    )
+    regressed = []
+    for name, result in results.items():
+        base = baseline.get(name, {})
+        per_call = result["per_call_us"]
+        peak = result["peak_bytes"]
+        print(
+            f"{name:<{width}}  {per_call:>10.2f}us  "
+            f"{_delta(per_call, base.get('per_call_us')):>8}"
+            f"  {peak / 1024:>8.1f}KiB  {_delta(peak, base.get('peak_bytes')):>8}"
+        )
+        if base and (
+            per_call > base["per_call_us"] * (1 + threshold)
+            or peak > base["peak_bytes"] * (1 + threshold)
+        ):
+            regressed.append(name)
+    return regressed
+
+
+def _environment() -> dict[str, str]:
+    try:
+        import numpy
+    except ImportError:
+        numpy_version = "not installed"
+    else:
+        numpy_version = numpy.__version__
+    return {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "system": platform.system(),
+        "numpy": numpy_version,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--save", action="store_true", help="write the baseline")
+    parser.add_argument(
+        "--check", action="store_true", help="exit 1 if any case regressed"
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="relative slowdown counted as a regression (default: %(default)s)",
+    )
+    parser.add_argument("-k", dest="keyword", help="only run matching cases")
+    args = parser.parse_args(argv)
+
+    load_package()
+    cases = calculation_cases() + sensor_cases()
+    if args.keyword:
+        cases = [c for c in cases if args.keyword.lower() in c.name.lower()]
+
+    results = {case.name: measure(case) for case in cases}
+
+    stored = json.loads(BASELINE.read_text()) if BASELINE.exists() else {}
+    baseline = stored.get("results", {})
+    if stored.get("environment") not in (None, _environment()):
+        print("note: baseline was recorded on a different environment\n")
+    regressed = report(results, baseline, args.threshold)
+
+    if args.save:
+        merged = {**baseline, **results}
+        BASELINE.write_text(
+            json.dumps(
+                {"environment": _environment(), "results": merged}, indent=2
+            )
+            + "\n"
+        )
+        print(f"\nbaseline written to {BASELINE.relative_to(ROOT)}")
+    elif regressed:
+        print(f"\nregressed beyond {args.threshold:.0%}: {', '.join(regressed)}")
+        if args.check:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
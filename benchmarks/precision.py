@@ -0,0 +1,191 @@
+"""Cost and accuracy of the precise tier at different truncation targets.
+
+For each target the VSOP87 and lunar series are truncated, then evaluated
+over a grid of instants between 1950 and 2050. The table shows how many
+terms survive, the per-call cost of one longitude of every body, and the
+worst difference from the untruncated series. The fast tier is measured
+against the same reference.
+
+Both tiers share the same untruncated series for the Sun and Moon and the
+same Keplerian orbits for the planets, so that table says nothing about
+their true error. When pyerfa is installed (``pip install pyerfa``) a second
+table compares every tier with an independent apparent place built from the
+SOFA routines: ``epv00`` for the Earth and Sun, ``plan94`` for Mercury to
+Neptune and ``moon98`` for the Moon, with light-time, aberration, precession
+and IAU 2000A nutation. Those references are good to a few arc-seconds over
+the sampled century; Pluto has none and is left blank.
+
+Usage::
+
+    python benchmarks/precision.py
+    python benchmarks/precision.py --targets 0.5 1 5 --samples 2000
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib
+import math
+import sys
+import time
+
+from bench import PACKAGE, load_package
+
+DEFAULT_TARGETS = (0.1, 1.0, 10.0, 60.0, 600.0)
+# 1950-01-01 to 2050-01-01, in Julian centuries from J2000.0.
+T_START, T_END = -0.5, 0.5
+
+
+# SOFA planet numbers for ``plan94``.
+PLAN94 = {
+    "Mercury": 1,
+    "Venus": 2,
+    "Mars": 4,
+    "Jupiter": 5,
+    "Saturn": 6,
+    "Uranus": 7,
+    "Neptune": 8,
+}
+
+
+def _angle(a: float, b: float) -> float:
+    """Absolute difference of two longitudes in arc-seconds."""
+    return abs((a - b + 180) % 360 - 180) * 3600
+
+
+def _reference_longitude(erfa, T: float, name: str) -> float | None:
+    """Apparent geocentric longitude from the SOFA routines, or None.
+
+    The ecliptic and equinox are of date, as for the integration's
+    longitudes; TT stands in for TDB.
+    """
+    date = T * 36525
+    earth, earth_bary = erfa.epv00(2451545.0, date)
+    if name == "Moon":
+        # moon98 is geometric and already geocentric; the lunar series
+        # carries its light-time in the mean longitude.
+        position = erfa.moon98(2451545.0, date)["p"]
+    else:
+        if name == "Sun":
+            position = -earth["p"]
+        elif name in PLAN94:
+            light_time = 0.0
+            for _ in range(3):
+                planet = erfa.plan94(2451545.0, date - light_time, PLAN94[name])
+                position = planet["p"] - earth["p"]
+                light_time = math.dist(position, (0, 0, 0)) / erfa.DC
+        else:
+            return None
+        velocity = earth_bary["v"] / erfa.DC
+        position = erfa.ab(
+            position / math.dist(position, (0, 0, 0)),
+            velocity,
+            math.dist(earth["p"], (0, 0, 0)),
+            math.sqrt(1 - velocity @ velocity),
+        )
+    x, y, _ = erfa.ecm06(2451545.0, date) @ position
+    dpsi, _ = erfa.nut06a(2451545.0, date)
+    return math.degrees(math.atan2(y, x) + dpsi) % 360
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--targets",
+        type=float,
+        nargs="+",
+        default=DEFAULT_TARGETS,
+        help="truncation targets in arc-seconds (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--samples", type=int, default=500, help="instants per target"
+    )
+    args = parser.parse_args(argv)
+
+    load_package()
+    const = importlib.import_module(f"{PACKAGE}.const")
+    ephemeris = importlib.import_module(f"{PACKAGE}.ephemeris")
+
+    step = (T_END - T_START) / (args.samples - 1)
+    grid = [T_START + i * step for i in range(args.samples)]
+    full = ephemeris.precise_theory(0.0)
+    reference = [
+        {p.name: ephemeris.precise_longitude(T, p, full) for p in const.PLANETS}
+        for T in grid
+    ]
+
+    def evaluate(longitude) -> tuple[float, dict[str, float]]:
+        worst = dict.fromkeys(reference[0], 0.0)
+        started = time.perf_counter()
+        values = [
+            {p.name: longitude(T, p) for p in const.PLANETS} for T in grid
+        ]
+        elapsed = (time.perf_counter() - started) / len(grid)
+        for row, ref in zip(values, reference):
+            for name, value in row.items():
+                worst[name] = max(worst[name], _angle(value, ref[name]))
+        return elapsed, worst
+
+    names = list(reference[0])
+    print(
+        f"{'tier':<12}  {'terms':>5}  {'per call':>10}  "
+        + "  ".join(f"{name[:7]:>7}" for name in names)
+    )
+    print(f"{'':<12}  {'':>5}  {'':>10}  max error vs full series (arcsec)")
+
+    rows = [("full", full)] + [
+        (f'precise {target:g}"', ephemeris.precise_theory(target))
+        for target in args.targets
+    ]
+    for label, theory in rows:
+        elapsed, worst = evaluate(
+            lambda T, p, theory=theory: ephemeris.precise_longitude(T, p, theory)
+        )
+        print(
+            f"{label:<12}  {theory.term_count:>5}  {elapsed * 1e6:>8.1f}us  "
+            + "  ".join(f"{worst[name]:>7.2f}" for name in names)
+        )
+
+    elapsed, worst = evaluate(ephemeris.body_longitude)
+    print(
+        f"{'fast':<12}  {'-':>5}  {elapsed * 1e6:>8.1f}us  "
+        + "  ".join(f"{worst[name]:>7.0f}" for name in names)
+    )
+
+    try:
+        import erfa
+    except ImportError:
+        print("\nInstall pyerfa for the error against an independent reference.")
+        return 0
+
+    independent = [
+        {name: _reference_longitude(erfa, T, name) for name in names}
+        for T in grid
+    ]
+    print(f"\n{'':<12}  {'':>5}  {'':>10}  max error vs SOFA (arcsec)")
+    rows.append(("fast", None))
+    for label, theory in rows:
+        worst = dict.fromkeys(names, 0.0)
+        for T, ref in zip(grid, independent):
+            for p in const.PLANETS:
+                if ref[p.name] is None:
+                    continue
+                value = (
+                    ephemeris.body_longitude(T, p)
+                    if theory is None
+                    else ephemeris.precise_longitude(T, p, theory)
+                )
+                worst[p.name] = max(worst[p.name], _angle(value, ref[p.name]))
+        print(
+            f"{label:<12}  {'':>5}  {'':>10}  "
+            + "  ".join(
+                f"{worst[name]:>7.1f}" if independent[0][name] is not None
+                else f"{'-':>7}"
+                for name in names
+            )
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,22 +2,56 @@
 
 from __future__ import annotations
 
+from datetime import timedelta
 from pathlib import Path
 
 from homeassistant.components.frontend import add_extra_js_url
 from homeassistant.components.http import StaticPathConfig
 from homeassistant.components.lovelace.resources import ResourceStorageCollection
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_LATITUDE, CONF_LONGITUDE, CONF_TIME_ZONE
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers import device_registry as dr, entity_registry as er
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.start import async_at_started
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
 
-from .const import DOMAIN, PLATFORMS
+from .calculations import hemisphere_for_latitude
+from .const import (
+    CONF_CONTINUOUS_INTERVAL,
+    CONF_FRACTION_STEP,
+    CONF_HEMISPHERE,
+    CONF_ILLUMINATION_STEP,
+    CONF_LONGITUDE_STEP,
+    CONF_PRECISION,
+    DEFAULT_CONTINUOUS_INTERVAL,
+    DEFAULT_FRACTION_STEP,
+    DEFAULT_ILLUMINATION_STEP,
+    DEFAULT_LONGITUDE_STEP,
+    DEFAULT_PRECISION,
+    DOMAIN,
+    PLATFORMS,
+    SIGNAL_COORDINATOR_READY,
+)
+from .coordinator import ReportingSteps, WheelCoordinator
+from .services import async_register_services
+from .trigger import async_restart_scheduler, async_stop_scheduler
+from .websocket_api import async_register_websocket_commands
 
 CARD_URL = f"/{DOMAIN}/wheel-of-the-year-card.js"
-CARD_VERSION = "1.1.2"
+CARD_VERSION = "1.2.0"
+
+# Remembers which card version was last registered as a Lovelace resource.
+STORAGE_KEY = f"{DOMAIN}.card"
+STORAGE_VERSION = 1
 
 
 async def async_setup(hass: HomeAssistant, config: dict) -> bool:
-    """Register the Lovelace card static path and resource."""
+    """Register the Lovelace card, services and websocket API."""
+    async_register_websocket_commands(hass)
+    async_register_services(hass)
+
     await hass.http.async_register_static_paths([
         StaticPathConfig(
             f"/{DOMAIN}",
@@ -30,15 +64,13 @@ async def async_setup(hass: HomeAssistant, config: dict) -> bool:
     resources = hass.data["lovelace"].resources
 
     if isinstance(resources, ResourceStorageCollection):
-        await resources.async_get_info()
-        existing = [r for r in resources.async_items() if DOMAIN in r.get("url", "")]
-        if existing:
-            if not existing[0]["url"].endswith(CARD_VERSION):
-                await resources.async_update_item(
-                    existing[0]["id"], {"res_type": "module", "url": versioned_url}
-                )
-        else:
-            await resources.async_create_item({"res_type": "module", "url": versioned_url})
+        # Listing the resources loads the whole Lovelace resource store, so
+        # only do it when the card version changed since the last boot.
+        store: Store[dict[str, str]] = Store(hass, STORAGE_VERSION, STORAGE_KEY)
+        stored = await store.async_load()
+        if not stored or stored.get("card_version") != CARD_VERSION:
+            await _async_register_card_resource(resources, versioned_url)
+            await store.async_save({"card_version": CARD_VERSION})
     else:
         # YAML lovelace mode — fall back to global extra JS URL
         add_extra_js_url(hass, versioned_url)
@@ -46,13 +78,114 @@ async def async_setup(hass: HomeAssistant, config: dict) -> bool:
     return True
 
 
+async def _async_register_card_resource(
+    resources: ResourceStorageCollection, versioned_url: str
+) -> None:
+    """Add the card resource, or point an existing one at this version."""
+    await resources.async_get_info()
+    existing = [r for r in resources.async_items() if DOMAIN in r.get("url", "")]
+    if existing:
+        if not existing[0]["url"].endswith(CARD_VERSION):
+            await resources.async_update_item(
+                existing[0]["id"], {"res_type": "module", "url": versioned_url}
+            )
+    else:
+        await resources.async_create_item({"res_type": "module", "url": versioned_url})
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Wheel of the Year from a config entry."""
-    hass.data.setdefault(DOMAIN, {})
+    continuous_interval = timedelta(
+        minutes=entry.options.get(
+            CONF_CONTINUOUS_INTERVAL, DEFAULT_CONTINUOUS_INTERVAL
+        )
+    )
+    time_zone = dt_util.get_time_zone(entry.data[CONF_TIME_ZONE])
+    if time_zone is None:
+        time_zone = dt_util.get_time_zone(hass.config.time_zone)
+    steps = ReportingSteps(
+        longitude=entry.options.get(CONF_LONGITUDE_STEP, DEFAULT_LONGITUDE_STEP),
+        illumination=entry.options.get(
+            CONF_ILLUMINATION_STEP, DEFAULT_ILLUMINATION_STEP
+        ),
+        fraction=entry.options.get(CONF_FRACTION_STEP, DEFAULT_FRACTION_STEP),
+    )
+    coordinator = WheelCoordinator(
+        hass,
+        entry,
+        time_zone,
+        entry.data[CONF_HEMISPHERE],
+        continuous_interval,
+        entry.options.get(CONF_PRECISION, DEFAULT_PRECISION),
+        steps,
+    )
+
+    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = coordinator
+    # Card subscriptions survive a reload by moving to the new coordinator.
+    async_dispatcher_send(hass, SIGNAL_COORDINATOR_READY, entry.entry_id)
+    entry.async_on_unload(entry.add_update_listener(_async_update_listener))
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    async_restart_scheduler(hass, entry)
+
+    # Entities start from their restored state; the first full compute
+    # waits until Home Assistant has finished starting.
+    entry.async_on_unload(async_at_started(hass, coordinator.async_start))
     return True
 
 
+async def async_migrate_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+    """Migrate a single-instance entry to a per-location one.
+
+    Version 1 entries had no data and global unique ids. They take Home
+    Assistant's own location and time zone, and their entities and device
+    are re-keyed by entry id so more locations can be added alongside.
+    """
+    if entry.version > 2:
+        return False
+
+    if entry.version == 1:
+        prefix = "wheel_"
+
+        def migrate_unique_id(reg_entry: er.RegistryEntry) -> dict | None:
+            if not reg_entry.unique_id.startswith(prefix):
+                return None
+            key = reg_entry.unique_id.removeprefix(prefix)
+            return {"new_unique_id": f"{entry.entry_id}_{key}"}
+
+        await er.async_migrate_entries(hass, entry.entry_id, migrate_unique_id)
+
+        device_registry = dr.async_get(hass)
+        if device := device_registry.async_get_device(
+            identifiers={(DOMAIN, "wheel_of_the_year")}
+        ):
+            device_registry.async_update_device(
+                device.id, new_identifiers={(DOMAIN, entry.entry_id)}
+            )
+
+        hass.config_entries.async_update_entry(
+            entry,
+            data={
+                CONF_LATITUDE: hass.config.latitude,
+                CONF_LONGITUDE: hass.config.longitude,
+                CONF_HEMISPHERE: hemisphere_for_latitude(hass.config.latitude),
+                CONF_TIME_ZONE: hass.config.time_zone,
+            },
+            version=2,
+        )
+
+    return True
+
+
+async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Reload the entry when its options change."""
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
-    return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    if unload_ok:
+        coordinator = hass.data[DOMAIN].pop(entry.entry_id)
+        await coordinator.async_shutdown()
+        async_stop_scheduler(hass, entry)
+    return unload_ok
@@ -0,0 +1,202 @@
+"""Streaming almanac export for the Wheel of the Year.
+
+An almanac is one row per sample between two instants: the moon phase and
+illumination, the Sun sign, the season, the next sabbat countdown, the
+solar-cycle phase and every body's longitude and sign. Samples are computed
+in chunks through the batch ephemeris and yielded as tuples, so an export of
+any length runs in bounded memory.
+
+Values that only change at local midnight (Sun sign, season, sabbat
+countdown and solar-cycle phase) are computed once per local date.
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import json
+import re
+import sys
+from datetime import date, datetime, timedelta, timezone
+from typing import IO, Iterable, Iterator
+from zoneinfo import ZoneInfo
+
+from .calculations import (
+    days_until_sabbat,
+    get_current_season,
+    get_solar_cycle_phase,
+    get_sun_sign,
+)
+from .const import (
+    HEMISPHERE_NORTH,
+    HEMISPHERE_SOUTH,
+    MOON_PHASES,
+    PLANETS,
+    SABBATS,
+    ZODIAC,
+)
+from .ephemeris import compute_range
+
+FORMAT_CSV = "csv"
+FORMAT_JSONL = "jsonl"
+
+# Samples per batch; large enough to amortise the vectorized pass, small
+# enough that a chunk's columns stay in the low megabytes.
+CHUNK_SIZE = 4096
+
+FIELDS: tuple[str, ...] = (
+    "time",
+    "moon_phase",
+    "illumination",
+    "sun_sign",
+    "season",
+    "next_sabbat",
+    "next_sabbat_days",
+    "solar_cycle",
+) + tuple(
+    f"{planet.name.lower()}_{column}"
+    for planet in PLANETS
+    for column in ("longitude", "sign_name")
+)
+
+_PHASE_NAMES = tuple(phase.name for phase in MOON_PHASES)
+_SIGN_NAMES = tuple(sign.name for sign in ZODIAC)
+_PLANET_NAMES = tuple(planet.name for planet in PLANETS)
+
+
+def _daily_values(day: datetime, hemisphere: str) -> tuple:
+    """Sun sign, season, next sabbat, days until it and solar-cycle label."""
+    nearest, days = None, None
+    for sabbat in SABBATS:
+        until = days_until_sabbat(sabbat, day, hemisphere)
+        if days is None or until < days:
+            nearest, days = sabbat, until
+    return (
+        get_sun_sign(day).name,
+        get_current_season(day, hemisphere),
+        nearest.name,
+        days,
+        get_solar_cycle_phase(day)["label"],
+    )
+
+
+def iter_almanac(
+    start: datetime,
+    end: datetime,
+    step: timedelta,
+    hemisphere: str = HEMISPHERE_NORTH,
+    chunk_size: int = CHUNK_SIZE,
+) -> Iterator[tuple]:
+    """Yield one almanac row per ``step`` from ``start`` up to ``end``.
+
+    Rows are tuples in ``FIELDS`` order. Local dates follow ``start``'s
+    time zone (UTC if naive).
+    """
+    if step <= timedelta(0):
+        raise ValueError("step must be positive")
+    tz = start.tzinfo or timezone.utc
+    start = start if start.tzinfo else start.replace(tzinfo=tz)
+    end = end if end.tzinfo else end.replace(tzinfo=tz)
+
+    current_date: date | None = None
+    daily: tuple = ()
+    chunk = step * chunk_size
+    chunk_start = start
+    while chunk_start < end:
+        chunk_end = min(chunk_start + chunk, end)
+        batch = compute_range(chunk_start, chunk_end, step)
+        longitudes = [batch.longitude[name] for name in _PLANET_NAMES]
+        signs = [batch.sign_index[name] for name in _PLANET_NAMES]
+        for i, ts in enumerate(batch.timestamps):
+            local = datetime.fromtimestamp(float(ts), tz=tz)
+            if local.date() != current_date:
+                current_date = local.date()
+                daily = _daily_values(local, hemisphere)
+            phase = float(batch.moon_phase[i])
+            row = [
+                local.isoformat(),
+                _PHASE_NAMES[int(phase * 8 + 0.5) % 8],
+                round(float(batch.illumination[i]), 1),
+                *daily,
+            ]
+            for lon, sign in zip(longitudes, signs):
+                row.append(round(float(lon[i]), 4))
+                row.append(_SIGN_NAMES[int(sign[i])])
+            yield tuple(row)
+        chunk_start = chunk_end
+
+
+def write_csv(rows: Iterable[tuple], stream: IO[str]) -> int:
+    """Write rows as CSV with a header line; return the row count."""
+    writer = csv.writer(stream)
+    writer.writerow(FIELDS)
+    count = 0
+    for row in rows:
+        writer.writerow(row)
+        count += 1
+    return count
+
+
+def write_jsonl(rows: Iterable[tuple], stream: IO[str]) -> int:
+    """Write rows as JSON Lines; return the row count."""
+    count = 0
+    for row in rows:
+        stream.write(json.dumps(dict(zip(FIELDS, row)), ensure_ascii=False))
+        stream.write("\n")
+        count += 1
+    return count
+
+
+WRITERS = {FORMAT_CSV: write_csv, FORMAT_JSONL: write_jsonl}
+
+_STEP_UNITS = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+
+
+def parse_step(text: str) -> timedelta:
+    """Parse a step such as ``90s``, ``15m``, ``1h`` or ``1d``."""
+    match = re.fullmatch(r"\s*(\d+(?:\.\d+)?)\s*([smhd]?)\s*", text)
+    if match is None:
+        raise ValueError(f"invalid step: {text!r}")
+    value, unit = match.groups()
+    return timedelta(seconds=float(value) * _STEP_UNITS[unit or "s"])
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Write a Wheel of the Year almanac as CSV or JSON Lines."
+    )
+    parser.add_argument("start", help="first instant, ISO 8601 (e.g. 2026-01-01)")
+    parser.add_argument("end", help="end instant, exclusive, ISO 8601")
+    parser.add_argument(
+        "--step", type=parse_step, default="1d", help="sample step (default: 1d)"
+    )
+    parser.add_argument("--format", choices=WRITERS, default=FORMAT_CSV)
+    parser.add_argument(
+        "--time-zone", default="UTC", help="zone for local dates (default: UTC)"
+    )
+    parser.add_argument(
+        "--hemisphere",
+        choices=(HEMISPHERE_NORTH, HEMISPHERE_SOUTH),
+        default=HEMISPHERE_NORTH,
+    )
+    parser.add_argument(
+        "--output", "-o", help="file to write (default: standard output)"
+    )
+    args = parser.parse_args(argv)
+
+    tz = ZoneInfo(args.time_zone)
+    start = datetime.fromisoformat(args.start)
+    end = datetime.fromisoformat(args.end)
+    rows = iter_almanac(
+        start if start.tzinfo else start.replace(tzinfo=tz),
+        end if end.tzinfo else end.replace(tzinfo=tz),
+        args.step,
+        args.hemisphere,
+    )
+    write = WRITERS[args.format]
+    if args.output is None:
+        write(rows, sys.stdout)
+    else:
+        with open(args.output, "w", encoding="utf-8", newline="") as stream:
+            write(rows, stream)
+    return 0
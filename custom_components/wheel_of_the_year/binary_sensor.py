@@ -0,0 +1,119 @@
+"""Binary sensor platform for the Wheel of the Year integration."""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from homeassistant.components.binary_sensor import BinarySensorEntity
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_track_point_in_time
+from homeassistant.helpers.start import async_at_started
+
+from .clock import SimulatedClock
+from .const import DOMAIN
+from .coordinator import WheelCoordinator
+from .entity import WheelEntity
+from .events import VoidPeriod, void_of_course_period
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up Wheel of the Year binary sensors from a config entry."""
+    coordinator: WheelCoordinator = hass.data[DOMAIN][entry.entry_id]
+    async_add_entities([VoidOfCourseMoonSensor(coordinator)])
+
+
+class VoidOfCourseMoonSensor(WheelEntity, BinarySensorEntity):
+    """On while the Moon is void of course.
+
+    The sensor holds the current or next void period from the cached
+    monthly tables and arms one timer for its next flip, so nothing is
+    computed between flips. Coordinator refreshes only re-check the held
+    period, which is what lets a replay drive it; the coordinator's yearly
+    prewarm builds the months a replay reads before it reaches them.
+    """
+
+    _unique_key = "void_of_course_moon"
+    _attr_name = "Void of Course Moon"
+    _attr_icon = "mdi:moon-waning-crescent"
+
+    def __init__(self, coordinator: WheelCoordinator) -> None:
+        super().__init__(coordinator)
+        self._period: VoidPeriod | None = None
+        # The period holds for every instant from here up to its end.
+        self._valid_from: datetime | None = None
+        self._unsub_flip: CALLBACK_TYPE | None = None
+
+    async def async_added_to_hass(self) -> None:
+        """Look up the first period once Home Assistant has started."""
+        await super().async_added_to_hass()
+        self.async_on_remove(self._async_cancel_flip)
+        self.async_on_remove(async_at_started(self.hass, self._async_start))
+
+    @callback
+    def _async_start(self, hass: HomeAssistant) -> None:
+        self.hass.async_create_task(self._async_handle_flip(self._now()))
+
+    def _now(self) -> datetime:
+        return self.coordinator.clock.now(self.coordinator.time_zone)
+
+    def _holds(self, now: datetime) -> bool:
+        return self._period is not None and self._valid_from <= now < self._period.end
+
+    async def _async_update(self, now: datetime) -> None:
+        """Look up the period for ``now`` off the loop, then apply it."""
+        if not self._holds(now):
+            self._period = await self.hass.async_add_executor_job(
+                void_of_course_period, now
+            )
+            self._valid_from = now
+        self._async_apply(now)
+
+    @callback
+    def _async_apply(self, now: datetime) -> None:
+        start, end = self._period
+        self._attr_is_on = start <= now
+        self._attr_extra_state_attributes = {
+            "start": start.isoformat(),
+            "end": end.isoformat(),
+        }
+        self._async_cancel_flip()
+        if not isinstance(self.coordinator.clock, SimulatedClock):
+            self._unsub_flip = async_track_point_in_time(
+                self.hass, self._async_handle_flip, end if self._attr_is_on else start
+            )
+
+    async def _async_handle_flip(self, _now: datetime) -> None:
+        self._unsub_flip = None
+        await self._async_update(self._now())
+        self.async_write_ha_state()
+
+    @callback
+    def _async_cancel_flip(self) -> None:
+        if self._unsub_flip is not None:
+            self._unsub_flip()
+            self._unsub_flip = None
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        if self.coordinator.data is None:
+            return
+        now = self.coordinator.data.now
+        written = (self._attr_is_on, self._period)
+        if not self._holds(now):
+            if not isinstance(self.coordinator.clock, SimulatedClock):
+                # Back from a replay; look up the real period off the loop.
+                self._async_cancel_flip()
+                self.hass.async_create_task(self._async_handle_flip(now))
+                return
+            # The replay prewarmed this year's months; this is a bisect.
+            self._period = void_of_course_period(now)
+            self._valid_from = now
+        self._async_apply(now)
+        if (self._attr_is_on, self._period) != written:
+            self.async_write_ha_state()
@@ -3,18 +3,81 @@
 from __future__ import annotations
 
 import math
-from datetime import datetime, timezone
-
-from .const import MOON_PHASES, PLANETS, SOLAR_CYCLE, ZODIAC
-
-# Known new moon reference: Jan 6, 2000 18:14 UTC
-_KNOWN_NEW_MOON = datetime(2000, 1, 6, 18, 14, 0, tzinfo=timezone.utc)
-_SYNODIC_MONTH = 29.53058770576
+from datetime import date, datetime, time, timedelta, timezone, tzinfo
+from typing import NamedTuple
+
+from .chebyshev import load_ephemeris
+from .const import (
+    HEMISPHERE_NORTH,
+    HEMISPHERE_SOUTH,
+    MOON_PHASES,
+    PLANETS,
+    PRECISE_TARGET_ARCSEC,
+    PRECISION_FAST,
+    PRECISION_PRECISE,
+    SOLAR_CYCLE,
+    SOUTHERN_LONGITUDE_OFFSET,
+    ZODIAC,
+    MoonPhase,
+    Sabbat,
+    ZodiacSign,
+)
+from .ephemeris import (
+    J2000_JD,
+    KNOWN_NEW_MOON as _KNOWN_NEW_MOON,
+    SYNODIC_MONTH as _SYNODIC_MONTH,
+    body_longitude,
+    illumination,
+    lunation_fraction,
+    precise_longitudes,
+)
+from .events import (
+    FULL_MOON,
+    NEW_MOON,
+    STATION_DIRECT,
+    next_ingress,
+    next_phase_event,
+    next_station,
+    solar_longitude_time,
+)
+
+# Day of a leap year (0-365) at which each month starts.
+_MONTH_OFFSETS = tuple(date(2000, m, 1).timetuple().tm_yday - 1 for m in range(1, 13))
+
+
+def _sun_sign_table() -> tuple[ZodiacSign, ...]:
+    """Sun sign for every month and day of a leap year, in day order."""
+    table = []
+    for m in range(1, 13):
+        days = (date(2000 + m // 12, m % 12 + 1, 1) - date(2000, m, 1)).days
+        for d in range(1, days + 1):
+            table.append(
+                next(
+                    z
+                    for z in ZODIAC
+                    if (m == z.start_month and d >= z.start_day)
+                    or (m == z.end_month and d <= z.end_day)
+                )
+            )
+    return tuple(table)
+
+
+_SUN_SIGN_BY_DAY = _sun_sign_table()
+
+
+class MoonInfo(NamedTuple):
+    """The Moon's phase at one instant."""
+
+    moon_phase: MoonPhase
+    phase: float  # 0..1, 0 = new, 0.5 = full
+    illumination: float
+    index: int
+    age: float  # days since the last new moon
 
 
 def julian_day(dt: datetime) -> float:
     """Calculate Julian Day Number from a datetime."""
-    d = dt if dt.tzinfo else dt.replace(tzinfo=timezone.utc)
+    d = dt.astimezone(timezone.utc) if dt.tzinfo else dt.replace(tzinfo=timezone.utc)
     y = d.year
     m = d.month
     day = d.day
@@ -38,75 +101,148 @@ def julian_day(dt: datetime) -> float:
 def get_moon_phase(dt: datetime) -> float:
     """Return moon phase as 0..1 (0=new, 0.5=full)."""
     d = dt if dt.tzinfo else dt.replace(tzinfo=timezone.utc)
-    days_since = (d - _KNOWN_NEW_MOON).total_seconds() / 86400
-    lunations = days_since / _SYNODIC_MONTH
-    return lunations - math.floor(lunations)
+    return lunation_fraction(d.timestamp())
 
 
-def get_moon_phase_info(dt: datetime) -> dict:
+def get_moon_phase_info(dt: datetime) -> MoonInfo:
     """Return detailed moon phase info."""
     phase = get_moon_phase(dt)
     idx = int(phase * 8 + 0.5) % 8
-    illumination = (1 - math.cos(phase * 2 * math.pi)) / 2 * 100
-    info = MOON_PHASES[idx].copy()
-    info["phase"] = round(phase, 4)
-    info["illumination"] = round(illumination, 1)
-    info["index"] = idx
-    return info
+    return MoonInfo(
+        moon_phase=MOON_PHASES[idx],
+        phase=round(phase, 4),
+        illumination=round(illumination(phase), 1),
+        index=idx,
+        age=round(phase * _SYNODIC_MONTH, 2),
+    )
 
 
-def _normalize_deg(deg: float) -> float:
-    return deg % 360
+def get_next_full_moon(dt: datetime) -> datetime:
+    """Return the exact instant of the next full moon after ``dt``."""
+    return next_phase_event(dt, FULL_MOON).time
 
 
-def get_planetary_positions(dt: datetime) -> list[dict]:
-    """Return approximate ecliptic longitudes for all planets."""
-    jd = julian_day(dt)
-    T = (jd - 2451545.0) / 36525  # Julian centuries from J2000.0
+def get_next_new_moon(dt: datetime) -> datetime:
+    """Return the exact instant of the next new moon after ``dt``."""
+    return next_phase_event(dt, NEW_MOON).time
+
+
+def get_planetary_positions(
+    dt: datetime, precision: str = PRECISION_FAST
+) -> list[dict]:
+    """Return geocentric ecliptic longitudes for all planets.
+
+    The fast tier uses mean Keplerian orbits (arc-minutes); the precise
+    tier adds VSOP87 for the Sun and Earth, the full lunar series and
+    apparent-place corrections (about an arc-second for the Sun and Moon;
+    the other planets keep their Keplerian error, up to ~11' for Saturn).
+    Inside the span of the bundled Chebyshev file the precise tier is read
+    from it; outside, the series are evaluated directly.
+    """
+    if precision == PRECISION_PRECISE:
+        ts = dt.timestamp()
+        ephemeris = load_ephemeris()
+        if ephemeris is not None and ephemeris.covers(ts):
+            longitudes = ephemeris.longitudes(ts)
+        else:
+            longitudes = precise_longitudes(ts, PRECISE_TARGET_ARCSEC)
+    else:
+        T = (julian_day(dt) - J2000_JD) / 36525  # Julian centuries from J2000.0
 
     positions = []
     for planet in PLANETS:
-        lon = _normalize_deg(
-            planet["L0"] + planet["rate"] * T + planet.get("L1", 0) * T * T
-        )
+        if precision == PRECISION_PRECISE:
+            lon = longitudes[planet.name]
+        else:
+            lon = body_longitude(T, planet)
         sign_idx = int(lon / 30) % 12
         sign_deg = lon % 30
         zodiac_sign = ZODIAC[sign_idx]
 
         positions.append(
             {
-                "name": planet["name"],
-                "symbol": planet["symbol"],
-                "color": planet.get("color", "#ccc"),
+                "name": planet.name,
+                "symbol": planet.symbol,
+                "color": planet.color,
                 "longitude": round(lon, 2),
                 "sign_index": sign_idx,
                 "sign_degree": round(sign_deg, 1),
-                "sign_name": zodiac_sign["name"],
-                "sign_symbol": zodiac_sign["symbol"],
+                "sign_name": zodiac_sign.name,
+                "sign_symbol": zodiac_sign.symbol,
             }
         )
     return positions
 
 
-def get_sun_sign(dt: datetime) -> dict:
+def next_moon_phase_change(dt: datetime) -> datetime:
+    """Return the next instant the moon phase index changes.
+
+    The index flips whenever ``phase * 8 + 0.5`` crosses a whole number.
+    """
+    d = dt if dt.tzinfo else dt.replace(tzinfo=timezone.utc)
+    days_since = (d - _KNOWN_NEW_MOON).total_seconds() / 86400
+    x = days_since / _SYNODIC_MONTH * 8 + 0.5
+    boundary = (math.floor(x) + 1 - 0.5) / 8
+    return _KNOWN_NEW_MOON + timedelta(days=boundary * _SYNODIC_MONTH)
+
+
+def next_sign_ingress(dt: datetime) -> datetime:
+    """Return the next instant any planet enters a new zodiac sign."""
+    return next_ingress(dt)
+
+
+def get_station_info(dt: datetime, name: str) -> dict:
+    """Return retrograde status and the next station of a planet."""
+    station = next_station(dt, name)
+    if station is None:
+        return {"retrograde": False, "next_station": None, "station_type": None}
+    return {
+        # Heading for a direct station means the planet is retrograde now.
+        "retrograde": station.station_type == STATION_DIRECT,
+        "next_station": station.time,
+        "station_type": station.station_type,
+    }
+
+
+def next_local_midnight(dt: datetime) -> datetime:
+    """Return the start of the day after ``dt`` in its own time zone."""
+    return datetime.combine(dt.date() + timedelta(days=1), time(), tzinfo=dt.tzinfo)
+
+
+def next_transition(dt: datetime) -> datetime:
+    """Return the next instant any discrete wheel output changes.
+
+    Sabbat countdowns, the Sun sign and the season only change at local
+    midnight; the remaining discrete values are the moon phase index, the
+    exact primary lunar phases, planetary sign ingresses and stations.
+    """
+    candidates = [
+        next_local_midnight(dt),
+        next_moon_phase_change(dt),
+        next_phase_event(dt).time,
+        next_sign_ingress(dt),
+    ]
+    station = next_station(dt)
+    if station is not None:
+        candidates.append(station.time)
+    return min(candidates)
+
+
+def get_sun_sign(dt: datetime) -> ZodiacSign:
     """Return the current Sun sign based on date."""
-    m = dt.month
-    d = dt.day
-    for z in ZODIAC:
-        if z["name"] == "Capricorn":
-            if (m == 12 and d >= 22) or (m == 1 and d <= 19):
-                return z
-        else:
-            if (m == z["start_month"] and d >= z["start_day"]) or (
-                m == z["end_month"] and d <= z["end_day"]
-            ):
-                return z
-    return ZODIAC[0]
+    return _SUN_SIGN_BY_DAY[_MONTH_OFFSETS[dt.month - 1] + dt.day - 1]
+
+
+def hemisphere_for_latitude(latitude: float) -> str:
+    """Return the hemisphere a latitude lies in."""
+    return HEMISPHERE_SOUTH if latitude < 0 else HEMISPHERE_NORTH
 
 
-def get_current_season(dt: datetime) -> str:
+def get_current_season(dt: datetime, hemisphere: str = HEMISPHERE_NORTH) -> str:
     """Return current season name."""
     m = dt.month
+    if hemisphere == HEMISPHERE_SOUTH:
+        m = (m + 5) % 12 + 1
     if 3 <= m <= 5:
         return "Spring"
     elif 6 <= m <= 8:
@@ -117,22 +253,46 @@ def get_current_season(dt: datetime) -> str:
         return "Winter"
 
 
-def get_sabbat_date(sabbat: dict, year: int) -> datetime:
-    """Get the date of a sabbat for a given year."""
-    return datetime(year, sabbat["month"], sabbat["day"])
+def sabbat_longitude(sabbat: Sabbat, hemisphere: str = HEMISPHERE_NORTH) -> int:
+    """Return the solar longitude a sabbat falls at in a hemisphere."""
+    if hemisphere == HEMISPHERE_SOUTH:
+        return (sabbat.longitude + SOUTHERN_LONGITUDE_OFFSET) % 360
+    return sabbat.longitude
 
 
-def get_next_sabbat_date(sabbat: dict, now: datetime) -> datetime:
-    """Get the next occurrence of a sabbat from now."""
-    d = get_sabbat_date(sabbat, now.year)
+def get_sabbat_date(
+    sabbat: Sabbat,
+    year: int,
+    tz: tzinfo | None = None,
+    hemisphere: str = HEMISPHERE_NORTH,
+) -> datetime:
+    """Get the exact instant of a sabbat in a given year.
+
+    The sabbat falls when the apparent solar longitude reaches the
+    sabbat's longitude.  The result is expressed in ``tz`` (UTC if unset).
+    """
+    instant = solar_longitude_time(year, sabbat_longitude(sabbat, hemisphere))
+    return instant.astimezone(tz or timezone.utc)
+
+
+def get_next_sabbat_date(
+    sabbat: Sabbat, now: datetime, hemisphere: str = HEMISPHERE_NORTH
+) -> datetime:
+    """Get the next occurrence of a sabbat from now, in now's time zone.
+
+    A sabbat that falls earlier today still counts as today's occurrence.
+    """
+    d = get_sabbat_date(sabbat, now.year, now.tzinfo, hemisphere)
     if d.date() < now.date():
-        d = get_sabbat_date(sabbat, now.year + 1)
+        d = get_sabbat_date(sabbat, now.year + 1, now.tzinfo, hemisphere)
     return d
 
 
-def days_until_sabbat(sabbat: dict, now: datetime) -> int:
+def days_until_sabbat(
+    sabbat: Sabbat, now: datetime, hemisphere: str = HEMISPHERE_NORTH
+) -> int:
     """Return days until next occurrence of a sabbat."""
-    next_date = get_next_sabbat_date(sabbat, now)
+    next_date = get_next_sabbat_date(sabbat, now, hemisphere)
     return (next_date.date() - now.date()).days
 
 
@@ -0,0 +1,160 @@
+"""Calendar platform for the Wheel of the Year integration."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, time, timedelta, tzinfo
+
+from homeassistant.components.calendar import CalendarEntity, CalendarEvent
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.start import async_at_started
+
+from .const import DOMAIN
+from .coordinator import WheelCoordinator
+from .entity import WheelEntity
+from .timeline import Timeline, WheelEvent
+
+# Phases and ingresses are instants; show them as one-minute events.
+_INSTANT_DURATION = timedelta(minutes=1)
+
+# How far ahead the index is kept built, so the next event is always known.
+_LOOKAHEAD = timedelta(days=366)
+
+# All-day events are indexed by their exact instant, which can fall up to a
+# day either side of the local date they are shown on.
+_ALL_DAY_PADDING = timedelta(days=1)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up the Wheel of the Year calendar from a config entry."""
+    coordinator: WheelCoordinator = hass.data[DOMAIN][entry.entry_id]
+    async_add_entities(
+        [WheelCalendar(coordinator, Timeline(coordinator.hemisphere))]
+    )
+
+
+def _event_span(event: WheelEvent, tz: tzinfo) -> tuple[datetime, datetime]:
+    """Return when an event starts and ends in the instance's time zone."""
+    start = event.time.astimezone(tz)
+    if event.all_day:
+        start = datetime.combine(start.date(), time(), tzinfo=tz)
+        return start, datetime.combine(
+            start.date() + timedelta(days=1), time(), tzinfo=tz
+        )
+    return start, start + _INSTANT_DURATION
+
+
+def _to_calendar_event(event: WheelEvent, tz: tzinfo) -> CalendarEvent:
+    start, end = _event_span(event, tz)
+    if event.all_day:
+        return CalendarEvent(
+            start=start.date(),
+            end=end.date(),
+            summary=event.summary,
+            description=event.description,
+            uid=event.uid,
+        )
+    return CalendarEvent(
+        start=start,
+        end=end,
+        summary=event.summary,
+        description=event.description,
+        uid=event.uid,
+    )
+
+
+class WheelCalendar(WheelEntity, CalendarEntity):
+    """Calendar of sabbats, lunar phases, sign ingresses and solar-cycle markers."""
+
+    _attr_name = None
+    _unique_key = "calendar"
+
+    def __init__(self, coordinator: WheelCoordinator, timeline: Timeline) -> None:
+        super().__init__(coordinator)
+        self._timeline = timeline
+        self._event: CalendarEvent | None = None
+        self._build_task: asyncio.Task | None = None
+
+    @property
+    def event(self) -> CalendarEvent | None:
+        """Return the current or next upcoming event."""
+        return self._event
+
+    async def async_added_to_hass(self) -> None:
+        """Index the coming year once Home Assistant has started."""
+        await super().async_added_to_hass()
+        self.async_on_remove(async_at_started(self.hass, self._async_start))
+
+    @callback
+    def _async_start(self, hass: HomeAssistant) -> None:
+        self._async_extend_timeline()
+
+    @callback
+    def _async_extend_timeline(self) -> None:
+        """Build the coming year in the executor, once at a time."""
+        if self._build_task is None or self._build_task.done():
+            self._build_task = self.hass.async_create_task(
+                self._async_build_timeline()
+            )
+
+    async def _async_build_timeline(self) -> None:
+        now = self.coordinator.clock.now(self.coordinator.time_zone)
+        await self.hass.async_add_executor_job(
+            self._timeline.ensure_range, now - timedelta(days=1), now + _LOOKAHEAD
+        )
+        if self.coordinator.data is not None:
+            self._event = self._upcoming_event(self.coordinator.data.now)
+            self.async_write_ha_state()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        if self.coordinator.data is None:
+            return
+        now = self.coordinator.data.now
+        # Building years runs the astronomy; never do that on the event loop.
+        if self._timeline.covers(now, now + _LOOKAHEAD):
+            self._event = self._upcoming_event(now)
+        else:
+            self._async_extend_timeline()
+        super()._handle_coordinator_update()
+
+    def _upcoming_event(self, now: datetime) -> CalendarEvent | None:
+        # Today's all-day event stays current until local midnight.
+        tz = self.coordinator.time_zone
+        for event in self._timeline.events_between(
+            now - _ALL_DAY_PADDING, now + _ALL_DAY_PADDING
+        ):
+            if _event_span(event, tz)[1] > now:
+                return _to_calendar_event(event, tz)
+        event = self._timeline.next_event(now)
+        return _to_calendar_event(event, tz) if event else None
+
+    async def async_get_events(
+        self, hass: HomeAssistant, start_date: datetime, end_date: datetime
+    ) -> list[CalendarEvent]:
+        """Return calendar events within a datetime range."""
+        query_start = start_date - _ALL_DAY_PADDING
+        query_end = end_date + _ALL_DAY_PADDING
+        if not self._timeline.covers(query_start, query_end):
+            if self._build_task is not None and not self._build_task.done():
+                # Wait for the running build instead of building alongside it;
+                # the query may need nothing more.
+                await asyncio.shield(self._build_task)
+        if not self._timeline.covers(query_start, query_end):
+            await hass.async_add_executor_job(
+                self._timeline.ensure_range, query_start, query_end
+            )
+
+        tz = self.coordinator.time_zone
+        events = []
+        for event in self._timeline.events_between(query_start, query_end):
+            start, end = _event_span(event, tz)
+            if start < end_date and end > start_date:
+                events.append(_to_calendar_event(event, tz))
+        return events
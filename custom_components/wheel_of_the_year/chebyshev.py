@@ -0,0 +1,117 @@
+"""Memory-mapped Chebyshev ephemeris for the Wheel of the Year.
+
+``ephemeris.bin`` holds, for every body, a run of fixed-length time segments.
+Each segment stores the Chebyshev coefficients of the body's apparent
+longitude (in degrees, unwrapped) over that segment, in the manner of JPL SPK
+files. A lookup reads one segment and sums a dozen terms, so positions cost
+the same at any precision and the file is paged in only where it is read.
+
+The file is generated offline from the precise tier by
+``scripts/build_ephemeris.py``.
+
+Layout (little-endian)::
+
+    header   8s magic, H version, H body count, d start, d end, d target
+    bodies   16s name, d segment seconds, I coefficients, I segments, I offset
+    segments d c0, then (coefficients - 1) × f c1..cn
+
+``start`` and ``end`` are POSIX timestamps (UTC); ``target`` is the fitting
+tolerance in arc-seconds. Storing c0 as a double keeps the unwrapped
+longitude exact; the higher coefficients are a segment's motion and need
+only single precision.
+"""
+
+from __future__ import annotations
+
+import mmap
+import struct
+from functools import lru_cache
+from pathlib import Path
+from typing import NamedTuple
+
+EPHEMERIS_PATH = Path(__file__).parent / "ephemeris.bin"
+
+MAGIC = b"WOTYCHEB"
+VERSION = 1
+HEADER = struct.Struct("<8sHHddd")
+BODY = struct.Struct("<16sdIII")
+
+
+class _Body(NamedTuple):
+    segment_seconds: float
+    coefficients: int
+    segments: int
+    offset: int
+    record: struct.Struct
+
+
+class ChebyshevEphemeris:
+    """Read-only view of an ephemeris file."""
+
+    def __init__(self, path: Path) -> None:
+        with open(path, "rb") as file:
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, count, self.start, self.end, self.target_arcsec = (
+            HEADER.unpack_from(self._map, 0)
+        )
+        if magic != MAGIC or version != VERSION:
+            self._map.close()
+            raise ValueError(f"{path} is not a version {VERSION} ephemeris file")
+
+        self._bodies: dict[str, _Body] = {}
+        for i in range(count):
+            name, seconds, coefficients, segments, offset = BODY.unpack_from(
+                self._map, HEADER.size + i * BODY.size
+            )
+            self._bodies[name.rstrip(b"\0").decode()] = _Body(
+                seconds,
+                coefficients,
+                segments,
+                offset,
+                struct.Struct(f"<d{coefficients - 1}f"),
+            )
+
+    @property
+    def bodies(self) -> tuple[str, ...]:
+        return tuple(self._bodies)
+
+    def covers(self, ts: float) -> bool:
+        """Return True if ``ts`` lies inside the fitted span."""
+        return self.start <= ts < self.end
+
+    def longitude(self, name: str, ts: float) -> float:
+        """Apparent geocentric longitude of a body in degrees at ``ts``."""
+        body = self._bodies[name]
+        index, fraction = divmod((ts - self.start) / body.segment_seconds, 1)
+        index = int(index)
+        if not 0 <= index < body.segments:
+            raise ValueError(f"timestamp {ts} is outside the ephemeris span")
+        coefficients = body.record.unpack_from(
+            self._map, body.offset + index * body.record.size
+        )
+
+        # Clenshaw recurrence on x in [-1, 1].
+        x = 2 * fraction - 1
+        b1 = b2 = 0.0
+        for c in reversed(coefficients[1:]):
+            b1, b2 = 2 * x * b1 - b2 + c, b1
+        return (x * b1 - b2 + coefficients[0]) % 360
+
+    def longitudes(self, ts: float) -> dict[str, float]:
+        """Longitudes of every body in the file at ``ts``."""
+        return {name: self.longitude(name, ts) for name in self._bodies}
+
+    def close(self) -> None:
+        self._map.close()
+
+
+@lru_cache(maxsize=1)
+def load_ephemeris(path: Path = EPHEMERIS_PATH) -> ChebyshevEphemeris | None:
+    """Open the ephemeris file once, or return None if it is not there.
+
+    Opening touches the disk, so call this from an executor job first; later
+    calls return the cached mapping.
+    """
+    if not path.exists():
+        return None
+    return ChebyshevEphemeris(path)
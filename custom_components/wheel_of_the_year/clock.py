@@ -0,0 +1,51 @@
+"""Clocks for the Wheel of the Year integration.
+
+Nothing in the integration reads the system time directly: each
+coordinator asks its clock, and every entity works from the snapshot the
+coordinator built. Swapping in a ``SimulatedClock`` therefore moves the
+whole wheel through time, which is how a replay runs a year of refreshes
+in seconds.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, tzinfo
+from typing import Protocol
+
+
+class Clock(Protocol):
+    """Source of the current time."""
+
+    def now(self, tz: tzinfo) -> datetime:
+        """Return the current time in ``tz``."""
+
+
+class SystemClock:
+    """The real wall-clock time."""
+
+    def now(self, tz: tzinfo) -> datetime:
+        return datetime.now(tz)
+
+
+class SimulatedClock:
+    """A clock that stands still until it is set or advanced."""
+
+    def __init__(self, start: datetime) -> None:
+        self.set(start)
+
+    def now(self, tz: tzinfo) -> datetime:
+        return self._now.astimezone(tz)
+
+    def set(self, when: datetime) -> None:
+        """Jump to ``when``, which must be time-zone aware."""
+        if when.tzinfo is None:
+            raise ValueError("simulated time must be time-zone aware")
+        self._now = when
+
+    def advance(self, delta: timedelta) -> datetime:
+        """Move forward by ``delta`` and return the new time."""
+        self._now += delta
+        return self._now
+
+
+SYSTEM_CLOCK = SystemClock()
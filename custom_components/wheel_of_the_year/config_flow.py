@@ -2,30 +2,182 @@
 
 from __future__ import annotations
 
+import zoneinfo
 from typing import Any
 
 import voluptuous as vol
 
-from homeassistant.config_entries import ConfigFlow, ConfigFlowResult
+from homeassistant.config_entries import (
+    ConfigEntry,
+    ConfigFlow,
+    ConfigFlowResult,
+    OptionsFlow,
+)
+from homeassistant.const import (
+    CONF_LATITUDE,
+    CONF_LOCATION,
+    CONF_LONGITUDE,
+    CONF_NAME,
+    CONF_TIME_ZONE,
+)
+from homeassistant.core import callback
+from homeassistant.helpers.selector import (
+    LocationSelector,
+    SelectSelector,
+    SelectSelectorConfig,
+    SelectSelectorMode,
+    TextSelector,
+)
+from homeassistant.util import dt as dt_util
 
-from .const import DOMAIN
+from .calculations import hemisphere_for_latitude
+from .const import (
+    CONF_CONTINUOUS_INTERVAL,
+    CONF_FRACTION_STEP,
+    CONF_HEMISPHERE,
+    CONF_ILLUMINATION_STEP,
+    CONF_LONGITUDE_STEP,
+    CONF_PRECISION,
+    DEFAULT_CONTINUOUS_INTERVAL,
+    DEFAULT_FRACTION_STEP,
+    DEFAULT_ILLUMINATION_STEP,
+    DEFAULT_LONGITUDE_STEP,
+    DEFAULT_NAME,
+    DEFAULT_PRECISION,
+    DOMAIN,
+    HEMISPHERE_NORTH,
+    HEMISPHERE_SOUTH,
+    PRECISION_FAST,
+    PRECISION_PRECISE,
+)
 
 
 class WheelOfTheYearConfigFlow(ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Wheel of the Year."""
 
-    VERSION = 1
+    VERSION = 2
 
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
-        """Handle the initial step."""
-        if self._async_current_entries():
-            return self.async_abort(reason="single_instance_allowed")
+        """Set up a wheel for one location."""
+        errors: dict[str, str] = {}
+        if user_input is not None:
+            location = user_input[CONF_LOCATION]
+            data = {
+                CONF_LATITUDE: location[CONF_LATITUDE],
+                CONF_LONGITUDE: location[CONF_LONGITUDE],
+                CONF_HEMISPHERE: user_input[CONF_HEMISPHERE],
+                CONF_TIME_ZONE: user_input[CONF_TIME_ZONE],
+            }
+            self._async_abort_entries_match(data)
+            if dt_util.get_time_zone(data[CONF_TIME_ZONE]) is None:
+                errors[CONF_TIME_ZONE] = "invalid_time_zone"
+            else:
+                return self.async_create_entry(
+                    title=user_input[CONF_NAME], data=data
+                )
+
+        config = self.hass.config
+        # The first wheel keeps the old name, so its entity ids stay put.
+        name = DEFAULT_NAME if not self._async_current_entries() else ""
+        time_zones = await self.hass.async_add_executor_job(
+            zoneinfo.available_timezones
+        )
+        schema = vol.Schema(
+            {
+                vol.Required(CONF_NAME): TextSelector(),
+                vol.Required(CONF_LOCATION): LocationSelector(),
+                vol.Required(CONF_HEMISPHERE): SelectSelector(
+                    SelectSelectorConfig(
+                        options=[HEMISPHERE_NORTH, HEMISPHERE_SOUTH],
+                        mode=SelectSelectorMode.LIST,
+                        translation_key=CONF_HEMISPHERE,
+                    )
+                ),
+                vol.Required(CONF_TIME_ZONE): SelectSelector(
+                    SelectSelectorConfig(
+                        options=sorted(time_zones),
+                        mode=SelectSelectorMode.DROPDOWN,
+                    )
+                ),
+            }
+        )
+        return self.async_show_form(
+            step_id="user",
+            data_schema=self.add_suggested_values_to_schema(
+                schema,
+                user_input
+                or {
+                    CONF_NAME: name,
+                    CONF_LOCATION: {
+                        CONF_LATITUDE: config.latitude,
+                        CONF_LONGITUDE: config.longitude,
+                    },
+                    CONF_HEMISPHERE: hemisphere_for_latitude(config.latitude),
+                    CONF_TIME_ZONE: config.time_zone,
+                },
+            ),
+            errors=errors,
+        )
+
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry: ConfigEntry) -> OptionsFlow:
+        """Return the options flow handler."""
+        return WheelOfTheYearOptionsFlow(config_entry)
+
 
+class WheelOfTheYearOptionsFlow(OptionsFlow):
+    """Handle Wheel of the Year options."""
+
+    def __init__(self, config_entry: ConfigEntry) -> None:
+        self._entry = config_entry
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Manage the refresh cadence, precision and reporting steps."""
         if user_input is not None:
-            return self.async_create_entry(
-                title="Wheel of the Year", data={}
-            )
+            return self.async_create_entry(title="", data=user_input)
 
-        return self.async_show_form(step_id="user", data_schema=vol.Schema({}))
+        options = self._entry.options
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(
+                        CONF_CONTINUOUS_INTERVAL,
+                        default=options.get(
+                            CONF_CONTINUOUS_INTERVAL, DEFAULT_CONTINUOUS_INTERVAL
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=1, max=1440)),
+                    vol.Required(
+                        CONF_PRECISION,
+                        default=options.get(CONF_PRECISION, DEFAULT_PRECISION),
+                    ): SelectSelector(
+                        SelectSelectorConfig(
+                            options=[PRECISION_FAST, PRECISION_PRECISE],
+                            mode=SelectSelectorMode.LIST,
+                            translation_key=CONF_PRECISION,
+                        )
+                    ),
+                    vol.Required(
+                        CONF_LONGITUDE_STEP,
+                        default=options.get(
+                            CONF_LONGITUDE_STEP, DEFAULT_LONGITUDE_STEP
+                        ),
+                    ): vol.All(vol.Coerce(float), vol.Range(min=0, max=30)),
+                    vol.Required(
+                        CONF_ILLUMINATION_STEP,
+                        default=options.get(
+                            CONF_ILLUMINATION_STEP, DEFAULT_ILLUMINATION_STEP
+                        ),
+                    ): vol.All(vol.Coerce(float), vol.Range(min=0, max=50)),
+                    vol.Required(
+                        CONF_FRACTION_STEP,
+                        default=options.get(CONF_FRACTION_STEP, DEFAULT_FRACTION_STEP),
+                    ): vol.All(vol.Coerce(float), vol.Range(min=0, max=0.5)),
+                }
+            ),
+        )
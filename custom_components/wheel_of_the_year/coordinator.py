@@ -0,0 +1,355 @@
+"""Shared snapshot coordinator for the Wheel of the Year integration."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta, tzinfo
+from typing import Any, Iterator, Mapping
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant
+from homeassistant.helpers.event import async_track_point_in_time
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+
+from .calculations import (
+    MoonInfo,
+    days_until_sabbat,
+    get_current_season,
+    get_next_sabbat_date,
+    get_sun_sign,
+    next_transition,
+)
+from .chebyshev import load_ephemeris
+from .clock import SYSTEM_CLOCK, Clock, SimulatedClock
+from .const import (
+    DEFAULT_FRACTION_STEP,
+    DEFAULT_ILLUMINATION_STEP,
+    DEFAULT_LONGITUDE_STEP,
+    DOMAIN,
+    HEMISPHERE_NORTH,
+    PRECISION_FAST,
+    SABBATS,
+    SEASONS,
+    Sabbat,
+    ZodiacSign,
+)
+from .events import prewarm
+from .instrumentation import RefreshStats
+from .sky import sky_snapshot
+
+_LOGGER = logging.getLogger(__name__)
+
+# Fire slightly after a boundary so the new value is already in effect.
+_TRANSITION_MARGIN = timedelta(seconds=1)
+
+
+@dataclass(frozen=True)
+class ReportingSteps:
+    """Steps the sensors report continuous attributes in."""
+
+    longitude: float = DEFAULT_LONGITUDE_STEP
+    illumination: float = DEFAULT_ILLUMINATION_STEP
+    fraction: float = DEFAULT_FRACTION_STEP
+
+
+@dataclass(frozen=True)
+class SabbatState:
+    """Countdown state for a single sabbat."""
+
+    sabbat: Sabbat
+    days_until: int
+    next_date: datetime
+
+
+@dataclass(frozen=True)
+class WheelSnapshot:
+    """Every computed wheel value, taken at one instant."""
+
+    now: datetime
+    hemisphere: str
+    moon: MoonInfo
+    next_full_moon: datetime
+    next_new_moon: datetime
+    sun_sign: ZodiacSign
+    season: str
+    solar_cycle: Mapping
+    sabbats: tuple[SabbatState, ...]
+    next_sabbat: SabbatState | None
+    planets: tuple[Mapping, ...]
+    planets_by_name: Mapping[str, Mapping]
+    stations: Mapping[str, Mapping]
+
+
+def build_snapshot(
+    now: datetime,
+    precision: str = PRECISION_FAST,
+    hemisphere: str = HEMISPHERE_NORTH,
+) -> WheelSnapshot:
+    """Compute a snapshot of the whole wheel for ``now``.
+
+    Each calculation runs exactly once, so the cost of a refresh does not
+    depend on how many entities consume the result. The time-only half
+    comes from the process-wide sky cache shared with other instances;
+    only local dates and the hemisphere are worked out here.
+    """
+    sabbats = []
+    nearest = None
+    for sabbat in SABBATS:
+        state = SabbatState(
+            sabbat=sabbat,
+            days_until=days_until_sabbat(sabbat, now, hemisphere),
+            next_date=get_next_sabbat_date(sabbat, now, hemisphere),
+        )
+        sabbats.append(state)
+        if nearest is None or state.days_until < nearest.days_until:
+            nearest = state
+
+    sky = sky_snapshot(now, precision)
+    return WheelSnapshot(
+        now=now,
+        hemisphere=hemisphere,
+        moon=sky.moon,
+        next_full_moon=sky.next_full_moon,
+        next_new_moon=sky.next_new_moon,
+        sun_sign=get_sun_sign(now),
+        season=get_current_season(now, hemisphere),
+        solar_cycle=sky.solar_cycle,
+        sabbats=tuple(sabbats),
+        next_sabbat=nearest,
+        planets=sky.planets,
+        planets_by_name=sky.planets_by_name,
+        stations=sky.stations,
+    )
+
+
+def _next_boundary(now: datetime, interval: timedelta) -> datetime:
+    """Return the next multiple of ``interval`` since the Unix epoch.
+
+    Aligning continuous refreshes to UTC boundaries lets instances with the
+    same interval refresh together and share one cached sky.
+    """
+    step = interval.total_seconds()
+    ts = (math.floor(now.timestamp() / step) + 1) * step
+    return datetime.fromtimestamp(ts, tz=now.tzinfo)
+
+
+def next_refresh_time(now: datetime, continuous_interval: timedelta) -> datetime:
+    """Return when a wheel refreshed at ``now`` refreshes next."""
+    return min(
+        next_transition(now) + _TRANSITION_MARGIN,
+        _next_boundary(now, continuous_interval),
+    )
+
+
+def replay_times(
+    start: datetime, end: datetime, continuous_interval: timedelta
+) -> Iterator[datetime]:
+    """Yield every instant a wheel would refresh from ``start`` up to ``end``."""
+    now = start
+    while now < end:
+        yield now
+        now = next_refresh_time(now, continuous_interval)
+
+
+def _timed_prewarm(year: int) -> tuple[float, float]:
+    started = time.perf_counter()
+    # Map the ephemeris file here so the event loop never opens it.
+    load_ephemeris()
+    prewarm(year)
+    return started, time.perf_counter()
+
+
+def build_card_payload(snapshot: WheelSnapshot) -> dict[str, Any]:
+    """Flatten a snapshot into the structure the Lovelace card reads."""
+    moon_info = snapshot.moon
+    sun_sign = snapshot.sun_sign
+    season_name = snapshot.season
+    season = SEASONS[season_name]
+
+    sabbat_data = []
+    for state in snapshot.sabbats:
+        sabbat = state.sabbat
+        sabbat_data.append({
+            "name": sabbat.name,
+            "alt_name": sabbat.alt_name,
+            "emoji": sabbat.emoji,
+            "days_until": state.days_until,
+            "next_date": state.next_date.strftime("%Y-%m-%d"),
+            "color": sabbat.color,
+            "dark_color": sabbat.dark_color,
+        })
+
+    nearest = snapshot.next_sabbat
+    return {
+        "hemisphere": snapshot.hemisphere,
+        "moon_phase": moon_info.moon_phase.name,
+        "moon_illumination": moon_info.illumination,
+        "moon_emoji": moon_info.moon_phase.emoji,
+        "moon_phase_number": moon_info.phase,
+        "moon_phase_index": moon_info.index,
+        "next_full_moon": snapshot.next_full_moon.isoformat(),
+        "next_new_moon": snapshot.next_new_moon.isoformat(),
+        "sun_sign": sun_sign.name,
+        "sun_sign_symbol": sun_sign.symbol,
+        "sun_sign_element": sun_sign.element,
+        "sun_sign_quality": sun_sign.quality,
+        "sun_sign_ruler": sun_sign.ruler,
+        "season": season_name,
+        "season_emoji": season.emoji,
+        "solar_cycle": dict(snapshot.solar_cycle),
+        "next_sabbat": nearest.sabbat.name if nearest else None,
+        "next_sabbat_days": nearest.days_until if nearest else float("inf"),
+        "sabbats": sabbat_data,
+        "planets": [dict(p) for p in snapshot.planets],
+    }
+
+
+class WheelCoordinator(DataUpdateCoordinator[WheelSnapshot]):
+    """Build one snapshot per tick and fan it out to every entity.
+
+    Rather than polling on a fixed interval, the coordinator arms a single
+    timer for the next instant a discrete value changes (local midnight, a
+    moon phase boundary or a sign ingress). Continuous values such as
+    illumination are refreshed on their own, configurable cadence.
+
+    Each config entry has its own coordinator with its own time zone and
+    hemisphere; the time-only astronomy underneath is shared between them.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: ConfigEntry,
+        time_zone: tzinfo,
+        hemisphere: str,
+        continuous_interval: timedelta,
+        precision: str = PRECISION_FAST,
+        steps: ReportingSteps = ReportingSteps(),
+        clock: Clock = SYSTEM_CLOCK,
+    ) -> None:
+        super().__init__(hass, _LOGGER, name=f"{DOMAIN} {entry.title}")
+        self.entry = entry
+        self.continuous_interval = continuous_interval
+        self.precision = precision
+        self.steps = steps
+        self.time_zone = time_zone
+        self.hemisphere = hemisphere
+        self.clock = clock
+        self.next_refresh: datetime | None = None
+        self._unsub_refresh_timer: CALLBACK_TYPE | None = None
+        self.stats = RefreshStats()
+        self._warm_year: int | None = None
+        self._replay_lock = asyncio.Lock()
+
+    async def async_start(self, hass: HomeAssistant) -> None:
+        """Run the first refresh, deferred until Home Assistant has started."""
+        await self.async_refresh()
+
+    async def _async_update_data(self) -> WheelSnapshot:
+        """Compute the snapshot on the event loop.
+
+        With the year tables built, a snapshot is a few hundred microseconds
+        of arithmetic and bisects, less than a thread hop costs. The tables
+        themselves are built in one executor job, once per year.
+        """
+        now = self.clock.now(self.time_zone)
+        if self._warm_year != now.year:
+            await self._async_prewarm(now.year)
+            now = self.clock.now(self.time_zone)
+
+        self._async_schedule_next_refresh(now)
+        return self._build(now)
+
+    async def _async_prewarm(self, year: int) -> None:
+        """Build the year's tables in the executor.
+
+        A failure is logged rather than raised: snapshots build what they
+        need themselves, only slower, and the next refresh tries again.
+        """
+        submitted = time.perf_counter()
+        try:
+            started, finished = await self.hass.async_add_executor_job(
+                _timed_prewarm, year
+            )
+        except Exception:
+            _LOGGER.exception("Precomputing the %s event tables failed", year)
+            return
+        self.stats.executor_wait.record(started - submitted)
+        self.stats.prewarm.record(finished - started)
+        self._warm_year = year
+
+    def _build(self, now: datetime) -> WheelSnapshot:
+        started = time.perf_counter()
+        snapshot = build_snapshot(now, self.precision, self.hemisphere)
+        self.stats.build.record(time.perf_counter() - started)
+        return snapshot
+
+    @property
+    def replaying(self) -> bool:
+        """Return True while a replay is running."""
+        return self._replay_lock.locked()
+
+    async def async_replay(self, start: datetime, end: datetime) -> int:
+        """Run the wheel from ``start`` to ``end`` as fast as possible.
+
+        The coordinator switches to a simulated clock and pushes a snapshot
+        at every instant it would have refreshed, so entities write every
+        state change they would have written in real time. The loop yields
+        between refreshes to let automations react. Afterwards the real
+        clock is restored and a normal refresh runs. Returns the number of
+        refreshes replayed.
+
+        Replays run one at a time, and no real refresh runs until the
+        replay has finished. However the replay ends, even by an error or
+        a cancelled call, the real clock and refresh timer are restored.
+        """
+        async with self._replay_lock:
+            self._async_cancel_refresh_timer()
+            clock = SimulatedClock(start)
+            self.clock = clock
+            count = 0
+            try:
+                for when in replay_times(start, end, self.continuous_interval):
+                    clock.set(when)
+                    now = clock.now(self.time_zone)
+                    if self._warm_year != now.year:
+                        await self._async_prewarm(now.year)
+                    self.async_set_updated_data(self._build(now))
+                    count += 1
+                    await asyncio.sleep(0)
+            finally:
+                self.clock = SYSTEM_CLOCK
+                await self.async_refresh()
+        return count
+
+    def _async_schedule_next_refresh(self, now: datetime) -> None:
+        """Arm the timer for the next transition or continuous refresh."""
+        self._async_cancel_refresh_timer()
+        if isinstance(self.clock, SimulatedClock):
+            # A replay drives refreshes itself.
+            return
+        self.next_refresh = next_refresh_time(now, self.continuous_interval)
+        self._unsub_refresh_timer = async_track_point_in_time(
+            self.hass, self._async_handle_refresh_timer, self.next_refresh
+        )
+
+    async def _async_handle_refresh_timer(self, _now: datetime) -> None:
+        self._unsub_refresh_timer = None
+        if self.replaying:
+            # The replay refreshes for real when it ends.
+            return
+        await self.async_refresh()
+
+    def _async_cancel_refresh_timer(self) -> None:
+        if self._unsub_refresh_timer is not None:
+            self._unsub_refresh_timer()
+            self._unsub_refresh_timer = None
+
+    async def async_shutdown(self) -> None:
+        """Cancel the pending refresh timer."""
+        await super().async_shutdown()
+        self._async_cancel_refresh_timer()
@@ -0,0 +1,107 @@
+"""Device triggers for Wheel of the Year events.
+
+Each wheel is a device, and each of its events is offered in the automation
+editor as a trigger type with the sabbat, phase, body or season as subtype.
+Attaching one hands a platform trigger config to ``trigger.py``, so device
+triggers share the wheel's scheduler with any written in YAML.
+"""
+
+from __future__ import annotations
+
+import voluptuous as vol
+
+from homeassistant.components.device_automation import DEVICE_TRIGGER_BASE_SCHEMA
+from homeassistant.components.device_automation.exceptions import (
+    InvalidDeviceAutomationConfig,
+)
+from homeassistant.const import CONF_DEVICE_ID, CONF_DOMAIN, CONF_PLATFORM, CONF_TYPE
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.trigger import TriggerActionType, TriggerInfo
+from homeassistant.helpers.typing import ConfigType
+
+from . import trigger
+from .const import DOMAIN
+from .timeline import KIND_INGRESS, KIND_MOON_PHASE, KIND_SABBAT, KIND_SEASON
+
+CONF_SUBTYPE = "subtype"
+
+# The platform filter each trigger type's subtype sets.
+TRIGGER_TYPES = {
+    KIND_SABBAT: trigger.CONF_SABBAT,
+    KIND_MOON_PHASE: trigger.CONF_PHASE,
+    KIND_INGRESS: trigger.CONF_BODY,
+    KIND_SEASON: trigger.CONF_SEASON,
+}
+
+TRIGGER_SCHEMA = DEVICE_TRIGGER_BASE_SCHEMA.extend(
+    {
+        vol.Required(CONF_TYPE): vol.In(list(TRIGGER_TYPES)),
+        vol.Required(CONF_SUBTYPE): str,
+    }
+)
+
+
+async def async_validate_trigger_config(
+    hass: HomeAssistant, config: ConfigType
+) -> ConfigType:
+    """Validate a device trigger config."""
+    config = TRIGGER_SCHEMA(config)
+    key = TRIGGER_TYPES[config[CONF_TYPE]]
+    if config[CONF_SUBTYPE] not in trigger.FILTER_NAMES[key]:
+        raise InvalidDeviceAutomationConfig(
+            f"Unknown {config[CONF_TYPE]} subtype {config[CONF_SUBTYPE]}"
+        )
+    return config
+
+
+async def async_get_triggers(
+    hass: HomeAssistant, device_id: str
+) -> list[dict[str, str]]:
+    """List the triggers a wheel device offers."""
+    return [
+        {
+            CONF_PLATFORM: "device",
+            CONF_DOMAIN: DOMAIN,
+            CONF_DEVICE_ID: device_id,
+            CONF_TYPE: kind,
+            CONF_SUBTYPE: subtype,
+        }
+        for kind, key in TRIGGER_TYPES.items()
+        for subtype in trigger.FILTER_NAMES[key]
+    ]
+
+
+async def async_attach_trigger(
+    hass: HomeAssistant,
+    config: ConfigType,
+    action: TriggerActionType,
+    trigger_info: TriggerInfo,
+) -> CALLBACK_TYPE:
+    """Attach a device trigger through the wheel's platform trigger."""
+    device = dr.async_get(hass).async_get(config[CONF_DEVICE_ID])
+    entry_id = next(
+        (
+            identifier
+            for domain, identifier in (device.identifiers if device else ())
+            if domain == DOMAIN
+        ),
+        None,
+    )
+    if entry_id is None:
+        raise InvalidDeviceAutomationConfig(
+            f"Device {config[CONF_DEVICE_ID]} is not a Wheel of the Year wheel"
+        )
+
+    platform_config = await trigger.async_validate_trigger_config(
+        hass,
+        {
+            CONF_PLATFORM: DOMAIN,
+            trigger.CONF_EVENT: config[CONF_TYPE],
+            trigger.CONF_CONFIG_ENTRY_ID: entry_id,
+            TRIGGER_TYPES[config[CONF_TYPE]]: config[CONF_SUBTYPE],
+        },
+    )
+    return await trigger.async_attach_trigger(
+        hass, platform_config, action, trigger_info
+    )
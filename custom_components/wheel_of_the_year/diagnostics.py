@@ -0,0 +1,59 @@
+"""Diagnostics support for the Wheel of the Year integration."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_LATITUDE, CONF_LONGITUDE
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.json import json_bytes
+
+from .const import DOMAIN
+from .coordinator import WheelCoordinator
+from .instrumentation import cache_stats
+
+TO_REDACT = {CONF_LATITUDE, CONF_LONGITUDE}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return refresh timings, cache counters and entity payload sizes."""
+    coordinator: WheelCoordinator = hass.data[DOMAIN][entry.entry_id]
+    stats = coordinator.stats.as_dict()
+
+    entities = {}
+    registry = er.async_get(hass)
+    for reg_entry in er.async_entries_for_config_entry(registry, entry.entry_id):
+        state = hass.states.get(reg_entry.entity_id)
+        entities[reg_entry.entity_id] = {
+            "disabled": reg_entry.disabled_by is not None,
+            "attribute_bytes": (
+                len(json_bytes(state.attributes)) if state is not None else None
+            ),
+            "update": stats["entities"].get(reg_entry.entity_id),
+        }
+
+    return {
+        "location": async_redact_data(dict(entry.data), TO_REDACT),
+        "options": dict(entry.options),
+        "coordinator": {
+            "last_update_success": coordinator.last_update_success,
+            "next_refresh": (
+                coordinator.next_refresh.isoformat()
+                if coordinator.next_refresh
+                else None
+            ),
+            "continuous_interval_seconds": (
+                coordinator.continuous_interval.total_seconds()
+            ),
+        },
+        "build": stats["build"],
+        "prewarm": stats["prewarm"],
+        "executor_wait": stats["executor_wait"],
+        "entities": entities,
+        "caches": cache_stats(),
+    }
@@ -0,0 +1,31 @@
+"""Base entity for the Wheel of the Year integration."""
+
+from __future__ import annotations
+
+from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .const import DOMAIN
+from .coordinator import WheelCoordinator
+
+
+class WheelEntity(CoordinatorEntity[WheelCoordinator]):
+    """Base class for entities fed from the shared wheel snapshot."""
+
+    _attr_has_entity_name = True
+    # Suffix of the unique id; the config entry id is the prefix.
+    _unique_key: str
+
+    def __init__(self, coordinator: WheelCoordinator) -> None:
+        super().__init__(coordinator)
+        self._attr_unique_id = f"{coordinator.entry.entry_id}_{self._unique_key}"
+
+    @property
+    def device_info(self) -> DeviceInfo:
+        return DeviceInfo(
+            identifiers={(DOMAIN, self.coordinator.entry.entry_id)},
+            name=self.coordinator.entry.title,
+            manufacturer="Pagan Calendar",
+            model="Astronomical",
+            sw_version="1.2.0",
+        )
@@ -0,0 +1,690 @@
+"""Columnar ephemeris kernels for the Wheel of the Year.
+
+The kernels in this module are written once against a small math namespace
+so they can run either elementwise on NumPy arrays (one vectorized pass over
+a whole timeline) or on plain floats.  ``calculations.py`` uses them for
+single instants; the batch API below uses them for many instants at once and
+falls back to a pure-Python loop when NumPy is not installed.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Iterable, Mapping, Sequence
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional
+    np = None
+
+from .const import EARTH_ELEMENTS, PLANETS, Planet
+
+# Known new moon reference: Jan 6, 2000 18:14 UTC
+KNOWN_NEW_MOON = datetime(2000, 1, 6, 18, 14, 0, tzinfo=timezone.utc)
+SYNODIC_MONTH = 29.53058770576
+
+J2000_JD = 2451545.0
+UNIX_EPOCH_JD = 2440587.5
+
+_KNOWN_NEW_MOON_TS = KNOWN_NEW_MOON.timestamp()
+
+_DEG = math.pi / 180
+
+# General precession in longitude, degrees per Julian century.  Keplerian
+# elements are referred to the J2000 equinox; adding this gives longitudes
+# in the tropical zodiac of date.
+_PRECESSION = 1.3969713
+
+# Constant of aberration in arc-seconds, and light time per AU in days.
+_ABERRATION = 20.49552
+_LIGHT_TIME_DAYS_PER_AU = 0.0057755183
+
+# Newton iterations for Kepler's equation; enough for Pluto's e≈0.25.
+_KEPLER_ITERATIONS = 6
+
+# The Moon's entry in PLANETS, from which lunar aspects are measured.
+_MOON = next(p for p in PLANETS if p.name == "Moon")
+
+# Periodic terms for the Moon's longitude (Meeus, Astronomical Algorithms,
+# table 47.A): multiples of D, M, M', F and the amplitude in 1e-6 degrees.
+_MOON_LONGITUDE_TERMS = (
+    (0, 0, 1, 0, 6288774), (2, 0, -1, 0, 1274027), (2, 0, 0, 0, 658314),
+    (0, 0, 2, 0, 213618), (0, 1, 0, 0, -185116), (0, 0, 0, 2, -114332),
+    (2, 0, -2, 0, 58793), (2, -1, -1, 0, 57066), (2, 0, 1, 0, 53322),
+    (2, -1, 0, 0, 45758), (0, 1, -1, 0, -40923), (1, 0, 0, 0, -34720),
+    (0, 1, 1, 0, -30383), (2, 0, 0, -2, 15327), (0, 0, 1, 2, -12528),
+    (0, 0, 1, -2, 10980), (4, 0, -1, 0, 10675), (0, 0, 3, 0, 10034),
+    (4, 0, -2, 0, 8548), (2, 1, -1, 0, -7888), (2, 1, 0, 0, -6766),
+    (1, 0, -1, 0, -5163), (1, 1, 0, 0, 4987), (2, -1, 1, 0, 4036),
+    (2, 0, 2, 0, 3994), (4, 0, 0, 0, 3861), (2, 0, -3, 0, 3665),
+    (0, 1, -2, 0, -2689), (2, 0, -1, 2, -2602), (2, -1, -2, 0, 2390),
+    (1, 0, 1, 0, -2348), (2, -2, 0, 0, 2236), (0, 1, 2, 0, -2120),
+    (0, 2, 0, 0, -2069), (2, -2, -1, 0, 2048), (2, 0, 1, -2, -1773),
+    (2, 0, 0, 2, -1595), (4, -1, -1, 0, 1215), (0, 0, 2, 2, -1110),
+    (3, 0, -1, 0, -892), (2, 1, 1, 0, -810), (4, -1, -2, 0, 759),
+    (0, 2, -1, 0, -713), (2, 2, -1, 0, -700), (2, 1, -2, 0, 691),
+    (2, -1, 0, -2, 596), (4, 0, 1, 0, 549), (0, 0, 4, 0, 537),
+    (4, -1, 0, 0, 520), (1, 0, -2, 0, -487), (2, 1, 0, -2, -399),
+    (0, 0, 2, -2, -381), (1, 1, 1, 0, 351), (3, 0, -2, 0, -340),
+    (4, 0, -3, 0, 330), (2, -1, 2, 0, 327), (0, 2, 1, 0, -323),
+    (1, 1, -1, 0, 299), (2, 0, 3, 0, 294),
+)
+
+# Heliocentric longitude (radians) and radius vector (AU) of the Earth,
+# VSOP87D, ecliptic and equinox of date, as truncated by Meeus (appendix
+# III).  Terms are (A, B, C) for A·cos(B + C·τ), A in 1e-8, one tuple per
+# power of τ, the time in Julian millennia from J2000.0 (TT).
+_EARTH_L = (
+    (  # τ^0
+        (175347046, 0, 0), (3341656, 4.6692568, 6283.0758500),
+        (34894, 4.62610, 12566.15170), (3497, 2.7441, 5753.3849),
+        (3418, 2.8289, 3.5231), (3136, 3.6277, 77713.7715),
+        (2676, 4.4181, 7860.4194), (2343, 6.1352, 3930.2097),
+        (1324, 0.7425, 11506.7698), (1273, 2.0371, 529.6910),
+        (1199, 1.1096, 1577.3435), (990, 5.233, 5884.927),
+        (902, 2.045, 26.298), (857, 3.508, 398.149), (780, 1.179, 5223.694),
+        (753, 2.533, 5507.553), (505, 4.583, 18849.228), (492, 4.205, 775.523),
+        (357, 2.920, 0.067), (317, 5.849, 11790.629), (284, 1.899, 796.298),
+        (271, 0.315, 10977.079), (243, 0.345, 5486.778),
+        (206, 4.806, 2544.314), (205, 1.869, 5573.143), (202, 2.458, 6069.777),
+        (156, 0.833, 213.299), (132, 3.411, 2942.463), (126, 1.083, 20.775),
+        (115, 0.645, 0.980), (103, 0.636, 4694.003), (102, 0.976, 15720.839),
+        (102, 4.267, 7.114), (99, 6.21, 2146.17), (98, 0.68, 155.42),
+        (86, 5.98, 161000.69), (85, 1.30, 6275.96), (85, 3.67, 71430.70),
+        (80, 1.81, 17260.15), (79, 3.04, 12036.46), (75, 1.76, 5088.63),
+        (74, 3.50, 3154.69), (74, 4.68, 801.82), (70, 0.83, 9437.76),
+        (62, 3.98, 8827.39), (61, 1.82, 7084.90), (57, 2.78, 6286.60),
+        (56, 4.39, 14143.50), (56, 3.47, 6279.55), (52, 0.19, 12139.55),
+        (52, 1.33, 1748.02), (51, 0.28, 5856.48), (49, 0.49, 1194.45),
+        (41, 5.37, 8429.24), (41, 2.40, 19651.05), (39, 6.17, 10447.39),
+        (37, 6.04, 10213.29), (37, 2.57, 1059.38), (36, 1.71, 2352.87),
+        (36, 1.78, 6812.77), (33, 0.59, 17789.85), (30, 0.44, 83996.85),
+        (30, 2.74, 1349.87), (25, 3.16, 4690.48),
+    ),
+    (  # τ^1
+        (628331966747, 0, 0), (206059, 2.678235, 6283.075850),
+        (4303, 2.6351, 12566.1517), (425, 1.590, 3.523), (119, 5.796, 26.298),
+        (109, 2.966, 1577.344), (93, 2.59, 18849.23), (72, 1.14, 529.69),
+        (68, 1.87, 398.15), (67, 4.41, 5507.55), (59, 2.89, 5223.69),
+        (56, 2.17, 155.42), (45, 0.40, 796.30), (36, 0.47, 775.52),
+        (29, 2.65, 7.11), (21, 5.34, 0.98), (19, 1.85, 5486.78),
+        (19, 4.97, 213.30), (17, 2.99, 6275.96), (16, 0.03, 2544.31),
+        (16, 1.43, 2146.17), (15, 1.21, 10977.08), (12, 2.83, 1748.02),
+        (12, 3.26, 5088.63), (12, 5.27, 1194.45), (12, 2.08, 4694.00),
+        (11, 0.77, 553.57), (10, 1.30, 6286.60), (10, 4.24, 1349.87),
+        (9, 2.70, 242.73), (9, 5.64, 951.72), (8, 5.30, 2352.87),
+        (6, 2.65, 9437.76), (6, 4.67, 4690.48),
+    ),
+    (  # τ^2
+        (52919, 0, 0), (8720, 1.0721, 6283.0758), (309, 0.867, 12566.152),
+        (27, 0.05, 3.52), (16, 5.19, 26.30), (16, 3.68, 155.42),
+        (10, 0.76, 18849.23), (9, 2.06, 77713.77), (7, 0.83, 775.52),
+        (5, 4.66, 1577.34), (4, 1.03, 7.11), (4, 3.44, 5573.14),
+        (3, 5.14, 796.30), (3, 6.05, 5507.55), (3, 1.19, 242.73),
+        (3, 6.12, 529.69), (3, 0.31, 398.15), (3, 2.28, 553.57),
+        (2, 4.38, 5223.69), (2, 3.75, 0.98),
+    ),
+    (  # τ^3
+        (289, 5.844, 6283.076), (35, 0, 0), (17, 5.49, 12566.15),
+        (3, 5.20, 155.42), (1, 4.72, 3.52), (1, 5.30, 18849.23),
+        (1, 5.97, 242.73),
+    ),
+    (  # τ^4
+        (114, 3.142, 0), (8, 4.13, 6283.08), (1, 3.84, 12566.15),
+    ),
+    (  # τ^5
+        (1, 3.14, 0),
+    ),
+)
+
+_EARTH_R = (
+    (  # τ^0
+        (100013989, 0, 0), (1670700, 3.0984635, 6283.0758500),
+        (13956, 3.05525, 12566.15170), (3084, 5.1985, 77713.7715),
+        (1628, 1.1739, 5753.3849), (1576, 2.8469, 7860.4194),
+        (925, 5.453, 11506.770), (542, 4.564, 3930.210),
+        (472, 3.661, 5884.927), (346, 0.964, 5507.553), (329, 5.900, 5223.694),
+        (307, 0.299, 5573.143), (243, 4.273, 11790.629),
+        (212, 5.847, 1577.344), (186, 5.022, 10977.079),
+        (175, 3.012, 18849.228), (110, 5.055, 5486.778), (98, 0.89, 6069.78),
+        (86, 5.69, 15720.84), (86, 1.27, 161000.69), (65, 0.27, 17260.15),
+        (63, 0.92, 529.69), (57, 2.01, 83996.85), (56, 5.24, 71430.70),
+        (49, 3.25, 2544.31), (47, 2.58, 775.52), (45, 5.54, 9437.76),
+        (43, 6.01, 6275.96), (39, 5.36, 4694.00), (38, 2.39, 8827.39),
+        (37, 0.83, 19651.05), (37, 4.90, 12139.55), (36, 1.67, 12036.46),
+        (35, 1.84, 2942.46), (33, 0.24, 7084.90), (32, 0.18, 5088.63),
+        (32, 1.78, 398.15), (28, 1.21, 6286.60), (28, 1.90, 6279.55),
+        (26, 4.59, 10447.39),
+    ),
+    (  # τ^1
+        (103019, 1.107490, 6283.075850), (1721, 1.0644, 12566.1517),
+        (702, 3.142, 0), (32, 1.02, 18849.23), (31, 2.84, 5507.55),
+        (25, 1.32, 5223.69), (18, 1.42, 1577.34), (10, 5.91, 10977.08),
+        (9, 1.42, 6275.96), (9, 0.27, 5486.78),
+    ),
+    (  # τ^2
+        (4359, 5.7846, 6283.0758), (124, 5.579, 12566.152), (12, 3.14, 0),
+        (9, 3.63, 77713.77), (6, 1.87, 5573.14), (3, 5.47, 18849.23),
+    ),
+    (  # τ^3
+        (145, 4.273, 6283.076), (7, 3.92, 12566.15),
+    ),
+    (  # τ^4
+        (4, 2.56, 6283.08),
+    ),
+)
+
+
+class _ScalarMath:
+    """The subset of the NumPy namespace the kernels use, for plain floats."""
+
+    pi = math.pi
+    sin = staticmethod(math.sin)
+    cos = staticmethod(math.cos)
+    floor = staticmethod(math.floor)
+    sqrt = staticmethod(math.sqrt)
+    arctan2 = staticmethod(math.atan2)
+
+    @staticmethod
+    def mod(a: float, b: float) -> float:
+        return a % b
+
+
+SCALAR = _ScalarMath()
+
+
+def delta_t(year: float) -> float:
+    """Approximate TT - UT in seconds (Espenak & Meeus polynomials)."""
+    if 1986 <= year < 2005:
+        t = year - 2000
+        return (
+            63.86 + 0.3345 * t - 0.060374 * t**2 + 0.0017275 * t**3
+            + 0.000651814 * t**4 + 0.00002373599 * t**5
+        )
+    if 2005 <= year < 2050:
+        t = year - 2000
+        return 62.92 + 0.32217 * t + 0.005589 * t**2
+    if 2050 <= year < 2150:
+        return -20 + 32 * ((year - 1820) / 100) ** 2 - 0.5628 * (2150 - year)
+    if 1920 <= year < 1986:
+        t = year - 1950
+        return 29.07 + 0.407 * t - t**2 / 233 + t**3 / 2547
+    return -20 + 32 * ((year - 1820) / 100) ** 2
+
+
+# ── Kernels ─────────────────────────────────────────────────────────
+
+
+def centuries_from_timestamp(ts, xp=SCALAR):
+    """Julian centuries since J2000.0 for POSIX timestamps."""
+    return (ts / 86400.0 + UNIX_EPOCH_JD - J2000_JD) / 36525
+
+
+def mean_longitude(T, planet: Planet, xp=SCALAR):
+    """Mean ecliptic longitude in degrees for Julian centuries ``T``."""
+    return xp.mod(
+        planet.L0 + planet.rate * T + planet.L1 * T * T, 360.0
+    )
+
+
+def heliocentric_xy(T, elements: Sequence[float], xp=SCALAR):
+    """Heliocentric ecliptic x, y (AU, J2000 frame) from Keplerian elements."""
+    a = elements[0] + elements[1] * T
+    e = elements[2] + elements[3] * T
+    inc = (elements[4] + elements[5] * T) * _DEG
+    L = elements[6] + elements[7] * T
+    peri = elements[8] + elements[9] * T
+    node = (elements[10] + elements[11] * T) * _DEG
+
+    M = (xp.mod(L - peri + 180, 360.0) - 180) * _DEG
+    E = M + e * xp.sin(M)
+    for _ in range(_KEPLER_ITERATIONS):
+        E = E - (E - e * xp.sin(E) - M) / (1 - e * xp.cos(E))
+
+    xo = a * (xp.cos(E) - e)
+    yo = a * xp.sqrt(1 - e * e) * xp.sin(E)
+
+    w = peri * _DEG - node
+    cw, sw = xp.cos(w), xp.sin(w)
+    cn, sn = xp.cos(node), xp.sin(node)
+    ci = xp.cos(inc)
+    x = (cw * cn - sw * sn * ci) * xo + (-sw * cn - cw * sn * ci) * yo
+    y = (cw * sn + sw * cn * ci) * xo + (-sw * sn + cw * cn * ci) * yo
+    return x, y
+
+
+def body_longitude(T, planet: Planet, xp=SCALAR):
+    """Geocentric ecliptic longitude in degrees of a body from ``PLANETS``.
+
+    This is the model behind the planet sensors, sign ingresses, stations
+    and the batch API.
+    """
+    model = planet.model
+    if model == "mean":
+        return mean_longitude(T, planet, xp=xp)
+
+    ex, ey = heliocentric_xy(T, EARTH_ELEMENTS, xp=xp)
+    if model == "sun":
+        dx, dy = -ex, -ey
+    else:
+        px, py = heliocentric_xy(T, planet.elements, xp=xp)
+        dx, dy = px - ex, py - ey
+    return xp.mod(xp.arctan2(dy, dx) / _DEG + _PRECESSION * T, 360.0)
+
+
+def sun_apparent_longitude(T, xp=SCALAR):
+    """Apparent geocentric longitude of the Sun in degrees (~0.01°)."""
+    L0 = 280.46646 + 36000.76983 * T + 0.0003032 * T * T
+    M = (357.52911 + 35999.05029 * T - 0.0001537 * T * T) * _DEG
+    C = (
+        (1.914602 - 0.004817 * T - 0.000014 * T * T) * xp.sin(M)
+        + (0.019993 - 0.000101 * T) * xp.sin(2 * M)
+        + 0.000289 * xp.sin(3 * M)
+    )
+    omega = (125.04 - 1934.136 * T) * _DEG
+    return xp.mod(L0 + C - 0.00569 - 0.00478 * xp.sin(omega), 360.0)
+
+
+def moon_apparent_longitude(T, xp=SCALAR):
+    """Apparent geocentric longitude of the Moon in degrees.
+
+    Truncated ELP-2000/82 theory as tabulated by Meeus (about 10" accuracy).
+    """
+    omega = (125.04452 - 1934.136261 * T) * _DEG
+    return xp.mod(
+        moon_true_longitude(T, _MOON_LONGITUDE_TERMS, xp=xp)
+        - 0.00478 * xp.sin(omega),
+        360.0,
+    )
+
+
+def moon_true_longitude(T, terms: Sequence[tuple], xp=SCALAR):
+    """Geometric longitude of the Moon in degrees, without nutation.
+
+    ``terms`` is ``_MOON_LONGITUDE_TERMS`` or a truncation of it.
+    """
+    T2 = T * T
+    T3 = T2 * T
+    T4 = T3 * T
+    Lp = (
+        218.3164477 + 481267.88123421 * T - 0.0015786 * T2
+        + T3 / 538841 - T4 / 65194000
+    )
+    D = (
+        297.8501921 + 445267.1114034 * T - 0.0018819 * T2
+        + T3 / 545868 - T4 / 113065000
+    ) * _DEG
+    M = (357.5291092 + 35999.0502909 * T - 0.0001536 * T2 + T3 / 24490000) * _DEG
+    Mp = (
+        134.9633964 + 477198.8675055 * T + 0.0087414 * T2
+        + T3 / 69699 - T4 / 14712000
+    ) * _DEG
+    F = (
+        93.2720950 + 483202.0175233 * T - 0.0036539 * T2
+        - T3 / 3526000 + T4 / 863310000
+    ) * _DEG
+    E = 1 - 0.002516 * T - 0.0000074 * T2
+
+    total = 0.0
+    for d, m, mp, f, amp in terms:
+        term = amp * xp.sin(d * D + m * M + mp * Mp + f * F)
+        if m:
+            term = term * E ** abs(m)
+        total = total + term
+
+    A1 = (119.75 + 131.849 * T) * _DEG
+    A2 = (53.09 + 479264.290 * T) * _DEG
+    total = (
+        total
+        + 3958 * xp.sin(A1)
+        + 1962 * xp.sin(Lp * _DEG - F)
+        + 318 * xp.sin(A2)
+    )
+    return Lp + total / 1e6
+
+
+def moon_elongation(T, xp=SCALAR):
+    """Moon's longitude minus the Sun's, 0..360 (0=new, 180=full)."""
+    return xp.mod(
+        moon_apparent_longitude(T, xp=xp) - sun_apparent_longitude(T, xp=xp),
+        360.0,
+    )
+
+
+def lunation_fraction(ts, xp=SCALAR):
+    """Moon phase as 0..1 (0=new, 0.5=full) for POSIX timestamps."""
+    lunations = (ts - _KNOWN_NEW_MOON_TS) / 86400 / SYNODIC_MONTH
+    return lunations - xp.floor(lunations)
+
+
+def illumination(phase, xp=SCALAR):
+    """Illuminated fraction of the Moon in percent for a 0..1 phase."""
+    return (1 - xp.cos(phase * 2 * xp.pi)) / 2 * 100
+
+
+def sign_index(longitude, xp=SCALAR):
+    """Zodiac sign index (0=Aries) for ecliptic longitudes in degrees."""
+    return xp.mod(xp.floor(longitude / 30), 12)
+
+
+def lunar_aspect_angle(T, planet: Planet, xp=SCALAR):
+    """Angle in degrees (0..360) the Moon stands east of another body.
+
+    Both longitudes come from ``body_longitude``. The Moon outpaces every
+    other body, so the angle only ever increases.
+    """
+    return xp.mod(
+        body_longitude(T, _MOON, xp=xp) - body_longitude(T, planet, xp=xp), 360.0
+    )
+
+
+# ── Precise tier kernels ────────────────────────────────────────────
+
+
+def nutation_longitude(T, xp=SCALAR):
+    """Nutation in longitude in degrees (Meeus ch. 22, about 0.5\")."""
+    omega = (125.04452 - 1934.136261 * T) * _DEG
+    L = (280.4665 + 36000.7698 * T) * _DEG
+    Lp = (218.3165 + 481267.8813 * T) * _DEG
+    return (
+        -17.20 * xp.sin(omega) - 1.32 * xp.sin(2 * L)
+        - 0.23 * xp.sin(2 * Lp) + 0.21 * xp.sin(2 * omega)
+    ) / 3600
+
+
+def vsop_series(tau, series: Sequence[Sequence[tuple]], xp=SCALAR):
+    """Sum a VSOP87 series at ``tau`` Julian millennia (units of 1e-8)."""
+    total = 0.0
+    power = 1.0
+    for terms in series:
+        partial = 0.0
+        for a, b, c in terms:
+            partial = partial + a * xp.cos(b + c * tau)
+        total = total + partial * power
+        power = power * tau
+    return total / 1e8
+
+
+def precise_longitude(T, planet: Planet, theory: PreciseTheory, xp=SCALAR):
+    """Apparent geocentric longitude in degrees for the precise tier.
+
+    ``T`` is in Julian centuries of Terrestrial Time.  The Sun comes from
+    VSOP87 for the Earth and the Moon from the ELP-2000/82 series, both
+    truncated to ``theory``; both get nutation and aberration.  Planets are
+    still Keplerian orbits, but are seen from the VSOP87 Earth with
+    light-time, precession to the equinox of date, nutation and aberration.
+    """
+    dpsi = nutation_longitude(T, xp=xp)
+    if planet.model == "mean":
+        return xp.mod(
+            moon_true_longitude(T, theory.moon_longitude, xp=xp) + dpsi, 360.0
+        )
+
+    tau = T / 10
+    earth_l = vsop_series(tau, theory.earth_longitude, xp=xp)
+    earth_r = vsop_series(tau, theory.earth_radius, xp=xp)
+    sun = earth_l / _DEG + 180
+    if planet.model == "sun":
+        return xp.mod(sun + dpsi - _ABERRATION / 3600 / earth_r, 360.0)
+
+    ex, ey = earth_r * xp.cos(earth_l), earth_r * xp.sin(earth_l)
+    precession = _PRECESSION * T * _DEG
+    cp, sp = xp.cos(precession), xp.sin(precession)
+    elements = planet.elements
+    # One light-time iteration is plenty at arc-second level.
+    t = T
+    for _ in range(2):
+        px, py = heliocentric_xy(t, elements, xp=xp)
+        dx = px * cp - py * sp - ex
+        dy = px * sp + py * cp - ey
+        t = T - _LIGHT_TIME_DAYS_PER_AU * xp.sqrt(dx * dx + dy * dy) / 36525
+    lon = xp.arctan2(dy, dx) / _DEG
+    aberration = -_ABERRATION * xp.cos((sun - lon) * _DEG) / 3600
+    return xp.mod(lon + dpsi + aberration, 360.0)
+
+
+# ── Batch API ───────────────────────────────────────────────────────
+
+
+@dataclass(frozen=True)
+class EphemerisBatch:
+    """Ephemeris columns for a series of instants.
+
+    Every column holds one value per timestamp.  Columns are NumPy arrays
+    when NumPy is available and lists otherwise.
+    """
+
+    timestamps: Sequence[float]
+    jd: Sequence[float]
+    longitude: Mapping[str, Sequence[float]]
+    sign_index: Mapping[str, Sequence[int]]
+    moon_phase: Sequence[float]
+    illumination: Sequence[float]
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    def datetimes(self) -> list[datetime]:
+        """Return the sample instants as UTC datetimes."""
+        return [
+            datetime.fromtimestamp(float(ts), tz=timezone.utc)
+            for ts in self.timestamps
+        ]
+
+
+def _timestamp(dt: datetime | float) -> float:
+    if isinstance(dt, datetime):
+        return (dt if dt.tzinfo else dt.replace(tzinfo=timezone.utc)).timestamp()
+    return float(dt)
+
+
+def column(kernel, values, *args):
+    """Evaluate an elementwise kernel over a column of values."""
+    if np is not None:
+        return kernel(np.asarray(values, dtype=float), *args, xp=np)
+    return [kernel(v, *args) for v in values]
+
+
+def int_column(values):
+    if np is not None:
+        return values.astype(np.int64)
+    return [int(v) for v in values]
+
+
+def compute_batch(times: Iterable[datetime | float]) -> EphemerisBatch:
+    """Compute the ephemeris for many instants in one pass.
+
+    ``times`` may contain datetimes (naive values are treated as UTC) or
+    POSIX timestamps.
+    """
+    stamps = [_timestamp(t) for t in times]
+    if np is not None:
+        stamps = np.asarray(stamps, dtype=float)
+    return _compute(stamps)
+
+
+def compute_range(
+    start: datetime, stop: datetime, step: timedelta
+) -> EphemerisBatch:
+    """Compute the ephemeris from ``start`` up to (excluding) ``stop``."""
+    t0 = _timestamp(start)
+    t1 = _timestamp(stop)
+    dt = step.total_seconds()
+    if dt <= 0:
+        raise ValueError("step must be positive")
+
+    count = max(0, math.ceil((t1 - t0) / dt))
+    if np is not None:
+        stamps = t0 + dt * np.arange(count, dtype=float)
+    else:
+        stamps = [t0 + dt * i for i in range(count)]
+    return _compute(stamps)
+
+
+def _compute(stamps) -> EphemerisBatch:
+    T = column(centuries_from_timestamp, stamps)
+    if np is not None:
+        jd = stamps / 86400.0 + UNIX_EPOCH_JD
+    else:
+        jd = [ts / 86400.0 + UNIX_EPOCH_JD for ts in stamps]
+
+    longitude = {}
+    signs = {}
+    for planet in PLANETS:
+        lon = column(body_longitude, T, planet)
+        longitude[planet.name] = lon
+        signs[planet.name] = int_column(column(sign_index, lon))
+
+    phase = column(lunation_fraction, stamps)
+    return EphemerisBatch(
+        timestamps=stamps,
+        jd=jd,
+        longitude=longitude,
+        sign_index=signs,
+        moon_phase=phase,
+        illumination=column(illumination, phase),
+    )
+
+
+# ── Precise tier ────────────────────────────────────────────────────
+
+# The series are truncated for 1900–2100, i.e. |τ| <= 0.1 millennia.
+_TAU_MAX = 0.1
+_ARCSEC = _DEG / 3600
+
+# Samples per day for the cached cubic; longitudes between them are
+# interpolated.  Even the Moon stays well under an arc-second.
+_DAY_NODES = (0.0, 1 / 3, 2 / 3, 1.0)
+
+
+@dataclass(frozen=True)
+class PreciseTheory:
+    """Series truncated so the dropped terms stay under a target error."""
+
+    target_arcsec: float
+    earth_longitude: tuple[tuple[tuple[float, float, float], ...], ...]
+    earth_radius: tuple[tuple[tuple[float, float, float], ...], ...]
+    moon_longitude: tuple[tuple[int, int, int, int, int], ...]
+
+    @property
+    def term_count(self) -> int:
+        return (
+            sum(len(terms) for terms in self.earth_longitude)
+            + sum(len(terms) for terms in self.earth_radius)
+            + len(self.moon_longitude)
+        )
+
+
+def _truncate(terms: Sequence[tuple], amplitude, budget: float) -> tuple:
+    """Drop the smallest terms while their summed amplitude fits ``budget``.
+
+    The summed amplitude bounds the error the dropped terms can cause.
+    Term order is preserved.
+    """
+    dropped = set()
+    spent = 0.0
+    for i in sorted(range(len(terms)), key=lambda i: amplitude(terms[i])):
+        spent += amplitude(terms[i])
+        if spent > budget:
+            break
+        dropped.add(i)
+    return tuple(t for i, t in enumerate(terms) if i not in dropped)
+
+
+def _truncate_vsop(series, budget: float) -> tuple:
+    # Split the budget evenly over the powers of τ; a term of power n can
+    # contribute at most A·τmax^n.
+    share = budget / len(series)
+    return tuple(
+        _truncate(terms, lambda t, n=n: abs(t[0]) * _TAU_MAX**n, share)
+        for n, terms in enumerate(series)
+    )
+
+
+@lru_cache(maxsize=8)
+def precise_theory(target_arcsec: float) -> PreciseTheory:
+    """Return the series truncated to roughly ``target_arcsec`` of error.
+
+    The budget bounds the truncation error only; it is relative to the
+    full tables above, which carry their own small error (about 1" for
+    the Sun, about 10" for the Moon).  A target of 0 keeps every term.
+    """
+    budget_1e8 = target_arcsec * _ARCSEC * 1e8
+    return PreciseTheory(
+        target_arcsec=target_arcsec,
+        earth_longitude=_truncate_vsop(_EARTH_L, budget_1e8),
+        # An error δR in the Earth's distance moves a planet by up to
+        # δR/Δ; Δ can be as small as about 0.5 AU (Mars at opposition).
+        earth_radius=_truncate_vsop(_EARTH_R, budget_1e8 * 0.5),
+        moon_longitude=_truncate(
+            _MOON_LONGITUDE_TERMS, lambda t: abs(t[4]), target_arcsec / 3600 * 1e6
+        ),
+    )
+
+
+def _cubic_basis(nodes: Sequence[float]) -> tuple[tuple[float, ...], ...]:
+    """Power-basis coefficients of the Lagrange polynomials for ``nodes``."""
+    basis = []
+    for i, xi in enumerate(nodes):
+        poly = [1.0]
+        denom = 1.0
+        for j, xj in enumerate(nodes):
+            if j == i:
+                continue
+            # Multiply poly by (x - xj).
+            poly = [
+                (poly[k - 1] if k > 0 else 0.0)
+                - xj * (poly[k] if k < len(poly) else 0.0)
+                for k in range(len(poly) + 1)
+            ]
+            denom *= xi - xj
+        basis.append(tuple(c / denom for c in poly))
+    return tuple(basis)
+
+
+_CUBIC_BASIS = _cubic_basis(_DAY_NODES)
+
+
+@lru_cache(maxsize=4)
+def precise_day_coefficients(
+    day: int, target_arcsec: float
+) -> dict[str, tuple[float, ...]]:
+    """Cubic longitude coefficients per body over one UTC day.
+
+    ``day`` counts days since the Unix epoch.  Each body is evaluated at
+    four instants; every other tick of that day is a cubic in the fraction
+    of the day, so the precise tier costs little more than the fast one.
+    """
+    theory = precise_theory(target_arcsec)
+    start = day * 86400.0
+    dt_offset = delta_t(1970 + (day + 0.5) / 365.2425)
+    coefficients = {}
+    for planet in PLANETS:
+        samples = []
+        for u in _DAY_NODES:
+            T = centuries_from_timestamp(start + u * 86400 + dt_offset)
+            lon = precise_longitude(T, planet, theory)
+            if samples:
+                # Unwrap across 0°/360° so the cubic stays continuous.
+                lon = samples[-1] + (lon - samples[-1] + 180) % 360 - 180
+            samples.append(lon)
+        coefficients[planet.name] = tuple(
+            sum(y * basis[k] for y, basis in zip(samples, _CUBIC_BASIS))
+            for k in range(len(_DAY_NODES))
+        )
+    return coefficients
+
+
+def precise_longitudes(ts: float, target_arcsec: float) -> dict[str, float]:
+    """Apparent geocentric longitudes of every body at a POSIX timestamp."""
+    day = math.floor(ts / 86400)
+    u = ts / 86400 - day
+    return {
+        name: (c0 + u * (c1 + u * (c2 + u * c3))) % 360
+        for name, (c0, c1, c2, c3) in precise_day_coefficients(
+            day, target_arcsec
+        ).items()
+    }
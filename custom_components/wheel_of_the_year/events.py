@@ -0,0 +1,515 @@
+"""Exact astronomical event finders for the Wheel of the Year.
+
+Events are located by root-finding on the ephemeris kernels and collected
+into sorted per-year indexes.  The indexes are memoized, so looking up the
+next or previous event is a binary search rather than a fresh search.
+"""
+
+from __future__ import annotations
+
+import math
+from bisect import bisect_right
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Callable, NamedTuple
+
+from .const import PLANETS, Planet
+from .ephemeris import (
+    KNOWN_NEW_MOON,
+    SYNODIC_MONTH,
+    body_longitude,
+    centuries_from_timestamp,
+    column,
+    delta_t,
+    int_column,
+    lunar_aspect_angle,
+    moon_elongation,
+    sign_index,
+    sun_apparent_longitude,
+)
+
+NEW_MOON = 0
+FIRST_QUARTER = 1
+FULL_MOON = 2
+LAST_QUARTER = 3
+
+PHASE_NAMES = ("New Moon", "First Quarter", "Full Moon", "Third Quarter")
+
+_DAY = 86400.0
+_KNOWN_NEW_MOON_TS = KNOWN_NEW_MOON.timestamp()
+
+
+class PhaseEvent(NamedTuple):
+    """A primary lunar phase at an exact instant."""
+
+    time: datetime
+    quarter: int
+
+    @property
+    def name(self) -> str:
+        return PHASE_NAMES[self.quarter]
+
+
+def _wrap180(deg: float) -> float:
+    """Wrap an angle difference into -180..180."""
+    return (deg + 180) % 360 - 180
+
+
+def find_root(
+    f: Callable[[float], float], a: float, b: float, tol: float = 1.0
+) -> float:
+    """Locate a sign change of ``f`` in ``[a, b]`` to within ``tol``.
+
+    Uses the Illinois variant of regula falsi, which keeps the root
+    bracketed like bisection but converges superlinearly on the smooth
+    functions found here.
+    """
+    fa = f(a)
+    fb = f(b)
+    if fa == 0:
+        return a
+    if fb == 0:
+        return b
+    if (fa < 0) == (fb < 0):
+        raise ValueError("root is not bracketed")
+
+    side = 0
+    while b - a > tol:
+        c = (a * fb - b * fa) / (fb - fa)
+        if not a < c < b:
+            c = (a + b) / 2
+        fc = f(c)
+        if fc == 0:
+            return c
+        if (fc < 0) == (fb < 0):
+            b, fb = c, fc
+            if side == -1:
+                fa /= 2
+            side = -1
+        else:
+            a, fa = c, fc
+            if side == 1:
+                fb /= 2
+            side = 1
+    return (a + b) / 2
+
+
+def _year_bounds(year: int) -> tuple[float, float]:
+    start = datetime(year, 1, 1, tzinfo=timezone.utc).timestamp()
+    end = datetime(year + 1, 1, 1, tzinfo=timezone.utc).timestamp()
+    return start, end
+
+
+# ── Solar longitude crossings ───────────────────────────────────────
+
+# Mean daily motion of the Sun in degrees.
+_SUN_DAILY_MOTION = 360 / 365.2422
+
+
+@lru_cache(maxsize=16)
+def solar_longitude_index(
+    year: int, step: int
+) -> tuple[tuple[float, ...], tuple[int, ...]]:
+    """Return sorted timestamps at which the Sun reaches each multiple of ``step``.
+
+    The second tuple holds the matching longitudes in degrees.  The year is
+    a UTC calendar year.
+    """
+    start, end = _year_bounds(year)
+    dt_offset = delta_t(year + 0.5)
+    lon_start = sun_apparent_longitude(centuries_from_timestamp(start + dt_offset))
+
+    crossings = []
+    for longitude in range(0, 360, step):
+
+        def f(ts: float, target: float = longitude) -> float:
+            T = centuries_from_timestamp(ts + dt_offset)
+            return _wrap180(sun_apparent_longitude(T) - target)
+
+        days = ((longitude - lon_start) % 360) / _SUN_DAILY_MOTION
+        # The equation of centre keeps the true Sun within ~2.5 days of
+        # the mean Sun.
+        for guess in (start + days * _DAY, start + (days - 365.2422) * _DAY):
+            ts = find_root(f, guess - 4 * _DAY, guess + 4 * _DAY)
+            if start <= ts < end:
+                crossings.append((ts, longitude))
+
+    crossings.sort()
+    return (
+        tuple(ts for ts, _ in crossings),
+        tuple(lon for _, lon in crossings),
+    )
+
+
+def solar_longitude_time(year: int, longitude: int, step: int = 45) -> datetime:
+    """Return the instant in ``year`` the Sun reaches ``longitude``."""
+    times, longitudes = solar_longitude_index(year, step)
+    return datetime.fromtimestamp(
+        times[longitudes.index(longitude)], tz=timezone.utc
+    )
+
+
+# ── Sign ingresses ───────────────────────────────────────────────────
+
+# Coarse scan step per body, short enough that no body can cross more
+# than one sign boundary between two samples.
+_INGRESS_SCAN_STEP = {"Moon": 0.25 * _DAY}
+_DEFAULT_INGRESS_SCAN_STEP = _DAY
+
+
+def _body_crossings(
+    planet: Planet, start: float, end: float, step: float
+) -> list[tuple[float, int]]:
+    """Return ``(timestamp, sign_index)`` for each ingress of one body."""
+    count = math.ceil((end - start) / step) + 1
+    stamps = [start + i * step for i in range(count)]
+    T = column(centuries_from_timestamp, stamps)
+    signs = list(int_column(column(sign_index, column(body_longitude, T, planet))))
+
+    def lon_at(ts: float) -> float:
+        return body_longitude(centuries_from_timestamp(ts), planet)
+
+    crossings = []
+    for i in range(1, count):
+        before, after = signs[i - 1], signs[i]
+        if before == after:
+            continue
+        # Direct motion crosses into ``after``; retrograde motion crosses
+        # back over the start of ``before``.
+        boundary = 30 * (after if (after - before) % 12 == 1 else before)
+        ts = find_root(
+            lambda t: _wrap180(lon_at(t) - boundary), stamps[i - 1], stamps[i]
+        )
+        crossings.append((ts, after))
+    return crossings
+
+
+@lru_cache(maxsize=8)
+def sign_ingress_index(
+    year: int,
+) -> tuple[tuple[float, ...], tuple[str, ...], tuple[int, ...]]:
+    """Return sorted timestamps, body names and new sign indexes of every
+    sign ingress in a UTC year.
+    """
+    start, end = _year_bounds(year)
+    events = []
+    for planet in PLANETS:
+        step = _INGRESS_SCAN_STEP.get(planet.name, _DEFAULT_INGRESS_SCAN_STEP)
+        for ts, sign in _body_crossings(planet, start, end, step):
+            if ts < end:
+                events.append((ts, planet.name, sign))
+
+    events.sort()
+    return (
+        tuple(e[0] for e in events),
+        tuple(e[1] for e in events),
+        tuple(e[2] for e in events),
+    )
+
+
+def next_ingress(dt: datetime) -> datetime:
+    """Return the next instant any body enters a new sign."""
+    ts = _timestamp(dt)
+    year = datetime.fromtimestamp(ts, tz=timezone.utc).year
+    while True:
+        times = sign_ingress_index(year)[0]
+        i = bisect_right(times, ts)
+        if i < len(times):
+            return datetime.fromtimestamp(times[i], tz=timezone.utc)
+        year += 1
+
+
+# ── Retrograde stations ──────────────────────────────────────────────
+
+STATION_RETROGRADE = "retrograde"
+STATION_DIRECT = "direct"
+
+# Bodies that can appear to stand still; the Sun and Moon never do.
+STATION_BODIES = tuple(p for p in PLANETS if p.model == "kepler")
+
+# Mars goes longest between stations, a little over two years.
+_MAX_STATION_SEARCH_YEARS = 3
+
+_STATION_SPEED_STEP = 3600.0
+
+
+class StationEvent(NamedTuple):
+    """A planet standing still before turning retrograde or direct."""
+
+    time: datetime
+    station_type: str
+
+
+def _speed(planet: Planet, ts: float) -> float:
+    """Apparent motion in degrees per day, by central difference."""
+    h = _STATION_SPEED_STEP
+    ahead = body_longitude(centuries_from_timestamp(ts + h), planet)
+    behind = body_longitude(centuries_from_timestamp(ts - h), planet)
+    return _wrap180(ahead - behind) * _DAY / (2 * h)
+
+
+@lru_cache(maxsize=8)
+def station_index(
+    year: int,
+) -> dict[str, tuple[tuple[float, ...], tuple[str, ...]]]:
+    """Return each planet's sorted station timestamps and types in a UTC year.
+
+    Longitudes are scanned a day apart in one vectorized pass; each change
+    in the direction of motion is then refined by root-finding on the
+    planet's speed.
+    """
+    start, end = _year_bounds(year)
+    count = math.ceil((end - start) / _DAY) + 3
+    stamps = [start + (i - 1) * _DAY for i in range(count)]
+    T = column(centuries_from_timestamp, stamps)
+
+    table = {}
+    for planet in STATION_BODIES:
+        lon = list(column(body_longitude, T, planet))
+        motion = [_wrap180(b - a) for a, b in zip(lon, lon[1:])]
+        times: list[float] = []
+        types: list[str] = []
+        for i in range(1, len(motion)):
+            if (motion[i - 1] < 0) == (motion[i] < 0):
+                continue
+            ts = find_root(
+                lambda t: _speed(planet, t), stamps[i - 1], stamps[i + 1], 60.0
+            )
+            if start <= ts < end:
+                times.append(ts)
+                types.append(
+                    STATION_RETROGRADE if motion[i - 1] > 0 else STATION_DIRECT
+                )
+        table[planet.name] = (tuple(times), tuple(types))
+    return table
+
+
+def next_station(dt: datetime, name: str | None = None) -> StationEvent | None:
+    """Return the next station of planet ``name``, or of any planet."""
+    ts = _timestamp(dt)
+    year = datetime.fromtimestamp(ts, tz=timezone.utc).year
+    for offset in range(_MAX_STATION_SEARCH_YEARS + 1):
+        best = None
+        for body, (times, types) in station_index(year + offset).items():
+            if name is not None and body != name:
+                continue
+            i = bisect_right(times, ts)
+            if i < len(times) and (best is None or times[i] < best[0]):
+                best = (times[i], types[i])
+        if best is not None:
+            return StationEvent(
+                datetime.fromtimestamp(best[0], tz=timezone.utc), best[1]
+            )
+    return None
+
+
+# ── Lunar phases ─────────────────────────────────────────────────────
+
+
+def _solve_phase(guess: float, quarter: int, dt_offset: float) -> float:
+    """Refine a mean-phase estimate to the exact UTC timestamp."""
+    target = quarter * 90.0
+
+    def f(ts: float) -> float:
+        T = centuries_from_timestamp(ts + dt_offset)
+        return _wrap180(moon_elongation(T) - target)
+
+    # The true phase is within about 15 hours of the mean phase.
+    return find_root(f, guess - 2 * _DAY, guess + 2 * _DAY)
+
+
+@lru_cache(maxsize=8)
+def lunar_phase_index(year: int) -> tuple[tuple[float, ...], tuple[int, ...]]:
+    """Return sorted timestamps and quarters of every primary phase in a year.
+
+    The year is a UTC calendar year.
+    """
+    start, end = _year_bounds(year)
+    dt_offset = delta_t(year + 0.5)
+
+    k = math.floor((start - _KNOWN_NEW_MOON_TS) / _DAY / SYNODIC_MONTH) - 1
+    times: list[float] = []
+    quarters: list[int] = []
+    while True:
+        for quarter in range(4):
+            guess = _KNOWN_NEW_MOON_TS + (k + quarter / 4) * SYNODIC_MONTH * _DAY
+            ts = _solve_phase(guess, quarter, dt_offset)
+            if start <= ts < end:
+                times.append(ts)
+                quarters.append(quarter)
+        k += 1
+        if _KNOWN_NEW_MOON_TS + k * SYNODIC_MONTH * _DAY > end + 2 * _DAY:
+            break
+    return tuple(times), tuple(quarters)
+
+
+def _timestamp(dt: datetime) -> float:
+    return (dt if dt.tzinfo else dt.replace(tzinfo=timezone.utc)).timestamp()
+
+
+def next_phase_event(dt: datetime, quarter: int | None = None) -> PhaseEvent:
+    """Return the first primary phase strictly after ``dt``.
+
+    With ``quarter`` set, only phases of that kind are considered.
+    """
+    ts = _timestamp(dt)
+    year = datetime.fromtimestamp(ts, tz=timezone.utc).year
+    while True:
+        times, quarters = lunar_phase_index(year)
+        i = bisect_right(times, ts)
+        while i < len(times):
+            if quarter is None or quarters[i] == quarter:
+                return PhaseEvent(
+                    datetime.fromtimestamp(times[i], tz=timezone.utc), quarters[i]
+                )
+            i += 1
+        year += 1
+
+
+def previous_phase_event(dt: datetime, quarter: int | None = None) -> PhaseEvent:
+    """Return the last primary phase at or before ``dt``."""
+    ts = _timestamp(dt)
+    year = datetime.fromtimestamp(ts, tz=timezone.utc).year
+    while True:
+        times, quarters = lunar_phase_index(year)
+        i = bisect_right(times, ts) - 1
+        while i >= 0:
+            if quarter is None or quarters[i] == quarter:
+                return PhaseEvent(
+                    datetime.fromtimestamp(times[i], tz=timezone.utc), quarters[i]
+                )
+            i -= 1
+        year -= 1
+
+
+# ── Void-of-course Moon ──────────────────────────────────────────────
+
+_MOON = next(p for p in PLANETS if p.name == "Moon")
+# Bodies whose aspects end a void-of-course period: all but the Moon.
+_ASPECTED_BODIES = tuple(p for p in PLANETS if p is not _MOON)
+# The major aspects (conjunction, sextile, square, trine, opposition and
+# their mirrors) all fall on 30° boundaries, so an aspect is the Moon's
+# angle from a body entering one of these 30° sectors.
+_MAJOR_ASPECT_SECTORS = frozenset({0, 2, 3, 4, 6, 8, 9, 10})
+# Short enough that the angle cannot cross two sector boundaries between
+# samples, as with Moon ingresses.
+_VOC_SCAN_STEP = _INGRESS_SCAN_STEP["Moon"]
+# Longer than the Moon spends in a sign, so the ingress that opens the
+# first period ending in a month is found.
+_VOC_PADDING = 3 * _DAY
+
+
+class VoidPeriod(NamedTuple):
+    """A void-of-course Moon period, from its last aspect to its ingress."""
+
+    start: datetime
+    end: datetime
+
+
+def _month_bounds(year: int, month: int) -> tuple[float, float]:
+    start = datetime(year, month, 1, tzinfo=timezone.utc).timestamp()
+    year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+    end = datetime(year, month, 1, tzinfo=timezone.utc).timestamp()
+    return start, end
+
+
+def _aspect_times(planet: Planet, stamps: list[float], T) -> list[float]:
+    """Return each instant the Moon completes a major aspect to one body."""
+    sectors = list(
+        int_column(column(sign_index, column(lunar_aspect_angle, T, planet)))
+    )
+
+    def angle_at(ts: float) -> float:
+        return lunar_aspect_angle(centuries_from_timestamp(ts), planet)
+
+    times = []
+    for i in range(1, len(stamps)):
+        after = sectors[i]
+        if after == sectors[i - 1] or after not in _MAJOR_ASPECT_SECTORS:
+            continue
+        # The angle only increases, so the boundary crossed opens ``after``.
+        boundary = 30 * after
+        times.append(
+            find_root(
+                lambda t: _wrap180(angle_at(t) - boundary), stamps[i - 1], stamps[i]
+            )
+        )
+    return times
+
+
+@lru_cache(maxsize=24)
+def void_of_course_index(
+    year: int, month: int
+) -> tuple[tuple[float, ...], tuple[float, ...]]:
+    """Return sorted start and end timestamps of the void-of-course periods
+    that end in a UTC month.
+
+    The Moon is void of course from its last major aspect to any other body
+    until it enters the next sign; a sign it makes no aspect in is void
+    throughout. Positions for every body are sampled in one vectorized pass
+    over the month before any root is refined.
+    """
+    start, end = _month_bounds(year, month)
+    ingresses = [
+        ts
+        for ts, _ in _body_crossings(
+            _MOON, start - _VOC_PADDING, end, _VOC_SCAN_STEP
+        )
+        if ts < end
+    ]
+
+    first, last = ingresses[0], ingresses[-1]
+    count = math.ceil((last - first) / _VOC_SCAN_STEP) + 1
+    stamps = [first + i * _VOC_SCAN_STEP for i in range(count)]
+    T = column(centuries_from_timestamp, stamps)
+    aspects = sorted(
+        ts for planet in _ASPECTED_BODIES for ts in _aspect_times(planet, stamps, T)
+    )
+
+    starts: list[float] = []
+    ends: list[float] = []
+    for entered, leaves in zip(ingresses, ingresses[1:]):
+        if leaves < start:
+            continue
+        i = bisect_right(aspects, leaves) - 1
+        starts.append(aspects[i] if i >= 0 and aspects[i] >= entered else entered)
+        ends.append(leaves)
+    return tuple(starts), tuple(ends)
+
+
+def void_of_course_period(dt: datetime) -> VoidPeriod:
+    """Return the void-of-course period in progress at ``dt``, or the next."""
+    ts = _timestamp(dt)
+    when = datetime.fromtimestamp(ts, tz=timezone.utc)
+    year, month = when.year, when.month
+    while True:
+        starts, ends = void_of_course_index(year, month)
+        i = bisect_right(ends, ts)
+        if i < len(ends):
+            return VoidPeriod(
+                datetime.fromtimestamp(starts[i], tz=timezone.utc),
+                datetime.fromtimestamp(ends[i], tz=timezone.utc),
+            )
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+
+
+# ── Precomputation ───────────────────────────────────────────────────
+
+
+def prewarm(year: int) -> None:
+    """Build every per-year table that lookups during ``year`` read.
+
+    Lookups near the turn of the year reach into the neighbouring years,
+    and station searches look further ahead, so those are built too.
+    Once warm, every lookup is a bisect and cheap enough for the event loop.
+    """
+    for y in (year - 1, year, year + 1):
+        solar_longitude_index(y, 45)
+        lunar_phase_index(y)
+        sign_ingress_index(y)
+        station_index(y)
+    station_index(year + 2)
+    # Void-of-course lookups late in December reach into January.
+    for month in range(1, 13):
+        void_of_course_index(year, month)
+    void_of_course_index(year + 1, 1)
@@ -0,0 +1,82 @@
+"""Lightweight timing and cache counters for the Wheel of the Year."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any
+
+from . import events, sky, timeline
+
+# Modules whose lru-cached tables are reported.
+_CACHED_MODULES = (events, sky, timeline)
+
+
+@dataclass
+class Timing:
+    """Running duration statistics for one recurring operation."""
+
+    count: int = 0
+    last_ms: float = 0.0
+    max_ms: float = 0.0
+    total_ms: float = 0.0
+
+    def record(self, seconds: float) -> None:
+        ms = seconds * 1000
+        self.count += 1
+        self.last_ms = ms
+        self.max_ms = max(self.max_ms, ms)
+        self.total_ms += ms
+
+    @property
+    def mean_ms(self) -> float:
+        return self.total_ms / self.count if self.count else 0.0
+
+    def as_dict(self) -> dict[str, float]:
+        return {
+            "count": self.count,
+            "last_ms": round(self.last_ms, 3),
+            "mean_ms": round(self.mean_ms, 3),
+            "max_ms": round(self.max_ms, 3),
+        }
+
+
+@dataclass
+class RefreshStats:
+    """Counters collected by the coordinator and its entities.
+
+    Recording a sample costs two ``perf_counter`` calls and a dict lookup,
+    so the hooks stay enabled all the time.
+    """
+
+    build: Timing = field(default_factory=Timing)
+    prewarm: Timing = field(default_factory=Timing)
+    executor_wait: Timing = field(default_factory=Timing)
+    entities: dict[str, Timing] = field(default_factory=dict)
+
+    def record_entity(self, entity_id: str, seconds: float) -> None:
+        timing = self.entities.get(entity_id)
+        if timing is None:
+            timing = self.entities[entity_id] = Timing()
+        timing.record(seconds)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "build": self.build.as_dict(),
+            "prewarm": self.prewarm.as_dict(),
+            "executor_wait": self.executor_wait.as_dict(),
+            "entities": {
+                entity_id: timing.as_dict()
+                for entity_id, timing in sorted(self.entities.items())
+            },
+        }
+
+
+def cache_stats() -> dict[str, dict[str, int]]:
+    """Return hit/miss counters for every shared lookup table."""
+    stats = {}
+    for module in _CACHED_MODULES:
+        prefix = module.__name__.rsplit(".", 1)[-1]
+        for name, obj in vars(module).items():
+            if callable(getattr(obj, "cache_info", None)):
+                stats[f"{prefix}.{name}"] = obj.cache_info()._asdict()
+    return stats
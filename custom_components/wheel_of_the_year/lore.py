@@ -0,0 +1,21 @@
+"""Descriptive lore for sabbats, zodiac signs, moon phases and seasons."""
+
+from __future__ import annotations
+
+import json
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+_LORE_PATH = Path(__file__).parent / "lore.json"
+
+
+@lru_cache(maxsize=1)
+def load_lore() -> dict[str, Any]:
+    """Read the lore file once.
+
+    Nothing at startup needs this text, so it is only read the first time
+    a card asks for it. This does blocking I/O; run it in the executor.
+    """
+    with _LORE_PATH.open(encoding="utf-8") as file:
+        return json.load(file)
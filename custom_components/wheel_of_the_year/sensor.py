@@ -3,42 +3,67 @@
 from __future__ import annotations
 
 import logging
-from datetime import datetime, timedelta, timezone
+import math
+import time
+from abc import abstractmethod
+from types import MappingProxyType
 
 from homeassistant.components.sensor import (
+    RestoreSensor,
     SensorDeviceClass,
     SensorEntity,
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.const import DEGREE, PERCENTAGE, EntityCategory, UnitOfTime
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.event import async_track_time_interval
-
-from .calculations import (
-    days_until_sabbat,
-    get_current_season,
-    get_moon_phase_info,
-    get_next_sabbat_date,
-    get_planetary_positions,
-    get_solar_cycle_phase,
-    get_sun_sign,
+from homeassistant.helpers.json import json_bytes
+
+from .const import (
+    DOMAIN,
+    PLANETS,
+    SABBATS,
+    SEASONS,
+    ZODIAC,
+    Planet,
+    Sabbat,
+    ZodiacSign,
 )
-from .const import DOMAIN, PLANETS, SABBATS, SEASONS, ZODIAC
+from .coordinator import WheelCoordinator, WheelSnapshot, build_card_payload
+from .entity import WheelEntity
+from .ephemeris import SYNODIC_MONTH
+from .instrumentation import cache_stats
 
 _LOGGER = logging.getLogger(__name__)
 
-SCAN_INTERVAL = timedelta(minutes=5)
-
-DEVICE_INFO = DeviceInfo(
-    identifiers={(DOMAIN, "wheel_of_the_year")},
-    name="Wheel of the Year",
-    manufacturer="Pagan Calendar",
-    model="Astronomical",
-    sw_version="1.1.0",
-)
-
+# Attributes that only depend on which sign or season is current are built
+# once and handed to every refresh as-is.
+_SIGN_ATTRIBUTES = {
+    sign.name: MappingProxyType({
+        "symbol": sign.symbol,
+        "element": sign.element,
+        "quality": sign.quality,
+        "ruler": sign.ruler,
+        "start_date": f"{sign.start_month:02d}-{sign.start_day:02d}",
+        "end_date": f"{sign.end_month:02d}-{sign.end_day:02d}",
+    })
+    for sign in ZODIAC
+}
+_SEASON_ATTRIBUTES = {
+    name: MappingProxyType({"emoji": season.emoji})
+    for name, season in SEASONS.items()
+}
+
+
+
+def _sign_position(longitude: float) -> tuple[ZodiacSign, float]:
+    """Return the sign an ecliptic longitude falls in and the degree within it.
+
+    Sensors pass their stepped longitude, so the sign, the degree and the
+    longitude they report never contradict each other.
+    """
+    return ZODIAC[int(longitude // 30) % 12], round(longitude % 30, 6)
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -46,358 +71,451 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Wheel of the Year sensors from a config entry."""
+    coordinator: WheelCoordinator = hass.data[DOMAIN][entry.entry_id]
     entities: list[SensorEntity] = []
 
     # ── Sabbat sensors (one per sabbat) ──
     for sabbat in SABBATS:
-        entities.append(SabbatSensor(sabbat))
+        entities.append(SabbatSensor(coordinator, sabbat))
 
     # ── Next Sabbat sensor ──
-    entities.append(NextSabbatSensor())
+    entities.append(NextSabbatSensor(coordinator))
 
     # ── Moon Phase sensor ──
-    entities.append(MoonPhaseSensor())
+    entities.append(MoonPhaseSensor(coordinator))
 
     # ── Sun Sign sensor ──
-    entities.append(SunSignSensor())
+    entities.append(SunSignSensor(coordinator))
 
     # ── Season sensor ──
-    entities.append(SeasonSensor())
+    entities.append(SeasonSensor(coordinator))
 
     # ── Planetary position sensors ──
     for planet in PLANETS:
-        entities.append(PlanetSensor(planet))
+        entities.append(PlanetSensor(coordinator, planet))
 
     # ── Solar Cycle sensor ──
-    entities.append(SolarCycleSensor())
+    entities.append(SolarCycleSensor(coordinator))
 
-    # ── Wheel State sensor (aggregate for the Lovelace card) ──
-    entities.append(WheelStateSensor())
-
-    async_add_entities(entities, True)
+    # ── Numeric measurements (long-term statistics) ──
+    entities.append(MoonIlluminationSensor(coordinator))
+    entities.append(MoonAgeSensor(coordinator))
+    for planet in PLANETS:
+        entities.append(PlanetLongitudeSensor(coordinator, planet))
+    entities.append(SunspotEstimateSensor(coordinator))
 
+    # ── Wheel State sensor (aggregate for the Lovelace card) ──
+    entities.append(WheelStateSensor(coordinator))
+
+    # ── Refresh timings (disabled by default) ──
+    entities.append(WheelDiagnosticsSensor(coordinator))
+
+    async_add_entities(entities)
+
+
+class WheelSensor(WheelEntity, RestoreSensor):
+    """Base class for sensors fed from the shared wheel snapshot.
+
+    A refresh only writes state when the value, icon, attributes or
+    availability differ from what was last written, so attributes reported
+    through ``_report`` cost a recorder row only when they move a step.
+    """
+
+    def __init__(self, coordinator: WheelCoordinator) -> None:
+        super().__init__(coordinator)
+        self._reported: dict[str, float] = {}
+        self._written: tuple | None = None
+        if coordinator.data is not None:
+            self._apply_snapshot(coordinator.data)
+
+    async def async_added_to_hass(self) -> None:
+        """Show the last known value until the first refresh has run."""
+        await super().async_added_to_hass()
+        if self.coordinator.data is None and (
+            last := await self.async_get_last_sensor_data()
+        ) is not None:
+            self._attr_native_value = last.native_value
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        if self.coordinator.data is None:
+            # No snapshot yet; keep showing the restored value.
+            return
+        started = time.perf_counter()
+        self._apply_snapshot(self.coordinator.data)
+        state = (
+            self.available,
+            self._attr_native_value,
+            self._attr_icon,
+            self._attr_extra_state_attributes,
+        )
+        if state != self._written:
+            self._written = state
+            super()._handle_coordinator_update()
+        self.coordinator.stats.record_entity(
+            self.entity_id, time.perf_counter() - started
+        )
 
-class SabbatSensor(SensorEntity):
+    @abstractmethod
+    def _apply_snapshot(self, snapshot: WheelSnapshot) -> None:
+        """Update entity attributes from a snapshot."""
+
+    def _report(
+        self, key: str, value: float, step: float, period: float | None = None
+    ) -> float:
+        """Return ``value`` in multiples of ``step``, with hysteresis.
+
+        The reported value holds until ``value`` is a whole step away from
+        it, so a value hovering on a boundary does not flap. Angles pass
+        their ``period``: they are floored to the step, so a longitude never
+        reaches a sign before the body does, and wrap, so 359.9° is never
+        reported as 360°.
+        """
+        if not step:
+            return value
+        last = self._reported.get(key)
+        if last is not None:
+            distance = abs(value - last)
+            if period is not None:
+                distance = min(distance, period - distance % period)
+            if distance < step:
+                return last
+        if period is not None:
+            reported = math.floor(value / step) * step % period
+        else:
+            reported = round(value / step) * step
+        reported = round(reported, 6)
+        self._reported[key] = reported
+        return reported
+
+
+class SabbatSensor(WheelSensor):
     """Sensor for an individual Sabbat showing days until next occurrence."""
 
-    _attr_has_entity_name = True
     _attr_device_class = None
     _attr_state_class = None
+    _unrecorded_attributes = frozenset(
+        {"sabbat_name", "alt_name", "type", "emoji", "color", "dark_color"}
+    )
 
-    def __init__(self, sabbat: dict) -> None:
-        slug = sabbat["name"].lower()
+    def __init__(self, coordinator: WheelCoordinator, sabbat: Sabbat) -> None:
         self._sabbat = sabbat
-        self._attr_unique_id = f"wheel_sabbat_{slug}"
-        self._attr_name = sabbat["name"]
-        self._attr_icon = sabbat["icon"]
+        self._unique_key = f"sabbat_{sabbat.name.lower()}"
+        self._attr_name = sabbat.name
+        self._attr_icon = sabbat.icon
         self._attr_native_unit_of_measurement = "days"
+        super().__init__(coordinator)
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        return DEVICE_INFO
-
-    def update(self) -> None:
-        now = datetime.now()
-        days = days_until_sabbat(self._sabbat, now)
+    def _apply_snapshot(self, snapshot: WheelSnapshot) -> None:
+        state = next(s for s in snapshot.sabbats if s.sabbat is self._sabbat)
+        days = state.days_until
+        sabbat = self._sabbat
         self._attr_native_value = days
-
-        next_date = get_next_sabbat_date(self._sabbat, now)
         self._attr_extra_state_attributes = {
-            "sabbat_name": self._sabbat["name"],
-            "alt_name": self._sabbat["alt_name"],
-            "type": self._sabbat["type"],
-            "emoji": self._sabbat["emoji"],
-            "next_date": next_date.strftime("%Y-%m-%d"),
-            "color": self._sabbat["color"],
-            "dark_color": self._sabbat["dark_color"],
-            "description": self._sabbat["description"],
-            "traditions": self._sabbat["traditions"],
+            "sabbat_name": sabbat.name,
+            "alt_name": sabbat.alt_name,
+            "type": sabbat.type,
+            "emoji": sabbat.emoji,
+            "next_date": state.next_date.strftime("%Y-%m-%d"),
+            "next_time": state.next_date.isoformat(),
+            "color": sabbat.color,
+            "dark_color": sabbat.dark_color,
             "is_today": days == 0,
         }
 
 
-class NextSabbatSensor(SensorEntity):
+class NextSabbatSensor(WheelSensor):
     """Sensor showing the name of the next upcoming Sabbat."""
 
-    _attr_has_entity_name = True
-    _attr_unique_id = "wheel_next_sabbat"
+    _unique_key = "next_sabbat"
     _attr_name = "Next Sabbat"
     _attr_icon = "mdi:calendar-star"
+    _unrecorded_attributes = frozenset({"alt_name", "emoji", "type", "color"})
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        return DEVICE_INFO
-
-    def update(self) -> None:
-        now = datetime.now()
-        nearest = None
-        nearest_days = float("inf")
-
-        for sabbat in SABBATS:
-            days = days_until_sabbat(sabbat, now)
-            if days < nearest_days:
-                nearest_days = days
-                nearest = sabbat
-
-        if nearest:
-            next_date = get_next_sabbat_date(nearest, now)
-            self._attr_native_value = nearest["name"]
+    def _apply_snapshot(self, snapshot: WheelSnapshot) -> None:
+        state = snapshot.next_sabbat
+        if state:
+            nearest = state.sabbat
+            self._attr_native_value = nearest.name
             self._attr_extra_state_attributes = {
-                "alt_name": nearest["alt_name"],
-                "days_until": nearest_days,
-                "next_date": next_date.strftime("%Y-%m-%d"),
-                "emoji": nearest["emoji"],
-                "type": nearest["type"],
-                "color": nearest["color"],
-                "description": nearest["description"],
-                "traditions": nearest["traditions"],
+                "alt_name": nearest.alt_name,
+                "days_until": state.days_until,
+                "next_date": state.next_date.strftime("%Y-%m-%d"),
+                "next_time": state.next_date.isoformat(),
+                "emoji": nearest.emoji,
+                "type": nearest.type,
+                "color": nearest.color,
             }
 
 
-class MoonPhaseSensor(SensorEntity):
+class MoonPhaseSensor(WheelSensor):
     """Sensor for the current moon phase."""
 
-    _attr_has_entity_name = True
-    _attr_unique_id = "wheel_moon_phase"
+    _unique_key = "moon_phase"
     _attr_name = "Moon Phase"
     _attr_icon = "mdi:moon-waning-crescent"
+    _unrecorded_attributes = frozenset({"emoji"})
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        return DEVICE_INFO
-
-    def update(self) -> None:
-        now = datetime.now()
-        info = get_moon_phase_info(now)
-        self._attr_native_value = info["name"]
+    def _apply_snapshot(self, snapshot: WheelSnapshot) -> None:
+        info = snapshot.moon
+        steps = self.coordinator.steps
+        self._attr_native_value = info.moon_phase.name
 
         # Dynamic icon based on phase
-        icon_map = {
-            0: "mdi:moon-new",
-            1: "mdi:moon-waxing-crescent",
-            2: "mdi:moon-first-quarter",
-            3: "mdi:moon-waxing-gibbous",
-            4: "mdi:moon-full",
-            5: "mdi:moon-waning-gibbous",
-            6: "mdi:moon-last-quarter",
-            7: "mdi:moon-waning-crescent",
-        }
-        self._attr_icon = icon_map.get(info["index"], "mdi:moon-waning-crescent")
+        self._attr_icon = info.moon_phase.icon
 
         self._attr_extra_state_attributes = {
-            "emoji": info["emoji"],
-            "illumination": info["illumination"],
-            "phase_number": info["phase"],
-            "phase_index": info["index"],
-            "magick": info["magick"],
-            "description": info.get("description", ""),
+            "emoji": info.moon_phase.emoji,
+            "illumination": self._report(
+                "illumination", info.illumination, steps.illumination
+            ),
+            "phase_number": self._report("phase", info.phase, steps.fraction),
+            "phase_index": info.index,
+            "next_full_moon": snapshot.next_full_moon.isoformat(),
+            "next_new_moon": snapshot.next_new_moon.isoformat(),
         }
 
 
-class SunSignSensor(SensorEntity):
+class SunSignSensor(WheelSensor):
     """Sensor for the current Sun sign."""
 
-    _attr_has_entity_name = True
-    _attr_unique_id = "wheel_sun_sign"
+    _unique_key = "sun_sign"
     _attr_name = "Sun Sign"
     _attr_icon = "mdi:zodiac-leo"
+    _unrecorded_attributes = frozenset(
+        {"symbol", "element", "quality", "ruler", "start_date", "end_date"}
+    )
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        return DEVICE_INFO
-
-    def update(self) -> None:
-        now = datetime.now()
-        sign = get_sun_sign(now)
-        self._attr_native_value = sign["name"]
+    def _apply_snapshot(self, snapshot: WheelSnapshot) -> None:
+        sign = snapshot.sun_sign
+        self._attr_native_value = sign.name
 
         # Dynamic icon
-        icon_map = {
-            "Aries": "mdi:zodiac-aries",
-            "Taurus": "mdi:zodiac-taurus",
-            "Gemini": "mdi:zodiac-gemini",
-            "Cancer": "mdi:zodiac-cancer",
-            "Leo": "mdi:zodiac-leo",
-            "Virgo": "mdi:zodiac-virgo",
-            "Libra": "mdi:zodiac-libra",
-            "Scorpio": "mdi:zodiac-scorpio",
-            "Sagittarius": "mdi:zodiac-sagittarius",
-            "Capricorn": "mdi:zodiac-capricorn",
-            "Aquarius": "mdi:zodiac-aquarius",
-            "Pisces": "mdi:zodiac-pisces",
-        }
-        self._attr_icon = icon_map.get(sign["name"], "mdi:zodiac-leo")
+        self._attr_icon = sign.icon
 
-        self._attr_extra_state_attributes = {
-            "symbol": sign["symbol"],
-            "element": sign["element"],
-            "quality": sign["quality"],
-            "ruler": sign["ruler"],
-            "description": sign.get("description", ""),
-            "start_date": f"{sign['start_month']:02d}-{sign['start_day']:02d}",
-            "end_date": f"{sign['end_month']:02d}-{sign['end_day']:02d}",
-        }
+        self._attr_extra_state_attributes = _SIGN_ATTRIBUTES[sign.name]
 
 
-class SeasonSensor(SensorEntity):
+class SeasonSensor(WheelSensor):
     """Sensor for the current season."""
 
-    _attr_has_entity_name = True
-    _attr_unique_id = "wheel_season"
+    _unique_key = "season"
     _attr_name = "Current Season"
+    _unrecorded_attributes = frozenset({"emoji"})
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        return DEVICE_INFO
-
-    def update(self) -> None:
-        now = datetime.now()
-        season_name = get_current_season(now)
+    def _apply_snapshot(self, snapshot: WheelSnapshot) -> None:
+        season_name = snapshot.season
         season = SEASONS[season_name]
 
         self._attr_native_value = season_name
-        self._attr_icon = season["icon"]
-        self._attr_extra_state_attributes = {
-            "description": season["description"],
-            "long_description": season.get("long_description", season["description"]),
-            "emoji": season.get("emoji", ""),
-        }
+        self._attr_icon = season.icon
+        self._attr_extra_state_attributes = _SEASON_ATTRIBUTES[season_name]
 
 
-class PlanetSensor(SensorEntity):
+class PlanetSensor(WheelSensor):
     """Sensor for a planet's current zodiac position."""
 
-    _attr_has_entity_name = True
+    _unrecorded_attributes = frozenset(
+        {"planet_symbol", "planet_color", "sign_symbol"}
+    )
 
-    def __init__(self, planet: dict) -> None:
-        slug = planet["name"].lower()
+    def __init__(self, coordinator: WheelCoordinator, planet: Planet) -> None:
         self._planet = planet
-        self._attr_unique_id = f"wheel_planet_{slug}"
-        self._attr_name = f"{planet['name']} Position"
+        self._unique_key = f"planet_{planet.name.lower()}"
+        self._attr_name = f"{planet.name} Position"
         self._attr_icon = "mdi:earth"
+        super().__init__(coordinator)
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        return DEVICE_INFO
-
-    def update(self) -> None:
-        now = datetime.now()
-        positions = get_planetary_positions(now)
-
-        for p in positions:
-            if p["name"] == self._planet["name"]:
-                self._attr_native_value = f"{p['sign_name']} {p['sign_degree']:.0f}°"
-                self._attr_extra_state_attributes = {
-                    "planet_symbol": p["symbol"],
-                    "planet_color": p.get("color", "#ccc"),
-                    "sign_name": p["sign_name"],
-                    "sign_symbol": p["sign_symbol"],
-                    "sign_degree": p["sign_degree"],
-                    "ecliptic_longitude": p["longitude"],
-                }
-                break
-
-
-class SolarCycleSensor(SensorEntity):
+    def _apply_snapshot(self, snapshot: WheelSnapshot) -> None:
+        p = snapshot.planets_by_name[self._planet.name]
+        longitude = self._report(
+            "longitude", p["longitude"], self.coordinator.steps.longitude, 360
+        )
+        sign, degree = _sign_position(longitude)
+        # Whole degrees, as the sign is counted: 29.8° is still 29°.
+        self._attr_native_value = f"{sign.name} {int(degree)}°"
+        attributes = {
+            "planet_symbol": p["symbol"],
+            "planet_color": p["color"],
+            "sign_name": sign.name,
+            "sign_symbol": sign.symbol,
+            "sign_degree": degree,
+            "ecliptic_longitude": longitude,
+        }
+        station = snapshot.stations.get(self._planet.name)
+        if station is not None:
+            next_station = station["next_station"]
+            attributes["retrograde"] = station["retrograde"]
+            attributes["next_station"] = (
+                next_station.isoformat() if next_station else None
+            )
+            attributes["station_type"] = station["station_type"]
+        self._attr_extra_state_attributes = attributes
+
+
+class SolarCycleSensor(WheelSensor):
     """Sensor for solar cycle activity."""
 
-    _attr_has_entity_name = True
-    _attr_unique_id = "wheel_solar_cycle"
+    _unique_key = "solar_cycle"
     _attr_name = "Solar Cycle"
     _attr_icon = "mdi:white-balance-sunny"
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        return DEVICE_INFO
-
-    def update(self) -> None:
-        now = datetime.now(tz=timezone.utc)
-        info = get_solar_cycle_phase(now)
+    def _apply_snapshot(self, snapshot: WheelSnapshot) -> None:
+        info = snapshot.solar_cycle
+        step = self.coordinator.steps.fraction
         self._attr_native_value = info["label"]
         self._attr_extra_state_attributes = {
             "cycle_number": info["cycle_number"],
-            "progress": info["progress"],
-            "phase": info["phase"],
+            "progress": self._report("progress", info["progress"], step),
+            "phase": self._report("phase", info["phase"], step),
             "sunspot_estimate": info["sunspot_estimate"],
             "years_remaining": info["years_remaining"],
         }
 
 
-class WheelStateSensor(SensorEntity):
-    """Aggregate sensor providing full state for the Lovelace card."""
+class MoonIlluminationSensor(WheelSensor):
+    """Illuminated fraction of the Moon's disc."""
 
-    _attr_has_entity_name = True
-    _attr_unique_id = "wheel_state"
-    _attr_name = "Wheel State"
-    _attr_icon = "mdi:rotate-right"
+    _unique_key = "moon_illumination"
+    _attr_name = "Moon Illumination"
+    _attr_icon = "mdi:brightness-6"
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_native_unit_of_measurement = PERCENTAGE
+    _attr_suggested_display_precision = 0
+
+    def _apply_snapshot(self, snapshot: WheelSnapshot) -> None:
+        self._attr_native_value = self._report(
+            "illumination",
+            snapshot.moon.illumination,
+            self.coordinator.steps.illumination,
+        )
+
+
+class MoonAgeSensor(WheelSensor):
+    """Days since the last new moon."""
+
+    _unique_key = "moon_age"
+    _attr_name = "Moon Age"
+    _attr_icon = "mdi:moon-waxing-crescent"
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_native_unit_of_measurement = UnitOfTime.DAYS
+    _attr_suggested_display_precision = 1
+
+    def _apply_snapshot(self, snapshot: WheelSnapshot) -> None:
+        # The phase step applies to the age as a share of the lunation.
+        self._attr_native_value = self._report(
+            "age",
+            snapshot.moon.age,
+            self.coordinator.steps.fraction * SYNODIC_MONTH,
+        )
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        return DEVICE_INFO
 
-    def update(self) -> None:
-        now = datetime.now()
+class PlanetLongitudeSensor(WheelSensor):
+    """Geocentric ecliptic longitude of a body; the Sun's is the solar longitude."""
 
-        # Moon
-        moon_info = get_moon_phase_info(now)
+    _attr_icon = "mdi:orbit"
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_native_unit_of_measurement = DEGREE
+    _attr_suggested_display_precision = 1
 
-        # Sun sign
-        sun_sign = get_sun_sign(now)
+    def __init__(self, coordinator: WheelCoordinator, planet: Planet) -> None:
+        self._planet = planet
+        self._unique_key = f"planet_{planet.name.lower()}_longitude"
+        self._attr_name = f"{planet.name} Longitude"
+        super().__init__(coordinator)
+
+    def _apply_snapshot(self, snapshot: WheelSnapshot) -> None:
+        p = snapshot.planets_by_name[self._planet.name]
+        self._attr_native_value = self._report(
+            "longitude", p["longitude"], self.coordinator.steps.longitude, 360
+        )
+
+
+class SunspotEstimateSensor(WheelSensor):
+    """Estimated sunspot number from the solar cycle model."""
+
+    _unique_key = "sunspot_estimate"
+    _attr_name = "Sunspot Estimate"
+    _attr_icon = "mdi:weather-sunny-alert"
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
+    def _apply_snapshot(self, snapshot: WheelSnapshot) -> None:
+        self._attr_native_value = snapshot.solar_cycle["sunspot_estimate"]
 
-        # Season
-        season_name = get_current_season(now)
-        season_data = SEASONS[season_name]
 
-        # Solar cycle
-        solar_cycle = get_solar_cycle_phase(
-            datetime.now(tz=timezone.utc)
+class WheelStateSensor(WheelSensor):
+    """Aggregate sensor providing full state for the Lovelace card."""
+
+    _unique_key = "state"
+    _attr_name = "Wheel State"
+    _attr_icon = "mdi:rotate-right"
+    # The card reads these live; they are too large to keep in history.
+    _unrecorded_attributes = frozenset({"sabbats", "planets", "solar_cycle"})
+
+    def _apply_snapshot(self, snapshot: WheelSnapshot) -> None:
+        nearest = snapshot.next_sabbat
+        steps = self.coordinator.steps
+        self._attr_native_value = nearest.sabbat.name if nearest else "Unknown"
+        # The payload is a fresh copy; report its continuous values in steps
+        # like the individual sensors do.
+        payload = build_card_payload(snapshot)
+        payload["moon_illumination"] = self._report(
+            "moon_illumination", payload["moon_illumination"], steps.illumination
+        )
+        payload["moon_phase_number"] = self._report(
+            "moon_phase_number", payload["moon_phase_number"], steps.fraction
         )
+        solar_cycle = payload["solar_cycle"]
+        for key in ("progress", "phase"):
+            solar_cycle[key] = self._report(
+                f"solar_cycle_{key}", solar_cycle[key], steps.fraction
+            )
+        for planet in payload["planets"]:
+            planet["longitude"] = self._report(
+                f"{planet['name']}_longitude",
+                planet["longitude"],
+                steps.longitude,
+                360,
+            )
+            sign, planet["sign_degree"] = _sign_position(planet["longitude"])
+            planet["sign_index"] = ZODIAC.index(sign)
+            planet["sign_name"] = sign.name
+            planet["sign_symbol"] = sign.symbol
+        self._attr_extra_state_attributes = payload
+
+
+class WheelDiagnosticsSensor(WheelSensor):
+    """Debug sensor reporting how long the last refresh took."""
+
+    _unique_key = "diagnostics"
+    _attr_name = "Refresh Duration"
+    _attr_icon = "mdi:timer-cog-outline"
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+    _attr_suggested_display_precision = 2
+    _unrecorded_attributes = frozenset({"entities", "caches"})
+
+    def _apply_snapshot(self, snapshot: WheelSnapshot) -> None:
+        stats = self.coordinator.stats
+        entity_ms = {
+            entity_id: round(timing.last_ms, 3)
+            for entity_id, timing in stats.entities.items()
+        }
+        attribute_bytes = 0
+        if self.hass is not None:
+            for entity_id in entity_ms:
+                if (state := self.hass.states.get(entity_id)) is not None:
+                    attribute_bytes += len(json_bytes(state.attributes))
 
-        # Next sabbat
-        nearest = None
-        nearest_days = float("inf")
-        sabbat_data = []
-        for sabbat in SABBATS:
-            days = days_until_sabbat(sabbat, now)
-            next_date = get_next_sabbat_date(sabbat, now)
-            sabbat_data.append({
-                "name": sabbat["name"],
-                "alt_name": sabbat["alt_name"],
-                "emoji": sabbat["emoji"],
-                "days_until": days,
-                "next_date": next_date.strftime("%Y-%m-%d"),
-                "color": sabbat["color"],
-                "dark_color": sabbat["dark_color"],
-                "description": sabbat["description"],
-                "traditions": sabbat["traditions"],
-            })
-            if days < nearest_days:
-                nearest_days = days
-                nearest = sabbat
-
-        # Planets
-        planet_positions = get_planetary_positions(now)
-
-        self._attr_native_value = nearest["name"] if nearest else "Unknown"
+        self._attr_native_value = round(stats.build.last_ms, 3)
         self._attr_extra_state_attributes = {
-            "moon_phase": moon_info["name"],
-            "moon_illumination": moon_info["illumination"],
-            "moon_emoji": moon_info["emoji"],
-            "moon_phase_number": moon_info["phase"],
-            "moon_magick": moon_info.get("magick", ""),
-            "moon_description": moon_info.get("description", ""),
-            "sun_sign": sun_sign["name"],
-            "sun_sign_symbol": sun_sign["symbol"],
-            "sun_sign_element": sun_sign["element"],
-            "sun_sign_quality": sun_sign["quality"],
-            "sun_sign_ruler": sun_sign["ruler"],
-            "sun_sign_description": sun_sign.get("description", ""),
-            "season": season_name,
-            "season_emoji": season_data.get("emoji", ""),
-            "season_description": season_data.get("long_description", season_data["description"]),
-            "solar_cycle": solar_cycle,
-            "next_sabbat": nearest["name"] if nearest else None,
-            "next_sabbat_days": nearest_days,
-            "sabbats": sabbat_data,
-            "planets": planet_positions,
+            "executor_wait_ms": round(stats.executor_wait.last_ms, 3),
+            "entity_update_ms": round(sum(entity_ms.values()), 3),
+            "attribute_bytes": attribute_bytes,
+            "entities": entity_ms,
+            "caches": cache_stats(),
         }
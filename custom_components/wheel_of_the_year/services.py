@@ -0,0 +1,156 @@
+"""Services for the Wheel of the Year integration."""
+
+from __future__ import annotations
+
+import time
+from datetime import datetime, timedelta
+from itertools import islice
+
+import voluptuous as vol
+
+import homeassistant.helpers.config_validation as cv
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.util import dt as dt_util
+
+from .almanac import FIELDS, iter_almanac
+from .const import DOMAIN, HEMISPHERE_NORTH
+from .coordinator import WheelCoordinator
+
+SERVICE_GENERATE_ALMANAC = "generate_almanac"
+SERVICE_REPLAY = "replay"
+
+ATTR_CONFIG_ENTRY_ID = "config_entry_id"
+ATTR_START = "start"
+ATTR_END = "end"
+ATTR_STEP = "step"
+
+# A replay without an end runs for a year.
+DEFAULT_REPLAY_SPAN = timedelta(days=365)
+
+# Responses are held in memory and sent in one message; longer exports
+# belong to the command-line almanac, which streams.
+MAX_ALMANAC_ROWS = 10_000
+
+GENERATE_ALMANAC_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Required(ATTR_START): cv.datetime,
+        vol.Required(ATTR_END): cv.datetime,
+        vol.Optional(ATTR_STEP, default=timedelta(days=1)): vol.All(
+            cv.time_period, cv.positive_timedelta
+        ),
+    }
+)
+
+
+REPLAY_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Required(ATTR_START): cv.datetime,
+        vol.Optional(ATTR_END): cv.datetime,
+    }
+)
+
+
+def _collect(
+    start: datetime, end: datetime, step: timedelta, hemisphere: str
+) -> list[dict]:
+    rows = iter_almanac(start, end, step, hemisphere)
+    return [dict(zip(FIELDS, row)) for row in islice(rows, MAX_ALMANAC_ROWS)]
+
+
+@callback
+def async_register_services(hass: HomeAssistant) -> None:
+    """Register the integration's services."""
+
+    def get_coordinator(call: ServiceCall) -> WheelCoordinator | None:
+        """Return the wheel a call names, or the first one loaded."""
+        coordinators: dict[str, WheelCoordinator] = hass.data.get(DOMAIN, {})
+        entry_id = call.data.get(ATTR_CONFIG_ENTRY_ID)
+        if entry_id is None:
+            return next(iter(coordinators.values()), None)
+        if (coordinator := coordinators.get(entry_id)) is None:
+            raise ServiceValidationError(
+                translation_domain=DOMAIN,
+                translation_key="entry_not_found",
+                translation_placeholders={"entry_id": entry_id},
+            )
+        return coordinator
+
+    async def async_generate_almanac(call: ServiceCall) -> ServiceResponse:
+        """Return almanac rows for a date range in a wheel's time zone."""
+        coordinator = get_coordinator(call)
+        if coordinator is not None:
+            tz, hemisphere = coordinator.time_zone, coordinator.hemisphere
+        else:
+            tz = dt_util.get_time_zone(hass.config.time_zone)
+            hemisphere = HEMISPHERE_NORTH
+
+        start = call.data[ATTR_START]
+        end = call.data[ATTR_END]
+        start = start.astimezone(tz) if start.tzinfo else start.replace(tzinfo=tz)
+        end = end.astimezone(tz) if end.tzinfo else end.replace(tzinfo=tz)
+        step = call.data[ATTR_STEP]
+        if (end - start) / step > MAX_ALMANAC_ROWS:
+            raise ServiceValidationError(
+                translation_domain=DOMAIN,
+                translation_key="too_many_rows",
+                translation_placeholders={"max_rows": str(MAX_ALMANAC_ROWS)},
+            )
+
+        rows = await hass.async_add_executor_job(
+            _collect, start, end, step, hemisphere
+        )
+        return {"rows": rows}
+
+    async def async_replay(call: ServiceCall) -> ServiceResponse:
+        """Fast-forward a wheel through a date range."""
+        coordinator = get_coordinator(call)
+        if coordinator is None:
+            raise ServiceValidationError(
+                translation_domain=DOMAIN, translation_key="no_entries"
+            )
+
+        tz = coordinator.time_zone
+        start = call.data[ATTR_START]
+        start = start.astimezone(tz) if start.tzinfo else start.replace(tzinfo=tz)
+        if (end := call.data.get(ATTR_END)) is None:
+            end = start + DEFAULT_REPLAY_SPAN
+        end = end.astimezone(tz) if end.tzinfo else end.replace(tzinfo=tz)
+        if end <= start:
+            raise ServiceValidationError(
+                translation_domain=DOMAIN, translation_key="end_before_start"
+            )
+        if coordinator.replaying:
+            raise ServiceValidationError(
+                translation_domain=DOMAIN, translation_key="replay_running"
+            )
+
+        started = time.perf_counter()
+        refreshes = await coordinator.async_replay(start, end)
+        return {
+            "refreshes": refreshes,
+            "seconds": round(time.perf_counter() - started, 3),
+        }
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GENERATE_ALMANAC,
+        async_generate_almanac,
+        schema=GENERATE_ALMANAC_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_REPLAY,
+        async_replay,
+        schema=REPLAY_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
@@ -0,0 +1,70 @@
+"""Time-only astronomy shared by every Wheel of the Year instance.
+
+The lunar phase, planetary longitudes, stations and the solar cycle are the
+same wherever the wheel is set up, so they are computed once per instant and
+cached for the whole process. Only local dates and the hemisphere-dependent
+half of a snapshot are computed per config entry.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Mapping
+
+from .calculations import (
+    MoonInfo,
+    get_moon_phase_info,
+    get_next_full_moon,
+    get_next_new_moon,
+    get_planetary_positions,
+    get_solar_cycle_phase,
+    get_station_info,
+)
+from .events import STATION_BODIES
+
+
+@dataclass(frozen=True)
+class SkySnapshot:
+    """Location-independent wheel values, taken at one instant."""
+
+    moon: MoonInfo
+    next_full_moon: datetime
+    next_new_moon: datetime
+    solar_cycle: Mapping
+    planets: tuple[Mapping, ...]
+    planets_by_name: Mapping[str, Mapping]
+    stations: Mapping[str, Mapping]
+
+
+def sky_snapshot(now: datetime, precision: str) -> SkySnapshot:
+    """Return the shared sky for ``now``, to the whole second.
+
+    Instances refresh on the same UTC boundaries, so a second is fine enough
+    for them to share an entry and coarse enough to absorb timer jitter.
+    """
+    return sky_at(math.floor(now.timestamp()), precision)
+
+
+@lru_cache(maxsize=8)
+def sky_at(ts: int, precision: str) -> SkySnapshot:
+    """Compute the sky at a whole-second POSIX timestamp."""
+    now = datetime.fromtimestamp(ts, tz=timezone.utc)
+    planets = tuple(
+        MappingProxyType(p) for p in get_planetary_positions(now, precision)
+    )
+    return SkySnapshot(
+        moon=get_moon_phase_info(now),
+        next_full_moon=get_next_full_moon(now),
+        next_new_moon=get_next_new_moon(now),
+        solar_cycle=MappingProxyType(get_solar_cycle_phase(now)),
+        planets=planets,
+        planets_by_name=MappingProxyType({p["name"]: p for p in planets}),
+        stations=MappingProxyType({
+            p.name: MappingProxyType(get_station_info(now, p.name))
+            for p in STATION_BODIES
+        }),
+    )
@@ -0,0 +1,288 @@
+"""Sorted, lazily extended timeline of Wheel of the Year events."""
+
+from __future__ import annotations
+
+import threading
+from bisect import bisect_left
+from datetime import date, datetime, time, timezone, tzinfo
+from functools import lru_cache
+from typing import NamedTuple
+
+from .calculations import get_current_season, sabbat_longitude
+from .const import (
+    HEMISPHERE_NORTH,
+    HEMISPHERE_SOUTH,
+    MOON_PHASES,
+    PLANETS,
+    SABBATS,
+    SEASONS,
+    SOLAR_CYCLE,
+    ZODIAC,
+)
+from .events import (
+    PHASE_NAMES,
+    lunar_phase_index,
+    sign_ingress_index,
+    solar_longitude_index,
+    station_index,
+)
+
+KIND_SABBAT = "sabbat"
+KIND_MOON_PHASE = "moon_phase"
+KIND_INGRESS = "ingress"
+KIND_STATION = "station"
+KIND_SOLAR_CYCLE = "solar_cycle"
+KIND_SEASON = "season"
+
+# Years outside this range are never built, however wide the query.
+MIN_YEAR = 1900
+MAX_YEAR = 2100
+
+_SABBAT_BY_LONGITUDE = {
+    hemisphere: {sabbat_longitude(s, hemisphere): s for s in SABBATS}
+    for hemisphere in (HEMISPHERE_NORTH, HEMISPHERE_SOUTH)
+}
+_PLANET_BY_NAME = {p.name: p for p in PLANETS}
+
+
+class WheelEvent(NamedTuple):
+    """A single event on the wheel."""
+
+    time: datetime
+    kind: str
+    summary: str
+    description: str
+    all_day: bool
+    uid: str
+    # What the event is about, for matching: the sabbat, phase, season or
+    # body name, and for ingresses and stations the sign or direction.
+    subject: str = ""
+    detail: str = ""
+
+
+def _utc(ts: float) -> datetime:
+    return datetime.fromtimestamp(ts, tz=timezone.utc)
+
+
+def _solar_cycle_markers() -> list[tuple[datetime, str]]:
+    sc = SOLAR_CYCLE
+    number = sc["cycle_number"]
+    return [
+        (
+            datetime(sc["minimum_year"], sc["minimum_month"], 1, tzinfo=timezone.utc),
+            f"Solar Cycle {number} minimum",
+        ),
+        (
+            datetime(sc["maximum_year"], sc["maximum_month"], 1, tzinfo=timezone.utc),
+            f"Solar Cycle {number} maximum",
+        ),
+        (
+            datetime(
+                sc["next_minimum_year"], sc["next_minimum_month"], 1, tzinfo=timezone.utc
+            ),
+            f"Solar Cycle {number} ends",
+        ),
+    ]
+
+
+@lru_cache(maxsize=32)
+def year_events(
+    year: int, hemisphere: str = HEMISPHERE_NORTH
+) -> tuple[WheelEvent, ...]:
+    """Return every wheel event in a UTC year, sorted by time.
+
+    Only the sabbat names depend on the hemisphere; the event tables
+    underneath are shared by both.
+    """
+    events = []
+
+    by_longitude = _SABBAT_BY_LONGITUDE[hemisphere]
+    times, longitudes = solar_longitude_index(year, 45)
+    for ts, longitude in zip(times, longitudes):
+        sabbat = by_longitude[longitude]
+        events.append(
+            WheelEvent(
+                _utc(ts),
+                KIND_SABBAT,
+                f"{sabbat.emoji} {sabbat.name}",
+                sabbat.alt_name,
+                True,
+                f"sabbat-{sabbat.name.lower()}-{year}",
+                sabbat.name,
+            )
+        )
+
+    times, quarters = lunar_phase_index(year)
+    for ts, quarter in zip(times, quarters):
+        phase = MOON_PHASES[quarter * 2]
+        events.append(
+            WheelEvent(
+                _utc(ts),
+                KIND_MOON_PHASE,
+                f"{phase.emoji} {PHASE_NAMES[quarter]}",
+                "",
+                False,
+                f"moon-{quarter}-{int(ts)}",
+                PHASE_NAMES[quarter],
+            )
+        )
+
+    times, bodies, signs = sign_ingress_index(year)
+    for ts, body, sign in zip(times, bodies, signs):
+        zodiac = ZODIAC[sign]
+        events.append(
+            WheelEvent(
+                _utc(ts),
+                KIND_INGRESS,
+                f"{_PLANET_BY_NAME[body].symbol} {body} enters {zodiac.name}",
+                f"{body} enters {zodiac.symbol} {zodiac.name}.",
+                False,
+                f"ingress-{body.lower()}-{int(ts)}",
+                body,
+                zodiac.name,
+            )
+        )
+
+    for body, (times, types) in station_index(year).items():
+        symbol = _PLANET_BY_NAME[body].symbol
+        for ts, station_type in zip(times, types):
+            events.append(
+                WheelEvent(
+                    _utc(ts),
+                    KIND_STATION,
+                    f"{symbol} {body} stations {station_type}",
+                    f"{body} appears to stand still and turns {station_type}.",
+                    False,
+                    f"station-{body.lower()}-{int(ts)}",
+                    body,
+                    station_type,
+                )
+            )
+
+    for when, summary in _solar_cycle_markers():
+        if when.year == year:
+            events.append(
+                WheelEvent(
+                    when, KIND_SOLAR_CYCLE, f"☉ {summary}", "", True,
+                    f"solar-cycle-{when:%Y%m}",
+                )
+            )
+
+    events.sort(key=lambda e: e.time)
+    return tuple(events)
+
+
+def season_changes(
+    start: date, end: date, tz: tzinfo, hemisphere: str = HEMISPHERE_NORTH
+) -> list[WheelEvent]:
+    """Return the season changes from ``start`` up to ``end``.
+
+    Seasons are meteorological and turn at local midnight on the first of
+    March, June, September and December, so unlike the rest of the wheel
+    they depend on the time zone.
+    """
+    events = []
+    year, month = start.year, start.month
+    while (first := date(year, month, 1)) < end:
+        if month % 3 == 0 and first >= start:
+            name = get_current_season(first, hemisphere)
+            events.append(
+                WheelEvent(
+                    datetime.combine(first, time(), tzinfo=tz),
+                    KIND_SEASON,
+                    f"{SEASONS[name].emoji} {name}",
+                    "",
+                    True,
+                    f"season-{name.lower()}-{year}",
+                    name,
+                )
+            )
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+    return events
+
+
+class Timeline:
+    """Sorted index of wheel events, extended one year at a time.
+
+    Range queries are answered by bisection over the precomputed index;
+    no astronomy runs per query once the years involved are built.
+    """
+
+    def __init__(self, hemisphere: str = HEMISPHERE_NORTH) -> None:
+        self._hemisphere = hemisphere
+        self._first_year: int | None = None
+        self._last_year: int | None = None
+        self._times: list[float] = []
+        self._events: list[WheelEvent] = []
+        # Calendar queries and trigger schedulers extend the same timeline
+        # from executor threads; builds run one at a time.
+        self._lock = threading.Lock()
+
+    def covers(self, start: datetime, end: datetime) -> bool:
+        """Return True if every year touched by the range is built."""
+        if self._first_year is None:
+            return False
+        first, last = self._clamp(start.year, end.year)
+        return self._first_year <= first and last <= self._last_year
+
+    def ensure_range(self, start: datetime, end: datetime) -> None:
+        """Build any missing years touched by the range.
+
+        Runs the astronomy, so call it from an executor job. Safe to call
+        from several threads; a caller that waited on another's build
+        finds its years already there.
+        """
+        first, last = self._clamp(start.year, end.year)
+        with self._lock:
+            if self._first_year is None:
+                self._replace(list(year_events(first, self._hemisphere)), [])
+                self._first_year = self._last_year = first
+            before = [
+                e
+                for year in range(first, self._first_year)
+                for e in year_events(year, self._hemisphere)
+            ]
+            after = [
+                e
+                for year in range(self._last_year + 1, last + 1)
+                for e in year_events(year, self._hemisphere)
+            ]
+            self._replace(before, after)
+            self._first_year = min(self._first_year, first)
+            self._last_year = max(self._last_year, last)
+
+    def _replace(self, before: list[WheelEvent], after: list[WheelEvent]) -> None:
+        # An event is never indexed twice, whatever order years arrive in.
+        indexed = {e.uid for e in self._events}
+        events = (
+            [e for e in before if e.uid not in indexed]
+            + self._events
+            + [e for e in after if e.uid not in indexed]
+        )
+        times = [e.time.timestamp() for e in events]
+        # Swap both lists at once so concurrent readers never see a mix.
+        self._times, self._events = times, events
+
+    @staticmethod
+    def _clamp(first: int, last: int) -> tuple[int, int]:
+        return max(MIN_YEAR, min(first, MAX_YEAR)), max(MIN_YEAR, min(last, MAX_YEAR))
+
+    def events_between(self, start: datetime, end: datetime) -> list[WheelEvent]:
+        """Return events with ``start <= time < end`` from the built years."""
+        times, events = self._times, self._events
+        i = bisect_left(times, start.timestamp())
+        j = bisect_left(times, end.timestamp())
+        return events[i:j]
+
+    def next_event(self, after: datetime) -> WheelEvent | None:
+        """Return the first event at or after ``after``, building as needed."""
+        year = after.year
+        while year <= MAX_YEAR:
+            if self._last_year is None or self._last_year < year:
+                self.ensure_range(after, datetime(year, 12, 31, tzinfo=timezone.utc))
+            times, events = self._times, self._events
+            i = bisect_left(times, after.timestamp())
+            if i < len(events):
+                return events[i]
+            year += 1
+        return None
@@ -0,0 +1,400 @@
+"""Automation triggers for Wheel of the Year events.
+
+```yaml
+trigger:
+  - platform: wheel_of_the_year
+    event: moon_phase
+    phase: full_moon
+```
+
+Every trigger on a wheel shares one scheduler. It keeps the wheel's sorted
+event timeline and arms a single timer for the next event that any attached
+trigger wants, so nothing is evaluated between events. While the wheel's
+coordinator replays a span, the timer waits and each replayed refresh fires
+the events passed since the previous one instead.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+from datetime import datetime, timedelta
+from typing import Callable
+
+import voluptuous as vol
+
+import homeassistant.helpers.config_validation as cv
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_PLATFORM
+from homeassistant.core import CALLBACK_TYPE, HassJob, HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.event import async_track_point_in_time
+from homeassistant.helpers.trigger import TriggerActionType, TriggerInfo
+from homeassistant.helpers.typing import ConfigType
+from homeassistant.util import slugify
+
+from .clock import SimulatedClock
+from .const import DOMAIN, PLANETS, SABBATS, SEASONS, ZODIAC
+from .coordinator import WheelCoordinator
+from .events import PHASE_NAMES
+from .timeline import (
+    KIND_INGRESS,
+    KIND_MOON_PHASE,
+    KIND_SABBAT,
+    KIND_SEASON,
+    Timeline,
+    WheelEvent,
+    season_changes,
+)
+
+CONF_EVENT = "event"
+CONF_CONFIG_ENTRY_ID = "config_entry_id"
+CONF_SABBAT = "sabbat"
+CONF_PHASE = "phase"
+CONF_BODY = "body"
+CONF_SIGN = "sign"
+CONF_SEASON = "season"
+
+# Filter values are slugs of the names on the events.
+FILTER_NAMES = {
+    CONF_SABBAT: {slugify(s.name): s.name for s in SABBATS},
+    CONF_PHASE: {slugify(name): name for name in PHASE_NAMES},
+    CONF_BODY: {slugify(p.name): p.name for p in PLANETS},
+    CONF_SIGN: {slugify(z.name): z.name for z in ZODIAC},
+    CONF_SEASON: {slugify(name): name for name in SEASONS},
+}
+
+# The filters each event accepts, and the event field each one matches.
+EVENT_FILTERS: dict[str, tuple[tuple[str, str], ...]] = {
+    KIND_SABBAT: ((CONF_SABBAT, "subject"),),
+    KIND_MOON_PHASE: ((CONF_PHASE, "subject"),),
+    KIND_INGRESS: ((CONF_BODY, "subject"), (CONF_SIGN, "detail")),
+    KIND_SEASON: ((CONF_SEASON, "subject"),),
+}
+
+TRIGGER_SCHEMA = cv.TRIGGER_BASE_SCHEMA.extend(
+    {
+        vol.Required(CONF_PLATFORM): DOMAIN,
+        vol.Required(CONF_EVENT): vol.In(list(EVENT_FILTERS)),
+        vol.Optional(CONF_CONFIG_ENTRY_ID): cv.string,
+        **{
+            vol.Optional(key): vol.In(list(names))
+            for key, names in FILTER_NAMES.items()
+        },
+    }
+)
+
+DATA_SCHEDULERS = f"{DOMAIN}_trigger_schedulers"
+# Schedulers of unloaded entries that still have triggers attached; they
+# start again if the entry comes back, as it does after a reload.
+DATA_STOPPED_SCHEDULERS = f"{DOMAIN}_stopped_trigger_schedulers"
+
+# How far ahead the timeline is built when looking for the next event.
+_LOOKAHEAD = timedelta(days=366)
+# Events at the same instant fire together; the next search starts after.
+_INSTANT = timedelta(microseconds=1)
+
+Matcher = Callable[[WheelEvent], bool]
+
+
+class TriggerScheduler:
+    """Fire every trigger on one wheel from a single timer."""
+
+    def __init__(self, hass: HomeAssistant, coordinator: WheelCoordinator) -> None:
+        self._hass = hass
+        self._coordinator = coordinator
+        self._tz = coordinator.time_zone
+        self._hemisphere = coordinator.hemisphere
+        self._timeline = Timeline(coordinator.hemisphere)
+        self._subscribers: list[tuple[Matcher, Callable[[WheelEvent], None]]] = []
+        self._unsub_timer: CALLBACK_TYPE | None = None
+        self._next_time: datetime | None = None
+        self._arm_task: asyncio.Task | None = None
+        self._stopped = False
+        # While replaying: events before the cursor have fired, and the
+        # replay has reached the target.
+        self._replay_cursor: datetime | None = None
+        self._replay_target: datetime | None = None
+        self._replay_task: asyncio.Task | None = None
+        self._unsub_coordinator = coordinator.async_add_listener(
+            self._async_handle_coordinator_update
+        )
+
+    @callback
+    def async_subscribe(
+        self, matches: Matcher, fire: Callable[[WheelEvent], None]
+    ) -> CALLBACK_TYPE:
+        """Call ``fire`` for every event ``matches`` accepts."""
+        subscriber = (matches, fire)
+        self._subscribers.append(subscriber)
+        self._async_rearm()
+
+        @callback
+        def unsubscribe() -> None:
+            self._subscribers.remove(subscriber)
+            self._async_rearm()
+
+        return unsubscribe
+
+    @property
+    def has_subscribers(self) -> bool:
+        return bool(self._subscribers)
+
+    @callback
+    def async_start(self, coordinator: WheelCoordinator) -> None:
+        """Start again after ``async_stop``, following a reloaded entry."""
+        self._coordinator = coordinator
+        self._tz = coordinator.time_zone
+        if coordinator.hemisphere != self._hemisphere:
+            self._hemisphere = coordinator.hemisphere
+            self._timeline = Timeline(coordinator.hemisphere)
+        self._unsub_coordinator = coordinator.async_add_listener(
+            self._async_handle_coordinator_update
+        )
+        self._stopped = False
+        self._async_rearm()
+
+    @callback
+    def async_stop(self) -> None:
+        """Cancel the timer and any pending build; nothing fires until started."""
+        self._stopped = True
+        self._unsub_coordinator()
+        if self._replay_task is not None:
+            self._replay_task.cancel()
+            self._replay_task = None
+        self._replay_cursor = None
+        self._async_rearm()
+
+    def _events(self, start: datetime, end: datetime) -> list[WheelEvent]:
+        """Timeline events and season changes with ``start <= time < end``."""
+        seasons = [
+            event
+            for event in season_changes(
+                start.astimezone(self._tz).date(),
+                end.astimezone(self._tz).date() + timedelta(days=1),
+                self._tz,
+                self._hemisphere,
+            )
+            if start <= event.time < end
+        ]
+        return list(
+            heapq.merge(
+                self._timeline.events_between(start, end),
+                seasons,
+                key=lambda event: event.time,
+            )
+        )
+
+    @callback
+    def _async_rearm(self, after: datetime | None = None) -> None:
+        self._async_cancel_timer()
+        if self._arm_task is not None:
+            self._arm_task.cancel()
+            self._arm_task = None
+        if self._subscribers and not self._stopped and self._replay_cursor is None:
+            self._arm_task = self._hass.async_create_task(self._async_arm(after))
+
+    async def _async_ensure_range(self, start: datetime, end: datetime) -> None:
+        if not self._timeline.covers(start, end):
+            # Building years runs the astronomy; never do that on the loop.
+            await self._hass.async_add_executor_job(
+                self._timeline.ensure_range, start, end
+            )
+
+    async def _async_arm(self, after: datetime | None) -> None:
+        start = after or self._coordinator.clock.now(self._tz)
+        end = start + _LOOKAHEAD
+        await self._async_ensure_range(start, end)
+
+        self._arm_task = None
+        when = next(
+            (
+                event.time
+                for event in self._events(start, end)
+                if any(matches(event) for matches, _ in self._subscribers)
+            ),
+            None,
+        )
+        if when is None:
+            # Nothing wanted within the lookahead; search again from there.
+            self._unsub_timer = async_track_point_in_time(
+                self._hass, self._async_handle_lookahead, end
+            )
+        else:
+            self._next_time = when
+            self._unsub_timer = async_track_point_in_time(
+                self._hass, self._async_handle_event, when
+            )
+
+    @callback
+    def _async_handle_lookahead(self, now: datetime) -> None:
+        self._unsub_timer = None
+        self._async_rearm()
+
+    @callback
+    def _async_handle_event(self, now: datetime) -> None:
+        """Fire the events due now, then arm for the next one."""
+        self._unsub_timer = None
+        when = self._next_time
+        self._async_fire(self._events(when, when + _INSTANT))
+        self._async_rearm(when + _INSTANT)
+
+    @callback
+    def _async_fire(self, events: list[WheelEvent]) -> None:
+        for event in events:
+            for matches, fire in list(self._subscribers):
+                if matches(event):
+                    fire(event)
+
+    @callback
+    def _async_handle_coordinator_update(self) -> None:
+        """Follow a replay: fire what each replayed refresh has passed."""
+        if self._stopped or (data := self._coordinator.data) is None:
+            return
+        if isinstance(self._coordinator.clock, SimulatedClock):
+            if self._replay_cursor is None:
+                # A replay started; real time waits until it ends.
+                self._replay_cursor = data.now
+                self._async_rearm()
+            self._replay_target = data.now
+            if self._replay_task is None:
+                self._replay_task = self._hass.async_create_task(
+                    self._async_catch_up()
+                )
+        elif self._replay_cursor is not None and self._replay_task is None:
+            self._replay_cursor = None
+            self._async_rearm()
+
+    async def _async_catch_up(self) -> None:
+        """Fire the events up to the replay's latest refresh, in order."""
+        try:
+            while self._replay_cursor < self._replay_target:
+                start, end = self._replay_cursor, self._replay_target
+                await self._async_ensure_range(start, max(end, start + _LOOKAHEAD))
+                self._async_fire(self._events(start, end))
+                self._replay_cursor = end
+        finally:
+            self._replay_task = None
+        if not isinstance(self._coordinator.clock, SimulatedClock):
+            # The replay ended while this caught up; back to real time.
+            self._replay_cursor = None
+            self._async_rearm()
+
+    @callback
+    def _async_cancel_timer(self) -> None:
+        if self._unsub_timer is not None:
+            self._unsub_timer()
+            self._unsub_timer = None
+
+
+@callback
+def _async_get_scheduler(hass: HomeAssistant, entry: ConfigEntry) -> TriggerScheduler:
+    coordinator: WheelCoordinator | None = hass.data.get(DOMAIN, {}).get(
+        entry.entry_id
+    )
+    if coordinator is None:
+        raise HomeAssistantError(f"Wheel of the Year entry {entry.title} is not loaded")
+    schedulers: dict[str, TriggerScheduler] = hass.data.setdefault(
+        DATA_SCHEDULERS, {}
+    )
+    if (scheduler := schedulers.get(entry.entry_id)) is None:
+        stopped = hass.data.get(DATA_STOPPED_SCHEDULERS, {})
+        if (scheduler := stopped.pop(entry.entry_id, None)) is not None:
+            scheduler.async_start(coordinator)
+        else:
+            scheduler = TriggerScheduler(hass, coordinator)
+        schedulers[entry.entry_id] = scheduler
+    return scheduler
+
+
+@callback
+def async_restart_scheduler(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Resume the triggers left attached when the entry last unloaded."""
+    if entry.entry_id in hass.data.get(DATA_STOPPED_SCHEDULERS, {}):
+        _async_get_scheduler(hass, entry)
+
+
+@callback
+def async_stop_scheduler(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Stop the entry's scheduler when the entry unloads."""
+    scheduler = hass.data.get(DATA_SCHEDULERS, {}).pop(entry.entry_id, None)
+    if scheduler is None:
+        return
+    scheduler.async_stop()
+    if scheduler.has_subscribers:
+        hass.data.setdefault(DATA_STOPPED_SCHEDULERS, {})[entry.entry_id] = scheduler
+
+
+def _matcher(config: ConfigType) -> Matcher:
+    """Return a predicate for the events a trigger config selects."""
+    kind = config[CONF_EVENT]
+    wanted = tuple(
+        (field, FILTER_NAMES[key][config[key]])
+        for key, field in EVENT_FILTERS[kind]
+        if key in config
+    )
+
+    def matches(event: WheelEvent) -> bool:
+        return event.kind == kind and all(
+            getattr(event, field) == name for field, name in wanted
+        )
+
+    return matches
+
+
+async def async_validate_trigger_config(
+    hass: HomeAssistant, config: ConfigType
+) -> ConfigType:
+    """Validate a trigger config and reject filters its event does not use."""
+    config = TRIGGER_SCHEMA(config)
+    allowed = {key for key, _ in EVENT_FILTERS[config[CONF_EVENT]]}
+    for key in FILTER_NAMES:
+        if key in config and key not in allowed:
+            raise vol.Invalid(
+                f"'{key}' does not apply to {config[CONF_EVENT]} events"
+            )
+    return config
+
+
+async def async_attach_trigger(
+    hass: HomeAssistant,
+    config: ConfigType,
+    action: TriggerActionType,
+    trigger_info: TriggerInfo,
+) -> CALLBACK_TYPE:
+    """Listen for wheel events matching a trigger config."""
+    if (entry_id := config.get(CONF_CONFIG_ENTRY_ID)) is not None:
+        entry = hass.config_entries.async_get_entry(entry_id)
+        if entry is None or entry.domain != DOMAIN:
+            raise HomeAssistantError(f"No Wheel of the Year entry with id {entry_id}")
+    elif loaded := [
+        entry
+        for entry in hass.config_entries.async_entries(DOMAIN)
+        if entry.entry_id in hass.data.get(DOMAIN, {})
+    ]:
+        entry = loaded[0]
+    else:
+        raise HomeAssistantError("No Wheel of the Year entry is loaded")
+
+    trigger_data = trigger_info["trigger_data"]
+    job = HassJob(action, f"{DOMAIN} trigger {config[CONF_EVENT]}")
+
+    @callback
+    def fire(event: WheelEvent) -> None:
+        hass.async_run_hass_job(
+            job,
+            {
+                "trigger": {
+                    **trigger_data,
+                    "platform": DOMAIN,
+                    "event": event.kind,
+                    "name": event.subject,
+                    "detail": event.detail,
+                    "summary": event.summary,
+                    "time": event.time,
+                    "description": f"{event.summary} at {event.time.isoformat()}",
+                }
+            },
+        )
+
+    return _async_get_scheduler(hass, entry).async_subscribe(_matcher(config), fire)
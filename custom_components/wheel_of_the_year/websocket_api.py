@@ -0,0 +1,127 @@
+"""Websocket API for the Wheel of the Year integration."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.components import websocket_api
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+
+from .const import DOMAIN, SIGNAL_COORDINATOR_READY
+from .coordinator import WheelCoordinator, build_card_payload
+from .lore import load_lore
+
+
+@callback
+def async_register_websocket_commands(hass: HomeAssistant) -> None:
+    """Register the integration's websocket commands."""
+    websocket_api.async_register_command(hass, ws_get_lore)
+    websocket_api.async_register_command(hass, ws_subscribe)
+
+
+@websocket_api.websocket_command({vol.Required("type"): f"{DOMAIN}/lore"})
+@websocket_api.async_response
+async def ws_get_lore(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Return the static sabbat, zodiac, moon and season reference text.
+
+    This content never changes at runtime, so the card fetches it once
+    instead of reading it from recorded entity attributes.
+    """
+    connection.send_result(msg["id"], await hass.async_add_executor_job(load_lore))
+
+
+def _async_get_coordinator(
+    hass: HomeAssistant, entry_id: str | None
+) -> WheelCoordinator | None:
+    coordinators = hass.data.get(DOMAIN, {})
+    if entry_id is not None:
+        return coordinators.get(entry_id)
+    return next(iter(coordinators.values()), None)
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): f"{DOMAIN}/subscribe",
+        vol.Optional("entry_id"): str,
+    }
+)
+@callback
+def ws_subscribe(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Stream the card payload, sending only fields that changed.
+
+    The first event carries the full payload under ``full``; every later
+    event carries just the top-level keys whose value differs under
+    ``changed``. Refreshes that change nothing send nothing. When the
+    entry reloads, the subscription follows it to the new coordinator.
+    """
+    coordinator = _async_get_coordinator(hass, msg.get("entry_id"))
+    if coordinator is None:
+        connection.send_error(
+            msg["id"], websocket_api.ERR_NOT_FOUND, "Integration not set up"
+        )
+        return
+
+    entry_id = coordinator.entry.entry_id
+    last_sent: dict[str, Any] = {}
+    unsub_listener: CALLBACK_TYPE | None = None
+
+    @callback
+    def forward_update() -> None:
+        if coordinator.data is None:
+            return
+        payload = build_card_payload(coordinator.data)
+        if not last_sent:
+            last_sent.update(payload)
+            connection.send_message(
+                websocket_api.event_message(msg["id"], {"full": payload})
+            )
+            return
+        changed = {
+            key: value
+            for key, value in payload.items()
+            if last_sent.get(key) != value
+        }
+        if changed:
+            last_sent.update(changed)
+            connection.send_message(
+                websocket_api.event_message(msg["id"], {"changed": changed})
+            )
+
+    @callback
+    def attach(current: WheelCoordinator) -> None:
+        nonlocal coordinator, unsub_listener
+        if unsub_listener is not None:
+            unsub_listener()
+        coordinator = current
+        unsub_listener = coordinator.async_add_listener(forward_update)
+
+    @callback
+    def async_coordinator_ready(ready_entry_id: str) -> None:
+        if ready_entry_id == entry_id:
+            attach(hass.data[DOMAIN][entry_id])
+            forward_update()
+
+    attach(coordinator)
+    unsub_signal = async_dispatcher_connect(
+        hass, SIGNAL_COORDINATOR_READY, async_coordinator_ready
+    )
+
+    @callback
+    def unsubscribe() -> None:
+        unsub_signal()
+        unsub_listener()
+
+    connection.subscriptions[msg["id"]] = unsubscribe
+    connection.send_result(msg["id"])
+    forward_update()
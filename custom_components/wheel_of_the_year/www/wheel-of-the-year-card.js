@@ -1,6 +1,6 @@
 /**
  * Wheel of the Year — Custom Lovelace Card for Home Assistant
- * v1.1.0
+ * v1.2.0
  *
  * Renders the full interactive Wheel of the Year visualization,
  * reading live data from the wheel_of_the_year integration sensors.
@@ -54,14 +54,91 @@ const MONTH_COLORS = [
   'rgba(160,80,60,0.20)',   'rgba(120,70,90,0.20)',   'rgba(80,100,150,0.20)',
 ];
 
+// The twinkle is slow, so a low frame rate looks the same at a fraction of
+// the cost.
+const STAR_COUNT = 80;
+const STAR_FPS = 12;
+
+// Yule sits at the top of the wheel. South of the equator it falls at the
+// June solstice, so the calendar and zodiac rings turn half-way round while
+// the sabbat ring stays put.
+const yuleDayOfYear = (isLeap, south) => (south ? 172 : 355) + (isLeap ? 1 : 0);
+const YULE_LONGITUDE = { north: 270, south: 90 };
+
 const PLANET_RING_NAMES = ['Mercury','Venus','Mars','Jupiter','Saturn','Uranus','Neptune','Pluto'];
 
+// Static lore (descriptions, traditions, magick) is fetched once over the
+// websocket API and shared by every card instance on the page.
+let lorePromise = null;
+const loadLore = (hass) => {
+  if (!lorePromise) {
+    lorePromise = hass.callWS({ type: 'wheel_of_the_year/lore' }).catch((err) => {
+      console.warn('wheel-of-the-year-card: could not load lore', err);
+      lorePromise = null;
+      return null;
+    });
+  }
+  return lorePromise;
+};
+
 class WheelOfTheYearCard extends HTMLElement {
   set hass(hass) {
     this._hass = hass;
     if (!this._initialized) {
       this._init();
       this._initialized = true;
+      // Observers created by _init() miss the connect that already happened.
+      if (this.isConnected) this.connectedCallback();
+    }
+    if (!this._lore) {
+      loadLore(hass).then((lore) => {
+        if (!lore || this._lore) return;
+        this._lore = lore;
+        if (this._infoGrid && this._stateAttrs) this._updateInfoPanels();
+      });
+    }
+    // Wheel data arrives over our own subscription; unrelated state changes
+    // elsewhere in Home Assistant no longer trigger a repaint.
+    this._subscribe();
+  }
+
+  async _subscribe() {
+    if (this._unsub || this._subscribing || !this._hass || !this.isConnected) return;
+    this._subscribing = true;
+    try {
+      const unsub = await this._hass.connection.subscribeMessage(
+        (msg) => this._onWheelMessage(msg),
+        {
+          type: 'wheel_of_the_year/subscribe',
+          ...(this._config.entry_id ? { entry_id: this._config.entry_id } : {}),
+        },
+      );
+      if (this.isConnected) {
+        this._unsub = unsub;
+      } else {
+        unsub();
+      }
+    } catch (err) {
+      console.warn('wheel-of-the-year-card: could not subscribe', err);
+    } finally {
+      this._subscribing = false;
+    }
+  }
+
+  _unsubscribe() {
+    if (this._unsub) {
+      this._unsub();
+      this._unsub = null;
+    }
+  }
+
+  _onWheelMessage(msg) {
+    if (msg.full) {
+      this._stateAttrs = msg.full;
+    } else if (msg.changed && this._stateAttrs) {
+      this._stateAttrs = { ...this._stateAttrs, ...msg.changed };
+    } else {
+      return;
     }
     this._update();
   }
@@ -111,15 +188,8 @@ class WheelOfTheYearCard extends HTMLElement {
         font-family: Georgia, 'Times New Roman', serif;
       }
       .stars {
-        position: absolute; inset: 0; overflow: hidden; pointer-events: none;
-      }
-      .star {
-        position: absolute; border-radius: 50%; background: white;
-        animation: twinkle var(--dur) ease-in-out infinite alternate;
-      }
-      @keyframes twinkle {
-        0% { opacity: var(--min-o, 0.1); transform: scale(1); }
-        100% { opacity: var(--max-o, 0.8); transform: scale(1.3); }
+        position: absolute; inset: 0; width: 100%; height: 100%;
+        max-width: none; pointer-events: none;
       }
       .title {
         text-align: center; font-size: 1.4em; font-weight: 700;
@@ -215,16 +285,28 @@ class WheelOfTheYearCard extends HTMLElement {
 
     // Stars
     if (this._config.show_stars) {
-      const stars = document.createElement('div');
-      stars.className = 'stars';
-      for (let i = 0; i < 80; i++) {
-        const s = document.createElement('div');
-        s.className = 'star';
-        const sz = Math.random() * 2 + 0.5;
-        s.style.cssText = `width:${sz}px;height:${sz}px;left:${Math.random()*100}%;top:${Math.random()*100}%;--dur:${2+Math.random()*5}s;--min-o:${Math.random()*0.15};--max-o:${0.3+Math.random()*0.5};animation-delay:${Math.random()*5}s;`;
-        stars.appendChild(s);
-      }
-      card.appendChild(stars);
+      this._starCanvas = document.createElement('canvas');
+      this._starCanvas.className = 'stars';
+      this._stars = Array.from({ length: STAR_COUNT }, () => ({
+        x: Math.random(),
+        y: Math.random(),
+        size: Math.random() * 2 + 0.5,
+        period: (2 + Math.random() * 5) * 2000,
+        offset: Math.random() * Math.PI * 2,
+        minO: Math.random() * 0.15,
+        maxO: 0.3 + Math.random() * 0.5,
+      }));
+      card.appendChild(this._starCanvas);
+
+      this._starsInView = true;
+      this._starsTick = (t) => this._onStarFrame(t);
+      this._onVisibility = () => this._syncStarfield();
+      this._reducedMotion = window.matchMedia('(prefers-reduced-motion: reduce)');
+      this._reducedMotion.addEventListener('change', this._onVisibility);
+      this._io = new IntersectionObserver((entries) => {
+        this._starsInView = entries[entries.length - 1].isIntersecting;
+        this._syncStarfield();
+      });
     }
 
     // Title
@@ -274,33 +356,88 @@ class WheelOfTheYearCard extends HTMLElement {
     }, { passive: true });
     this._canvas.addEventListener('touchend', () => this._hideTooltip());
 
-    this._ro = new ResizeObserver(() => this._draw());
+    this._ro = new ResizeObserver(() => {
+      this._resizeStars();
+      this._draw();
+    });
     this._ro.observe(this._card);
   }
 
-  _update() {
-    if (!this._hass || !this._config) return;
-    const entity = this._hass.states[this._config.entity];
-    if (!entity) return;
-    this._stateAttrs = entity.attributes || {};
-
-    if (this._subtitleEl) {
-      const now = new Date();
-      this._subtitleEl.textContent = now.toLocaleDateString('en-US', {
-        weekday: 'long', year: 'numeric', month: 'long', day: 'numeric',
-        hour: 'numeric', minute: '2-digit'
-      });
+  // ════════════════════════════════════════════════════════════
+  // STARFIELD
+  // ════════════════════════════════════════════════════════════
+
+  _resizeStars() {
+    const c = this._starCanvas;
+    if (!c) return;
+    const dpr = window.devicePixelRatio || 1;
+    c.width = Math.round(this._card.clientWidth * dpr);
+    c.height = Math.round(this._card.clientHeight * dpr);
+    this._paintStars(performance.now());
+  }
+
+  _syncStarfield() {
+    if (!this._starCanvas) return;
+    const animate = this.isConnected && this._starsInView
+      && document.visibilityState === 'visible' && !this._reducedMotion.matches;
+    if (animate && !this._starFrame) {
+      this._starFrame = requestAnimationFrame(this._starsTick);
+    } else if (!animate && this._starFrame) {
+      cancelAnimationFrame(this._starFrame);
+      this._starFrame = null;
+    }
+    // With reduced motion the field is painted once and then left still.
+    if (!animate) this._paintStars(0);
+  }
+
+  _onStarFrame(t) {
+    this._starFrame = requestAnimationFrame(this._starsTick);
+    if (this._lastStarPaint && t - this._lastStarPaint < 1000 / STAR_FPS) return;
+    this._lastStarPaint = t;
+    this._paintStars(t);
+  }
+
+  _paintStars(t) {
+    const c = this._starCanvas;
+    if (!c || !c.width) return;
+    const ctx = c.getContext('2d');
+    const dpr = window.devicePixelRatio || 1;
+    ctx.setTransform(1, 0, 0, 1, 0, 0);
+    ctx.clearRect(0, 0, c.width, c.height);
+    ctx.fillStyle = '#fff';
+    for (const star of this._stars) {
+      const k = 0.5 - 0.5 * Math.cos((t / star.period) * Math.PI * 2 + star.offset);
+      const r = (star.size / 2) * (1 + 0.3 * k) * dpr;
+      ctx.globalAlpha = star.minO + (star.maxO - star.minO) * k;
+      ctx.beginPath();
+      ctx.arc(star.x * c.width, star.y * c.height, r, 0, Math.PI * 2);
+      ctx.fill();
     }
+    ctx.globalAlpha = 1;
+  }
 
+  _update() {
+    if (!this._config || !this._stateAttrs) return;
+    this._updateSubtitle();
     this._draw();
     if (this._infoGrid) this._updateInfoPanels();
   }
 
+  _updateSubtitle() {
+    if (!this._subtitleEl) return;
+    const now = new Date();
+    this._subtitleEl.textContent = now.toLocaleDateString('en-US', {
+      weekday: 'long', year: 'numeric', month: 'long', day: 'numeric',
+      hour: 'numeric', minute: '2-digit'
+    });
+  }
+
   // ════════════════════════════════════════════════════════════
   // DRAWING
   // ════════════════════════════════════════════════════════════
 
   _draw() {
+    if (!this._stateAttrs) return;
     const c = this._canvas;
     const wrapper = c.parentElement;
     if (!wrapper) return;
@@ -310,24 +447,66 @@ class WheelOfTheYearCard extends HTMLElement {
     if (size <= 0) return;
 
     const dpr = window.devicePixelRatio || 1;
-    c.width = size * dpr;
-    c.height = size * dpr;
-    c.style.width = size + 'px';
-    c.style.height = size + 'px';
+    const px = Math.round(size * dpr);
+    if (c.width !== px || c.height !== px) {
+      c.width = px;
+      c.height = px;
+      c.style.width = size + 'px';
+      c.style.height = size + 'px';
+    }
 
     const ctx = c.getContext('2d');
+    ctx.setTransform(1, 0, 0, 1, 0, 0);
+    ctx.clearRect(0, 0, px, px);
+
+    const geo = this._geometry(size);
+    this._CX = geo.CX;
+    this._CY = geo.CY;
+    this._R = geo.R;
+
+    const now = new Date();
+    const year = now.getFullYear();
+    const month = now.getMonth() + 1;
+
+    // The rings only change with the size, the DPR or the calendar, so they
+    // are painted once into off-screen layers and composited on each update.
+    const hemisphere = this._south() ? 'south' : 'north';
+    const calendar = this._layer('calendar', `${size}|${dpr}|${hemisphere}|${year}|${month}`, px, dpr,
+      (lctx, zones) => this._paintCalendarRings(lctx, geo, year, month, zones));
+    const sky = this._layer('sky', `${size}|${dpr}|${hemisphere}`, px, dpr,
+      (lctx, zones) => this._paintSkyRings(lctx, geo, zones));
+    ctx.drawImage(calendar.canvas, 0, 0);
+    ctx.drawImage(sky.canvas, 0, 0);
+    this._hitZones = calendar.zones.concat(sky.zones);
+
     ctx.setTransform(dpr, 0, 0, dpr, 0, 0);
-    ctx.clearRect(0, 0, size, size);
+    this._paintMarkers(ctx, geo, now);
+  }
+
+  _layer(name, key, px, dpr, paint) {
+    if (!this._layers) this._layers = {};
+    const cached = this._layers[name];
+    if (cached && cached.key === key) return cached;
+
+    const canvas = cached ? cached.canvas : document.createElement('canvas');
+    // Assigning the size also clears the previous contents.
+    canvas.width = px;
+    canvas.height = px;
+    const lctx = canvas.getContext('2d');
+    lctx.setTransform(dpr, 0, 0, dpr, 0, 0);
+    const zones = [];
+    paint(lctx, zones);
+
+    const layer = { key, canvas, zones };
+    this._layers[name] = layer;
+    return layer;
+  }
 
+  _geometry(size) {
     const CX = size / 2;
     const CY = size / 2;
     const R = size / 2 - 10;
 
-    this._CX = CX;
-    this._CY = CY;
-    this._R = R;
-    this._hitZones = [];
-
     // Ring radii (outside → in)
     const monthsOuter = R;
     const monthsInner = R * 0.94;
@@ -348,29 +527,41 @@ class WheelOfTheYearCard extends HTMLElement {
     const planetRingSpacing = (planetRingEnd - planetRingStart) / PLANET_RING_NAMES.length;
     const planetRings = PLANET_RING_NAMES.map((_, i) => planetRingStart + planetRingSpacing * (i + 0.5));
 
-    const now = new Date();
-    const year = now.getFullYear();
-    const isLeap = (year % 4 === 0 && year % 100 !== 0) || (year % 400 === 0);
-    const totalDays = isLeap ? 366 : 365;
-    const yuleDay = isLeap ? 356 : 355;
-    const currentMonth = now.getMonth() + 1;
-
-    const dayOfYear = (d) => {
-      const start = new Date(d.getFullYear(), 0, 0);
-      return Math.floor((d - start) / 86400000);
+    return {
+      size, CX, CY, R,
+      monthsOuter, monthsInner, daysOuter, daysInner,
+      zodiacOuter, zodiacInner, sabbatOuter, sabbatInner,
+      innerCircle, centerR, solarRingInner, solarRingOuter, planetRings,
     };
-    const currentDOY = dayOfYear(now);
+  }
 
+  _calendar(year) {
+    const isLeap = (year % 4 === 0 && year % 100 !== 0) || (year % 400 === 0);
+    const totalDays = isLeap ? 366 : 365;
+    const yuleDay = yuleDayOfYear(isLeap, this._south());
     const doyForDate = (m, d) => {
       const dt = new Date(year, m - 1, d);
       const start = new Date(year, 0, 0);
       return Math.floor((dt - start) / 86400000);
     };
-
     const wheelAngleForDoy = (doy) => {
       const shifted = (doy - yuleDay + totalDays) % totalDays;
       return (shifted / totalDays) * 360;
     };
+    return { isLeap, totalDays, doyForDate, wheelAngleForDoy };
+  }
+
+  _dayArc(wheelAngleForDoy, totalDays, d) {
+    const dayArcSpan = 360 / totalDays;
+    const dayGap = 0.15;
+    const startDeg = wheelAngleForDoy(d) - 90 - dayArcSpan / 2 + dayGap / 2;
+    const endDeg = startDeg + dayArcSpan - dayGap;
+    return [startDeg * Math.PI / 180, endDeg * Math.PI / 180];
+  }
+
+  _paintCalendarRings(ctx, geo, year, currentMonth, zones) {
+    const { size, CX, CY, R, monthsOuter, monthsInner, daysOuter, daysInner } = geo;
+    const { isLeap, totalDays, doyForDate, wheelAngleForDoy } = this._calendar(year);
 
     // ── Outer glow ──
     const glow = ctx.createRadialGradient(CX, CY, R * 0.4, CX, CY, R * 1.05);
@@ -432,7 +623,7 @@ class WheelOfTheYearCard extends HTMLElement {
       ctx.fillText(m.name, 0, 0);
       ctx.restore();
 
-      this._hitZones.push({
+      zones.push({
         type: 'month', index: mi,
         startAngle: startRad % (Math.PI * 2),
         endAngle: endRad % (Math.PI * 2),
@@ -446,33 +637,19 @@ class WheelOfTheYearCard extends HTMLElement {
     ctx.strokeStyle = 'rgba(201,168,76,0.45)'; ctx.lineWidth = 2; ctx.stroke();
 
     // ── Days Ring ──
-    const dayArcSpan = 360 / totalDays;
-    const dayGap = 0.15;
     for (let d = 1; d <= totalDays; d++) {
-      const startDeg = wheelAngleForDoy(d) - 90 - dayArcSpan / 2 + dayGap / 2;
-      const endDeg = startDeg + dayArcSpan - dayGap;
-      const startRad = startDeg * Math.PI / 180;
-      const endRad = endDeg * Math.PI / 180;
+      const [startRad, endRad] = this._dayArc(wheelAngleForDoy, totalDays, d);
 
       ctx.beginPath();
       ctx.arc(CX, CY, daysOuter - 1, startRad, endRad);
       ctx.arc(CX, CY, daysInner + 1, endRad, startRad, true);
       ctx.closePath();
 
-      const isToday = d === currentDOY;
-      if (isToday) {
-        ctx.fillStyle = 'rgba(255,220,100,0.8)';
-        ctx.shadowColor = 'rgba(255,220,100,0.5)';
-        ctx.shadowBlur = 6;
-      } else {
-        ctx.fillStyle = d % 2 === 0
-          ? 'rgba(201,168,76,0.08)' : 'rgba(201,168,76,0.04)';
-        ctx.shadowBlur = 0;
-      }
+      ctx.fillStyle = d % 2 === 0
+        ? 'rgba(201,168,76,0.08)' : 'rgba(201,168,76,0.04)';
       ctx.fill();
-      ctx.shadowBlur = 0;
 
-      if (d % 7 === 0 && !isToday) {
+      if (d % 7 === 0) {
         ctx.fillStyle = 'rgba(201,168,76,0.15)';
         ctx.fill();
       }
@@ -483,6 +660,13 @@ class WheelOfTheYearCard extends HTMLElement {
     ctx.strokeStyle = 'rgba(201,168,76,0.3)'; ctx.lineWidth = 1; ctx.stroke();
     ctx.beginPath(); ctx.arc(CX, CY, daysInner, 0, Math.PI * 2);
     ctx.strokeStyle = 'rgba(201,168,76,0.3)'; ctx.lineWidth = 1; ctx.stroke();
+  }
+
+  _paintSkyRings(ctx, geo, zones) {
+    const {
+      CX, CY, R, zodiacOuter, zodiacInner, sabbatOuter, sabbatInner,
+      innerCircle, solarRingInner, solarRingOuter, planetRings,
+    } = geo;
 
     // ── Zodiac Ring ──
     for (let i = 0; i < 12; i++) {
@@ -516,7 +700,7 @@ class WheelOfTheYearCard extends HTMLElement {
       ctx.textBaseline = 'middle';
       ctx.fillText(ZODIAC[i].symbol, CX + Math.cos(midAngle) * lr, CY + Math.sin(midAngle) * lr);
 
-      this._hitZones.push({
+      zones.push({
         type: 'zodiac', index: i,
         startAngle: startRad, endAngle: endRad,
         innerR: zodiacInner, outerR: zodiacOuter,
@@ -575,7 +759,7 @@ class WheelOfTheYearCard extends HTMLElement {
       ctx.fillText(sabbat.name, 0, 0);
       ctx.restore();
 
-      this._hitZones.push({
+      zones.push({
         type: 'sabbat', index: i,
         startAngle: startRad, endAngle: endRad,
         innerR: sabbatInner, outerR: sabbatOuter,
@@ -591,7 +775,6 @@ class WheelOfTheYearCard extends HTMLElement {
     ctx.strokeStyle = 'rgba(201,168,76,0.35)'; ctx.lineWidth = 1.5; ctx.stroke();
 
     // ── Solar Cycle Ring ──
-    const solarData = this._stateAttrs.solar_cycle || {};
     for (let deg = 0; deg < 360; deg += 1) {
       const rad1 = (deg - 90) * Math.PI / 180;
       const rad2 = (deg - 89) * Math.PI / 180;
@@ -613,7 +796,47 @@ class WheelOfTheYearCard extends HTMLElement {
     ctx.beginPath(); ctx.arc(CX, CY, solarRingInner, 0, Math.PI * 2);
     ctx.strokeStyle = 'rgba(232,160,50,0.2)'; ctx.lineWidth = 0.5; ctx.stroke();
 
-    // Solar marker
+    // ☉ and min labels
+    const solarMarkerR = (solarRingInner + solarRingOuter) / 2;
+    ctx.font = `${R * 0.025}px serif`;
+    ctx.fillStyle = 'rgba(232,197,90,0.4)';
+    ctx.textAlign = 'center'; ctx.textBaseline = 'middle';
+    ctx.fillText('☉', CX, CY - solarMarkerR);
+    ctx.fillStyle = 'rgba(150,130,90,0.25)';
+    ctx.font = `${R * 0.018}px serif`;
+    ctx.fillText('min', CX, CY + solarMarkerR);
+
+    // ── Planet Rings ──
+    planetRings.forEach((pr, i) => {
+      ctx.beginPath(); ctx.arc(CX, CY, pr, 0, Math.PI * 2);
+      ctx.strokeStyle = `rgba(201,168,76,${0.05 + i * 0.008})`;
+      ctx.lineWidth = 0.5; ctx.stroke();
+    });
+  }
+
+  _paintMarkers(ctx, geo, now) {
+    const {
+      CX, CY, R, monthsOuter, daysOuter, daysInner, sabbatOuter, sabbatInner,
+      centerR, solarRingInner, solarRingOuter, planetRings,
+    } = geo;
+
+    // ── Today ──
+    const { totalDays, wheelAngleForDoy } = this._calendar(now.getFullYear());
+    const currentDOY = Math.floor((now - new Date(now.getFullYear(), 0, 0)) / 86400000);
+    const [todayStart, todayEnd] = this._dayArc(wheelAngleForDoy, totalDays, currentDOY);
+    ctx.save();
+    ctx.beginPath();
+    ctx.arc(CX, CY, daysOuter - 1, todayStart, todayEnd);
+    ctx.arc(CX, CY, daysInner + 1, todayEnd, todayStart, true);
+    ctx.closePath();
+    ctx.fillStyle = 'rgba(255,220,100,0.8)';
+    ctx.shadowColor = 'rgba(255,220,100,0.5)';
+    ctx.shadowBlur = 6;
+    ctx.fill();
+    ctx.restore();
+
+    // ── Solar Marker ──
+    const solarData = this._stateAttrs.solar_cycle || {};
     const solarProgress = solarData.progress || 0;
     const solarPhase = solarData.phase || 0;
     let solarAngleDeg;
@@ -637,15 +860,6 @@ class WheelOfTheYearCard extends HTMLElement {
     ctx.fill();
     ctx.restore();
 
-    // ☉ and min labels
-    ctx.font = `${R * 0.025}px serif`;
-    ctx.fillStyle = 'rgba(232,197,90,0.4)';
-    ctx.textAlign = 'center'; ctx.textBaseline = 'middle';
-    ctx.fillText('☉', CX, CY - solarMarkerR);
-    ctx.fillStyle = 'rgba(150,130,90,0.25)';
-    ctx.font = `${R * 0.018}px serif`;
-    ctx.fillText('min', CX, CY + solarMarkerR);
-
     this._hitZones.push({
       type: 'solar_cycle',
       cx: smx, cy: smy,
@@ -653,21 +867,16 @@ class WheelOfTheYearCard extends HTMLElement {
       data: solarData,
     });
 
-    // ── Planet Rings ──
+    // ── Planets ──
     const planets = this._stateAttrs.planets || [];
-    planetRings.forEach((pr, i) => {
-      ctx.beginPath(); ctx.arc(CX, CY, pr, 0, Math.PI * 2);
-      ctx.strokeStyle = `rgba(201,168,76,${0.05 + i * 0.008})`;
-      ctx.lineWidth = 0.5; ctx.stroke();
-    });
-
     planets.forEach((p) => {
       if (p.name === 'Sun' || p.name === 'Moon') return;
       const ringIdx = PLANET_RING_NAMES.indexOf(p.name);
       if (ringIdx === -1) return;
 
       const pr = planetRings[ringIdx];
-      const eclipticToWheel = (p.longitude - 270 + 360) % 360;
+      const yuleLongitude = YULE_LONGITUDE[this._south() ? 'south' : 'north'];
+      const eclipticToWheel = (p.longitude - yuleLongitude + 360) % 360;
       const aRad = (eclipticToWheel - 90) * Math.PI / 180;
       const px = CX + Math.cos(aRad) * pr;
       const py = CY + Math.sin(aRad) * pr;
@@ -776,9 +985,14 @@ class WheelOfTheYearCard extends HTMLElement {
   // HELPERS
   // ════════════════════════════════════════════════════════════
 
+  _south() {
+    return !!this._stateAttrs && this._stateAttrs.hemisphere === 'south';
+  }
+
   _zodiacStartAngle(index) {
-    const capIdx = 9;
-    const offset = (index - capIdx + 12) % 12;
+    // Capricorn (Cancer in the south) begins at Yule, the top of the wheel.
+    const topIdx = this._south() ? 3 : 9;
+    const offset = (index - topIdx + 12) % 12;
     return offset * 30;
   }
 
@@ -787,11 +1001,23 @@ class WheelOfTheYearCard extends HTMLElement {
     const doy = Math.floor((date - start) / 86400000);
     const isLeap = (date.getFullYear() % 4 === 0 && date.getFullYear() % 100 !== 0) || (date.getFullYear() % 400 === 0);
     const total = isLeap ? 366 : 365;
-    const yuleDay = isLeap ? 356 : 355;
+    const yuleDay = yuleDayOfYear(isLeap, this._south());
     const shifted = (doy - yuleDay + total) % total;
     return (shifted / total) * 360;
   }
 
+  _sabbatLore(index) {
+    return (this._lore && this._lore.sabbats[index]) || {};
+  }
+
+  _moonLore() {
+    return (this._lore && this._lore.moon_phases[this._stateAttrs.moon_phase_index]) || {};
+  }
+
+  _seasonLore() {
+    return (this._lore && this._lore.seasons[this._stateAttrs.season]) || {};
+  }
+
   // ════════════════════════════════════════════════════════════
   // TOOLTIP / HOVER
   // ════════════════════════════════════════════════════════════
@@ -810,11 +1036,12 @@ class WheelOfTheYearCard extends HTMLElement {
       if (zone.type === 'sabbat') {
         const s = SABBATS[zone.index];
         const sd = sabbats[zone.index] || {};
+        const lore = this._sabbatLore(zone.index);
         data = {
           sym: s.icon,
           title: `${s.name} — ${sd.alt_name || ''}`,
           date: sd.next_date ? `Next: ${sd.next_date}` : '',
-          desc: (sd.description || '') + (sd.traditions ? '\n\nTraditions: ' + sd.traditions : ''),
+          desc: (lore.description || '') + (lore.traditions ? '\n\nTraditions: ' + lore.traditions : ''),
         };
       } else if (zone.type === 'zodiac') {
         const z = ZODIAC[zone.index];
@@ -836,12 +1063,13 @@ class WheelOfTheYearCard extends HTMLElement {
           desc: `${p.name} is currently transiting ${p.sign_name}.`,
         };
       } else if (zone.type === 'moon') {
+        const lore = this._moonLore();
         data = {
           sym: this._stateAttrs.moon_emoji || '🌙',
           title: this._stateAttrs.moon_phase || 'Moon',
           date: `${Math.round(this._stateAttrs.moon_illumination || 0)}% illuminated`,
-          desc: (this._stateAttrs.moon_description || '') +
-                (this._stateAttrs.moon_magick ? '\n\nMagick: ' + this._stateAttrs.moon_magick : ''),
+          desc: (lore.description || '') +
+                (lore.magick ? '\n\nMagick: ' + lore.magick : ''),
         };
       } else if (zone.type === 'solar_cycle') {
         const sc = zone.data;
@@ -926,6 +1154,8 @@ class WheelOfTheYearCard extends HTMLElement {
     const sabbats = a.sabbats || [];
     const planets = a.planets || [];
     const sc = a.solar_cycle || {};
+    const moonLore = this._moonLore();
+    const seasonLore = this._seasonLore();
 
     // Find next sabbat
     let nextIdx = 0, minDays = Infinity;
@@ -964,7 +1194,7 @@ class WheelOfTheYearCard extends HTMLElement {
           <span class="big">${a.moon_emoji || '🌙'}</span>
           <span class="label">${a.moon_phase || ''}</span><br>
           <span class="detail">${a.moon_illumination != null ? Math.round(a.moon_illumination) + '% illuminated' : ''}</span>
-          ${a.moon_magick ? '<br><span class="detail">Magick: ' + a.moon_magick + '</span>' : ''}
+          ${moonLore.magick ? '<br><span class="detail">Magick: ' + moonLore.magick + '</span>' : ''}
         </div>
       </div>
       <div class="info-panel">
@@ -995,14 +1225,36 @@ class WheelOfTheYearCard extends HTMLElement {
       <div class="info-panel">
         <h3>❧ ${a.season || 'Season'} ${a.season_emoji || ''}</h3>
         <div class="info-value">
-          <span class="detail">${a.season_description || ''}</span>
+          <span class="detail">${seasonLore.long_description || seasonLore.description || ''}</span>
         </div>
       </div>
     `;
   }
 
+  connectedCallback() {
+    if (this._ro) this._ro.observe(this._card);
+    if (this._io) {
+      this._io.observe(this._card);
+      document.addEventListener('visibilitychange', this._onVisibility);
+      this._syncStarfield();
+    }
+    // The clock in the subtitle ticks on its own; the wheel itself only
+    // repaints when the integration pushes a change.
+    this._updateSubtitle();
+    if (!this._clock) this._clock = setInterval(() => this._updateSubtitle(), 60000);
+    this._subscribe();
+  }
+
   disconnectedCallback() {
     if (this._ro) this._ro.disconnect();
+    if (this._io) {
+      this._io.disconnect();
+      document.removeEventListener('visibilitychange', this._onVisibility);
+      this._syncStarfield();
+    }
+    clearInterval(this._clock);
+    this._clock = null;
+    this._unsubscribe();
   }
 }
 
@@ -1018,7 +1270,7 @@ window.customCards.push({
 });
 
 console.info(
-  '%c WHEEL OF THE YEAR %c v1.1.0 ',
+  '%c WHEEL OF THE YEAR %c v1.2.0 ',
   'color: #c9a84c; background: #0a0e14; font-weight: bold; padding: 2px 6px; border-radius: 4px 0 0 4px;',
   'color: #e8dcc8; background: #1a1410; padding: 2px 6px; border-radius: 0 4px 4px 0;'
 );
@@ -0,0 +1,32 @@
+"""Write a Wheel of the Year almanac from the command line.
+
+Usage::
+
+    python scripts/almanac.py 2026-01-01 2027-01-01 --step 1h > 2026.csv
+    python scripts/almanac.py 2000-01-01 2050-01-01 --step 1m --format jsonl \
+        --time-zone Australia/Sydney --hemisphere south -o almanac.jsonl
+
+The calculation modules are imported straight from the source tree without
+running the package ``__init__``, so Home Assistant is not needed.
+"""
+
+from __future__ import annotations
+
+import importlib
+import sys
+import types
+from pathlib import Path
+
+PACKAGE = "wheel_of_the_year"
+PACKAGE_DIR = Path(__file__).resolve().parent.parent / "custom_components" / PACKAGE
+
+
+def main() -> int:
+    package = types.ModuleType(PACKAGE)
+    package.__path__ = [str(PACKAGE_DIR)]
+    sys.modules[PACKAGE] = package
+    return importlib.import_module(f"{PACKAGE}.almanac").main()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
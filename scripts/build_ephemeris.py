@@ -0,0 +1,173 @@
+"""Fit the precise tier with Chebyshev segments and write ``ephemeris.bin``.
+
+For each body the generator tries segment layouts from the most compact
+and keeps the first whose fit stays within ``--tolerance`` of the
+untruncated precise series. A layout is screened on a sample of segments,
+then every segment over the span is fitted and checked between the fitting
+nodes. NumPy is required here, but not at runtime.
+
+Usage::
+
+    python scripts/build_ephemeris.py                       # 2000-2100
+    python scripts/build_ephemeris.py --start 1900 --end 2100 --tolerance 0.05
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib
+import struct
+import sys
+import types
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+
+PACKAGE = "wheel_of_the_year"
+PACKAGE_DIR = Path(__file__).resolve().parent.parent / "custom_components" / PACKAGE
+
+DAY = 86400.0
+# Candidate layouts, tried from the most compact.
+SEGMENT_DAYS = (64, 32, 16, 8, 4)
+COEFFICIENTS = tuple(range(6, 21, 2))
+# Segments sampled when screening a layout, and check points per segment.
+PROBE_SEGMENTS = 24
+CHECK_POINTS = 33
+ARCSEC = 3600.0
+
+
+def load_modules():
+    package = types.ModuleType(PACKAGE)
+    package.__path__ = [str(PACKAGE_DIR)]
+    sys.modules[PACKAGE] = package
+    return (
+        importlib.import_module(f"{PACKAGE}.chebyshev"),
+        importlib.import_module(f"{PACKAGE}.const"),
+        importlib.import_module(f"{PACKAGE}.ephemeris"),
+    )
+
+
+class Fitter:
+    """Evaluate the untruncated precise tier and fit segments to it."""
+
+    def __init__(self, ephemeris, planet) -> None:
+        self.ephemeris = ephemeris
+        self.planet = planet
+        self.theory = ephemeris.precise_theory(0.0)
+        # Clenshaw-Curtis-style nodes are fixed per coefficient count.
+        self._nodes = {}
+
+    def longitude(self, ts: np.ndarray) -> np.ndarray:
+        """Apparent longitude in degrees at UTC timestamps."""
+        eph = self.ephemeris
+        years = 1970 + ts / (365.2425 * DAY)
+        dt = np.array([eph.delta_t(y) for y in years.ravel()]).reshape(ts.shape)
+        T = eph.centuries_from_timestamp(ts + dt)
+        return eph.precise_longitude(T, self.planet, self.theory, xp=np)
+
+    def nodes(self, n: int) -> tuple[np.ndarray, np.ndarray]:
+        if n not in self._nodes:
+            j = np.arange(n)
+            angles = np.pi * (j + 0.5) / n
+            basis = np.cos(np.outer(np.arange(n), angles)) * 2 / n
+            basis[0] /= 2
+            self._nodes[n] = (np.cos(angles), basis)
+        return self._nodes[n]
+
+    def fit(self, starts: np.ndarray, seconds: float, n: int) -> np.ndarray:
+        """Coefficients (segments × n) of unwrapped longitude in degrees."""
+        x, basis = self.nodes(n)
+        ts = starts[:, None] + (x[None, :] + 1) / 2 * seconds
+        lon = np.degrees(np.unwrap(np.radians(self.longitude(ts)), axis=1))
+        return lon @ basis.T
+
+    def error(self, starts: np.ndarray, seconds: float, coeffs: np.ndarray) -> float:
+        """Worst fit error in arc-seconds over the given segments."""
+        x = np.linspace(-1, 1, CHECK_POINTS)
+        ts = starts[:, None] + (x[None, :] + 1) / 2 * seconds
+        fitted = np.polynomial.chebyshev.chebval(x, coeffs.T)
+        diff = (fitted - self.longitude(ts) + 180) % 360 - 180
+        return float(np.abs(diff).max() * ARCSEC)
+
+
+def fit_body(
+    fitter: Fitter, start: float, end: float, tolerance: float
+) -> tuple[float, np.ndarray, float]:
+    """Return segment seconds, coefficients and error of the smallest fit."""
+    layouts = sorted(
+        (int(np.ceil((end - start) / (days * DAY))) * (8 + 4 * (n - 1)), days, n)
+        for days in SEGMENT_DAYS
+        for n in COEFFICIENTS
+    )
+    for _, days, n in layouts:
+        seconds = days * DAY
+        count = int(np.ceil((end - start) / seconds))
+        sample = np.unique(np.linspace(0, count - 1, PROBE_SEGMENTS).astype(int))
+        probe = start + sample * seconds
+        if fitter.error(probe, seconds, fitter.fit(probe, seconds, n)) > tolerance:
+            continue
+        starts = start + np.arange(count) * seconds
+        coeffs = fitter.fit(starts, seconds, n)
+        error = fitter.error(starts, seconds, coeffs)
+        if error <= tolerance:
+            return seconds, coeffs, error
+    raise SystemExit(f"no layout fits {fitter.planet.name} to {tolerance}\"")
+
+
+def main(argv: list[str] | None = None) -> int:
+    chebyshev, const, ephemeris = load_modules()
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--start", type=int, default=2000, help="first year")
+    parser.add_argument("--end", type=int, default=2100, help="end year, exclusive")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.1,
+        help="fit tolerance in arc-seconds (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--output", type=Path, default=chebyshev.EPHEMERIS_PATH, help="file to write"
+    )
+    args = parser.parse_args(argv)
+
+    start = datetime(args.start, 1, 1, tzinfo=timezone.utc).timestamp()
+    end = datetime(args.end, 1, 1, tzinfo=timezone.utc).timestamp()
+
+    directory = []
+    blobs = []
+    offset = chebyshev.HEADER.size + chebyshev.BODY.size * len(const.PLANETS)
+    for planet in const.PLANETS:
+        seconds, coeffs, error = fit_body(
+            Fitter(ephemeris, planet), start, end, args.tolerance
+        )
+        count, n = coeffs.shape
+
+        record = struct.Struct(f"<d{n - 1}f")
+        blob = b"".join(record.pack(*row) for row in coeffs.tolist())
+        directory.append(
+            chebyshev.BODY.pack(planet.name.encode(), seconds, n, count, offset)
+        )
+        blobs.append(blob)
+        offset += len(blob)
+        print(
+            f"{planet.name:<8} {seconds / DAY:>3.0f}-day segments × {n:>2} "
+            f"coefficients  {len(blob) / 1024:>6.1f} KiB  max error {error:.3f}\""
+        )
+
+    header = chebyshev.HEADER.pack(
+        chebyshev.MAGIC,
+        chebyshev.VERSION,
+        len(const.PLANETS),
+        start,
+        end,
+        args.tolerance,
+    )
+    args.output.write_bytes(header + b"".join(directory) + b"".join(blobs))
+    print(f"wrote {args.output} ({offset / 1024:.0f} KiB)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())